@@ -1,23 +1,125 @@
-import pygame as pg
 import os
+import pygame as pg
 
-class Audio:
-    def __init__(self):
+SOUNDS = ("laser", "explosion", "enemy_shoot")
+
+# at most this many voices of one sound at a time
+LIMITS = {"laser": 3, "explosion": 4, "enemy_shoot": 2}
+# when every channel is busy, a sound may steal a voice of lower priority
+PRIORITY = {"explosion": 2, "laser": 1, "enemy_shoot": 0}
+CHANNELS = 8
+
+
+class PygameBackend:
+    # owns a fixed pool of mixer channels; empty pool if the mixer won't start
+    def __init__(self, channels=CHANNELS):
+        self.channels = []
         try:
             pg.mixer.init()
-        except Exception:
-            pass
-        # Load sounds from assets folder
+        except pg.error:
+            return
+        pg.mixer.set_num_channels(channels)
+        self.channels = [pg.mixer.Channel(i) for i in range(channels)]
+
+    def load(self, path):
+        if not self.channels:
+            return None
+        try:
+            return pg.mixer.Sound(path)
+        except (pg.error, FileNotFoundError):
+            return None
+
+    def length(self, sound):
+        return sound.get_length()
+
+    def play(self, channel, sound):
+        self.channels[channel].play(sound)
+
+    def stop(self, channel):
+        self.channels[channel].stop()
+
+
+class NullBackend:
+    # never touches pg.mixer; every sound "lasts" `length` seconds so the
+    # scheduler drops and steals exactly as it would with real audio
+    def __init__(self, channels=CHANNELS, length=0.3):
+        self.channels = [None] * channels
+        self.sound_length = length
+
+    def load(self, path):
+        return path
+
+    def length(self, sound):
+        return self.sound_length
+
+    def play(self, channel, sound):
+        pass
+
+    def stop(self, channel):
+        pass
+
+
+class Audio:
+    """Plays game sounds through a fixed pool of channels, once per tick.
+
+    play() only queues a request; flush(dt) starts the queued sounds at the
+    end of the tick. Repeats of a sound within one tick are coalesced into a
+    single voice, a sound never holds more than LIMITS[name] channels, and
+    when the pool is full a request steals the lowest-priority (then oldest)
+    voice if it outranks it, otherwise it is dropped. `stats` counts all of it.
+    """
+
+    def __init__(self, backend=None, limits=None, priority=None):
+        self.backend = backend if backend is not None else PygameBackend()
+        self.limits = LIMITS if limits is None else limits
+        self.priority = PRIORITY if priority is None else priority
         base = os.path.join(os.path.dirname(os.path.dirname(__file__)), "assets")
-        self.sounds = {}
-        for name in ("laser", "explosion", "enemy_shoot"):
-            path = os.path.join(base, f"{name}.wav")
-            try:
-                self.sounds[name] = pg.mixer.Sound(path)
-            except Exception:
-                self.sounds[name] = None
+        self.sounds = {name: self.backend.load(os.path.join(base, f"{name}.wav")) for name in SOUNDS}
+        self.lengths = {name: self.backend.length(s) for name, s in self.sounds.items() if s is not None}
+        # per channel: (priority, started_at, ends_at, name) or None when free
+        self.voices = [None] * len(self.backend.channels)
+        self.pending = set()
+        self.now = 0.0
+        self.stats = dict.fromkeys(("requested", "played", "coalesced", "dropped", "stolen"), 0)
 
     def play(self, name):
-        s = self.sounds.get(name)
-        if s:
-            s.play()
+        if self.sounds.get(name) is None:
+            return
+        self.stats["requested"] += 1
+        if name in self.pending:
+            self.stats["coalesced"] += 1
+        else:
+            self.pending.add(name)
+
+    def flush(self, dt):
+        self.now += dt
+        if not self.pending:
+            return
+        now, voices, stats = self.now, self.voices, self.stats
+        for i, voice in enumerate(voices):
+            if voice is not None and voice[2] <= now:
+                voices[i] = None
+        for name in sorted(self.pending, key=lambda n: -self.priority.get(n, 0)):
+            rank = self.priority.get(name, 0)
+            if sum(1 for v in voices if v is not None and v[3] == name) >= self.limits.get(name, len(voices)):
+                stats["dropped"] += 1
+                continue
+            if None in voices:
+                i = voices.index(None)
+            else:
+                i = min(range(len(voices)), key=lambda c: voices[c][:2], default=None)
+                if i is None or voices[i][0] >= rank:
+                    stats["dropped"] += 1
+                    continue
+                self.backend.stop(i)
+                stats["stolen"] += 1
+            self.backend.play(i, self.sounds[name])
+            voices[i] = (rank, now, now + self.lengths[name], name)
+            stats["played"] += 1
+        self.pending.clear()
+
+
+class NullAudio(Audio):
+    # silent stand-in for headless runs: same scheduling and stats, no mixer
+    def __init__(self, **kwargs):
+        super().__init__(NullBackend(), **kwargs)
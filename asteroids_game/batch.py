@@ -0,0 +1,85 @@
+# Runs many independent headless episodes across all cores and summarises them.
+#   python batch.py --episodes 1000 --small-spawn 0.02 --out runs.csv
+import argparse
+import csv
+import os
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import config as C
+from headless import Headless, random_script
+from systems.world import World
+
+FIELDS = ("seed", "ticks_survived", "asteroids_destroyed", "player_hits",
+          "enemies_crashed", "collisions")
+
+
+def run_episode(job):
+    # one world, one seed; the episode ends when the player has been hit
+    # `lives` times or after max_ticks
+    seed, max_ticks, lives, hz, spawn = job
+    sim = Headless(seed=seed, hz=hz)
+    world = sim.world
+    world.SMALL_SPAWN_CHANCE, world.BIG_SPAWN_CHANCE = spawn
+    script = random_script(seed)
+    while sim.tick < max_ticks and world.counters["player_hits"] < lives:
+        sim.step(script(sim.tick, world))
+    row = {"seed": seed, "ticks_survived": sim.tick}
+    row.update({k: world.counters[k] for k in FIELDS[2:]})
+    return row
+
+
+def run_batch(episodes, max_ticks=3600, lives=3, hz=C.FPS, base_seed=C.RANDOM_SEED,
+              small_spawn=None, big_spawn=None, workers=None):
+    base = base_seed if base_seed is not None else 0
+    spawn = (World.SMALL_SPAWN_CHANCE if small_spawn is None else small_spawn,
+             World.BIG_SPAWN_CHANCE if big_spawn is None else big_spawn)
+    jobs = [(base + i, max_ticks, lives, hz, spawn) for i in range(episodes)]
+    workers = workers or os.cpu_count() or 1
+    chunk = max(1, episodes // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(run_episode, jobs, chunksize=chunk))
+
+
+def summarise(rows):
+    out = {}
+    for field in FIELDS[1:]:
+        values = [r[field] for r in rows]
+        out[field] = (statistics.mean(values), statistics.median(values), max(values))
+    return out
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch-run headless Asteroids+ episodes in parallel.")
+    parser.add_argument("--episodes", type=int, default=200)
+    parser.add_argument("--max-ticks", type=int, default=3600)
+    parser.add_argument("--lives", type=int, default=3)
+    parser.add_argument("--hz", type=float, default=C.FPS)
+    parser.add_argument("--seed", type=int, default=C.RANDOM_SEED, help="seed of the first episode")
+    parser.add_argument("--small-spawn", type=float, help="per-tick small enemy spawn chance")
+    parser.add_argument("--big-spawn", type=float, help="per-tick big enemy spawn chance")
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--out", help="write one CSV row per episode")
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    rows = run_batch(args.episodes, args.max_ticks, args.lives, args.hz, args.seed,
+                     args.small_spawn, args.big_spawn, args.workers)
+    elapsed = time.perf_counter() - t0
+    ticks = sum(r["ticks_survived"] for r in rows)
+
+    print(f"{len(rows)} episodes, {ticks} ticks in {elapsed:.2f}s -> {ticks / elapsed:.0f} ticks/s")
+    print(f"{'':>20} {'mean':>9} {'median':>9} {'max':>7}")
+    for field, (mean, median, top) in summarise(rows).items():
+        print(f"{field:>20} {mean:9.1f} {median:9.1f} {top:7d}")
+
+    if args.out:
+        with open(args.out, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=FIELDS)
+            writer.writeheader()
+            writer.writerows(rows)
+
+
+if __name__ == "__main__":
+    main()
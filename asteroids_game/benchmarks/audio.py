@@ -0,0 +1,67 @@
+# Heavy-combat audio benchmark: Sound.play() on every event (as before)
+# against the Audio scheduler, on the real mixer with SDL's dummy driver.
+# Run from the asteroids_game folder:  python -m benchmarks.audio
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import random
+import time
+
+import pygame as pg
+
+import config as C
+from audio.audio import Audio, NullAudio
+from systems.world import World
+
+TICKS = 1200
+SHOTS_PER_TICK = 3
+WAVE = 40           # asteroids added every WAVE_EVERY ticks
+WAVE_EVERY = 20
+
+
+class DirectAudio(Audio):
+    # the old behaviour: every request goes straight to Sound.play()
+    def play(self, name):
+        s = self.sounds.get(name)
+        if s is not None:
+            self.stats["requested"] += 1
+            self.stats["played"] += 1
+            s.play()
+
+    def flush(self, dt):
+        pass
+
+
+def run(audio):
+    world = World(seed=0, audio=audio)
+    world.SMALL_SPAWN_CHANCE = world.BIG_SPAWN_CHANCE = 1.0
+    keys = pg.key.ScancodeWrapper([False] * 512)
+    dt = 1 / C.FPS
+    rng = random.Random(0)
+    busy = 0
+    t0 = time.perf_counter()
+    for tick in range(TICKS):
+        for _ in range(SHOTS_PER_TICK):
+            world.try_fire()
+            world.player.angle = rng.uniform(0, 360)
+        if tick % WAVE_EVERY == 0:
+            world.spawn_asteroids(WAVE)
+        world.update(dt, keys)
+        busy = max(busy, sum(ch.get_busy() for ch in audio.backend.channels if ch))
+    return (time.perf_counter() - t0) / TICKS * 1000, busy
+
+
+def main():
+    pg.mixer.init()
+    print(f"{'mode':>10} {'ms/tick':>8} {'requested':>10} {'played':>7} {'coalesced':>10} "
+          f"{'dropped':>8} {'stolen':>7} {'peak voices':>12}")
+    for label, audio in (("direct", DirectAudio()), ("scheduled", Audio()), ("null", NullAudio())):
+        ms, busy = run(audio)
+        s = audio.stats
+        print(f"{label:>10} {ms:8.3f} {s['requested']:10d} {s['played']:7d} {s['coalesced']:10d} "
+              f"{s['dropped']:8d} {s['stolen']:7d} {busy:12d}")
+
+
+if __name__ == "__main__":
+    main()
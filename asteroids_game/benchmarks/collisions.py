@@ -0,0 +1,108 @@
+# Collision scaling benchmark. The arena grows with n so every size runs
+# at the density of BASE objects on the normal screen: the number of hits
+# per object stays put and the timings show how the broad phase scales.
+# Particles are off, so hit handling doesn't drown the grid in bursts.
+# Run from the asteroids_game folder:  python -m benchmarks.collisions
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import math
+import random
+import time
+
+import config as C
+from audio.audio import NullAudio
+from systems.particles import Particles
+from systems.spatial import SpatialHash
+from systems.world import World
+
+SIZES = (100, 250, 500, 1000, 2000, 4000)
+REPEAT = 5
+BASE = 100
+SCREEN = (C.WIDTH, C.HEIGHT)
+
+
+def arena(n):
+    # a world on a screen scaled to hold n objects at the density of BASE
+    scale = math.sqrt(n / BASE)
+    C.WIDTH, C.HEIGHT = round(SCREEN[0] * scale), round(SCREEN[1] * scale)
+    world = World(audio=NullAudio(), particles=Particles(0))
+    world.grid = SpatialHash(width=C.WIDTH, height=C.HEIGHT)
+    return world
+
+
+def populate(world, n):
+    # n asteroids, n player bullets, n/10 enemy bullets and small enemies
+    for pool in (world.asteroids, world.bullets, world.enemy_bullets, world.enemies_small):
+        pool.clear()
+    for _ in range(n):
+        a = world.asteroids.acquire()
+        a.radius = random.randint(4, 10)
+    for _ in range(n):
+        world.spawn_bullet(random.uniform(0, C.WIDTH), random.uniform(0, C.HEIGHT), 0, 0, "player")
+    for _ in range(n // 10):
+        world.spawn_bullet(random.uniform(0, C.WIDTH), random.uniform(0, C.HEIGHT), 0, 0, "enemy")
+        world.enemies_small.acquire(random.uniform(0, C.WIDTH), random.uniform(0, C.HEIGHT))
+    world.enemy_big = None
+
+
+def brute_force(world):
+    # the nested loops handle_collisions used before the broad phase
+    bullets = list(world.bullets)
+    asteroids = list(world.asteroids)
+    enemies = list(world.enemies_small)
+    for b in list(bullets):
+        for a in list(asteroids):
+            if a.collides(b.x, b.y):
+                try:
+                    bullets.remove(b)
+                except ValueError:
+                    pass
+                try:
+                    asteroids.remove(a)
+                except ValueError:
+                    pass
+                break
+    for e in list(enemies):
+        for a in list(asteroids):
+            if a.collides(e.x, e.y):
+                try:
+                    enemies.remove(e)
+                except ValueError:
+                    pass
+                break
+
+
+def best_time(world, n, step):
+    # best of REPEAT runs and the mean number of collisions handled
+    best = float("inf")
+    hits = 0
+    for i in range(REPEAT):
+        random.seed(i)
+        world.rng.seed(i)
+        populate(world, n)
+        before = world.counters["collisions"]
+        t0 = time.perf_counter()
+        step(world)
+        best = min(best, time.perf_counter() - t0)
+        hits += world.counters["collisions"] - before
+    return best, hits / REPEAT
+
+
+def main():
+    print(f"{BASE} objects per {SCREEN[0]}x{SCREEN[1]} screen")
+    print(f"{'objects':>8} {'arena':>11} {'hits':>7} {'grid ms':>9} {'us/obj':>8} {'brute ms':>9}")
+    for n in SIZES:
+        world = arena(n)
+        grid, hits = best_time(world, n, World.handle_collisions)
+        # brute force is quadratic, stop measuring it once it gets slow
+        brute = best_time(world, n, brute_force)[0] if n <= 500 else None
+        brute_ms = f"{brute * 1000:9.2f}" if brute is not None else f"{'-':>9}"
+        size = f"{C.WIDTH}x{C.HEIGHT}"
+        print(f"{n:8d} {size:>11} {hits:7.1f} {grid * 1000:9.2f} {grid * 1e6 / n:8.2f} {brute_ms}")
+    C.WIDTH, C.HEIGHT = SCREEN
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+# Movement benchmark: one vectorized store step against per-object updates.
+# Run from the asteroids_game folder:  python -m benchmarks.integrate
+import random
+import time
+
+import config as C
+from systems.store import EntityStore
+
+SIZES = (100, 1000, 10000, 100000)
+STEPS = 60
+
+
+class ScalarRock:
+    # the per-object update every Asteroid and Bullet used to run
+    def __init__(self):
+        self.x = random.uniform(0, C.WIDTH)
+        self.y = random.uniform(0, C.HEIGHT)
+        self.vx = random.uniform(-80, 80)
+        self.vy = random.uniform(-80, 80)
+        self.life = 3.0
+
+    def update(self, dt):
+        self.x = (self.x + self.vx * dt) % C.WIDTH
+        self.y = (self.y + self.vy * dt) % C.HEIGHT
+        self.life -= dt
+
+
+def main():
+    dt = 1 / C.FPS
+    print(f"{'entities':>9} {'store ms/step':>14} {'objects ms/step':>16}")
+    for n in SIZES:
+        store = EntityStore(n)
+        for _ in range(n):
+            store.add(None, random.uniform(0, C.WIDTH), random.uniform(0, C.HEIGHT),
+                      random.uniform(-80, 80), random.uniform(-80, 80), 3, 3.0)
+        t0 = time.perf_counter()
+        for _ in range(STEPS):
+            store.integrate(dt)
+        vec = (time.perf_counter() - t0) / STEPS
+
+        rocks = [ScalarRock() for _ in range(n)]
+        t0 = time.perf_counter()
+        for _ in range(STEPS):
+            for r in rocks:
+                r.update(dt)
+        scalar = (time.perf_counter() - t0) / STEPS
+        print(f"{n:9d} {vec * 1000:14.3f} {scalar * 1000:16.3f}")
+
+
+if __name__ == "__main__":
+    main()
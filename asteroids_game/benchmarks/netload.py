@@ -0,0 +1,126 @@
+# Server load test: a local net.server in its own process and hundreds of
+# simulated clients (asyncio streams, random input at INPUT_HZ). Clients
+# only ack what they receive; one in DECODE_EVERY also decodes, to check
+# the deltas apply. Reports server tick times and bandwidth per client,
+# then the cost of one full snapshot (what a joining client gets) and of a
+# delta against it, for worlds of up to ROCKS rocks.
+# Run from the asteroids_game folder:  python -m benchmarks.netload
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import asyncio
+import json
+import random
+import sys
+import time
+
+from audio.audio import NullAudio
+from net.client import ClientState
+from net.snapshot import Capture, decode, encode
+from systems.particles import Particles
+from systems.controls import FIRE, HYPER, LEFT, RIGHT, UP
+from systems.world import World
+
+CLIENTS = (50, 200, 400)
+SECONDS = 10.0
+HZ = 30
+PLAYERS_PER_MATCH = 8
+INPUT_HZ = 20
+DECODE_EVERY = 50
+ROCKS = (300, 1000, 3000)
+
+
+async def client(port, index, stop, decoded):
+    rng = random.Random(index)
+    state = ClientState(decode=index % DECODE_EVERY == 0)
+    try:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    except OSError:
+        return
+    writer.write(state.hello())
+
+    async def receive():
+        while data := await reader.read(65536):
+            state.feed(data)
+
+    receiving = asyncio.create_task(receive())
+    held = 0
+    try:
+        while not stop.is_set() and not receiving.done():
+            if rng.random() < 0.2:
+                held = rng.choice((0, UP, LEFT, RIGHT, UP | LEFT, UP | RIGHT))
+            presses = FIRE if rng.random() < 0.3 else 0
+            presses |= HYPER if rng.random() < 0.005 else 0
+            writer.write(state.input(held | presses))
+            await asyncio.sleep(rng.uniform(0.5, 1.5) / INPUT_HZ)
+    except ConnectionError:
+        pass
+    finally:
+        receiving.cancel()
+        writer.close()
+    if state.decode:
+        decoded.append(state.snapshots)
+
+
+async def load(clients):
+    server = await asyncio.create_subprocess_exec(
+        sys.executable, "-m", "net.server", "--port", "0", "--hz", str(HZ),
+        "--players-per-match", str(PLAYERS_PER_MATCH), "--duration", str(SECONDS + 2),
+        "--stats-every", "0", "--json", stdout=asyncio.subprocess.PIPE)
+    line = ""
+    while not line.startswith("listening on"):    # past pygame's banner
+        line = (await server.stdout.readline()).decode()
+    port = int(line.rsplit(":", 1)[1])
+    stop = asyncio.Event()
+    decoded = []
+    tasks = [asyncio.create_task(client(port, i, stop, decoded)) for i in range(clients)]
+    await asyncio.sleep(SECONDS)
+    stop.set()
+    await asyncio.gather(*tasks)
+    out, _ = await server.communicate()
+    metrics = json.loads(out.decode().strip().splitlines()[-1])
+    metrics["decoded_snapshots"] = decoded
+    return metrics
+
+
+def timed(fn, *args):
+    t0 = time.perf_counter()
+    out = fn(*args)
+    return out, (time.perf_counter() - t0) * 1000
+
+
+def large(rocks):
+    world = World(seed=rocks, audio=NullAudio(), particles=Particles(0))
+    world.spawn_asteroids(rocks)
+    capture = Capture(world, HZ)
+    full = capture(0)
+    world.update(1 / HZ, None)
+    delta = capture(1)
+    data, encode_ms = timed(encode, full)
+    back, decode_ms = timed(decode, data)
+    assert back == full
+    diff, delta_ms = timed(encode, delta, full)
+    return len(data), encode_ms, decode_ms, len(diff), delta_ms
+
+
+def main():
+    print(f"{SECONDS:.0f}s at {HZ} Hz, {PLAYERS_PER_MATCH} players per match, input at {INPUT_HZ} Hz")
+    print(f"{'clients':>7} {'tick p50':>9} {'p95':>7} {'p99':>7} {'late':>5} "
+          f"{'B/client/s':>11} {'B/snap':>7} {'full':>6} {'encodes':>8} {'skipped':>8} {'decoded':>8}")
+    for n in CLIENTS:
+        m = asyncio.run(load(n))
+        tick = m.get("tick_ms", {"p50": 0.0, "p95": 0.0, "p99": 0.0})
+        decoded = min(m["decoded_snapshots"], default=0)
+        print(f"{m['clients_total']:7d} {tick['p50']:7.2f}ms {tick['p95']:5.2f}ms {tick['p99']:5.2f}ms "
+              f"{m['late_ticks']:5d} {m['bytes_per_client_per_s']:11.0f} {m['bytes_per_snapshot']:7.1f} "
+              f"{m['full_snapshots']:6d} {m['encodes']:8d} {m['skipped_snapshots']:8d} {decoded:8d}")
+    print(f"\nlarge snapshots (tick budget at {HZ} Hz: {1000 / HZ:.1f} ms)")
+    print(f"{'rocks':>7} {'full B':>7} {'encode':>9} {'decode':>9} {'delta B':>8} {'encode':>9}")
+    for n in ROCKS:
+        size, enc, dec, dsize, dt = large(n)
+        print(f"{n:7d} {size:7d} {enc:7.2f}ms {dec:7.2f}ms {dsize:8d} {dt:7.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
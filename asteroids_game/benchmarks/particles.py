@@ -0,0 +1,109 @@
+# Particle benchmark: the vectorized Particles step and draw against one
+# object per particle (update + Surface.fill each), at steady state with
+# bursts keeping the budget full. Reports particles per millisecond.
+# Run from the asteroids_game folder:  python -m benchmarks.particles
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import math
+import random
+import time
+
+import pygame as pg
+
+import config as C
+from systems.particles import Particles
+
+SIZES = (1000, 5000, 20000, 50000)
+FRAMES = 60
+SCALAR_LIMIT = 20000    # the per-object loop gets slow past this
+
+
+class ScalarParticle:
+    # what a particle would be as an ordinary entity
+    def __init__(self, rng):
+        ang = rng.uniform(0, 2 * math.pi)
+        s = rng.uniform(0, 140)
+        self.x = rng.uniform(0, C.WIDTH)
+        self.y = rng.uniform(0, C.HEIGHT)
+        self.vx = math.cos(ang) * s
+        self.vy = math.sin(ang) * s
+        self.life = self.span = rng.uniform(0.5, 1.0)
+
+    def update(self, dt, drag):
+        self.vx *= drag
+        self.vy *= drag
+        self.x = (self.x + self.vx * dt) % C.WIDTH
+        self.y = (self.y + self.vy * dt) % C.HEIGHT
+        self.life -= dt
+
+    def draw(self, screen):
+        v = int(255 * self.life / self.span)
+        screen.fill((v, v, v), (int(self.x), int(self.y), 2, 2))
+
+
+def vectorized(screen, n):
+    rng = random.Random(0)
+    particles = Particles(budget=n, seed=0)
+    dt = 1 / C.FPS
+    update = draw = 0.0
+    for _ in range(FRAMES):
+        # top up to the budget with bursts, as a heavy fight would
+        while particles.count < n:
+            particles.burst(rng.uniform(0, C.WIDTH), rng.uniform(0, C.HEIGHT), 200, 140, 1.0, C.WHITE)
+        t0 = time.perf_counter()
+        particles.update(dt)
+        t1 = time.perf_counter()
+        particles.draw(screen)
+        t2 = time.perf_counter()
+        update += t1 - t0
+        draw += t2 - t1
+    return update, draw, particles.stats["dropped"]
+
+
+def scalar(screen, n):
+    rng = random.Random(0)
+    dt = 1 / C.FPS
+    drag = math.exp(-Particles.DRAG * dt)
+    alive = []
+    update = draw = 0.0
+    for _ in range(FRAMES):
+        while len(alive) < n:
+            alive.append(ScalarParticle(rng))
+        t0 = time.perf_counter()
+        for p in alive:
+            p.update(dt, drag)
+        alive = [p for p in alive if p.life > 0]
+        t1 = time.perf_counter()
+        for p in alive:
+            p.draw(screen)
+        t2 = time.perf_counter()
+        update += t1 - t0
+        draw += t2 - t1
+    return update, draw
+
+
+def main():
+    pg.init()
+    screen = pg.display.set_mode((C.WIDTH, C.HEIGHT))
+    print(f"{FRAMES} frames, budget kept full; particles per ms (higher is better)")
+    print(f"{'particles':>9} {'update':>9} {'draw':>9} {'ms/frame':>9} | "
+          f"{'obj update':>10} {'obj draw':>9} {'ms/frame':>9}")
+    for n in SIZES:
+        update, draw, _ = vectorized(screen, n)
+        frames = n * FRAMES
+        line = (f"{n:9d} {frames / (update * 1000):9.0f} {frames / (draw * 1000):9.0f} "
+                f"{(update + draw) / FRAMES * 1000:9.2f} | ")
+        if n <= SCALAR_LIMIT:
+            update, draw = scalar(screen, n)
+            line += (f"{frames / (update * 1000):10.0f} {frames / (draw * 1000):9.0f} "
+                     f"{(update + draw) / FRAMES * 1000:9.2f}")
+        else:
+            line += f"{'-':>10} {'-':>9} {'-':>9}"
+        print(line)
+    pg.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+# Rapid-fire churn benchmark: pool stats and GC activity.
+# Run from the asteroids_game folder:  python -m benchmarks.pools
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import gc
+import time
+
+import pygame as pg
+
+import config as C
+from systems.world import World
+
+TICKS = 3000
+SHOTS_PER_TICK = 4
+
+
+def collections():
+    return [s["collections"] for s in gc.get_stats()]
+
+
+def main():
+    world = World(seed=0)
+    world.audio.sounds = {}
+    keys = pg.key.ScancodeWrapper([False] * 512)
+    dt = 1 / C.FPS
+
+    before = collections()
+    t0 = time.perf_counter()
+    for tick in range(TICKS):
+        for _ in range(SHOTS_PER_TICK):
+            world.try_fire()
+            world.player.angle += 7
+        if tick % 30 == 0:
+            world.spawn_asteroids(2)
+        world.update(dt, keys)
+    elapsed = time.perf_counter() - t0
+    after = collections()
+
+    print(f"{TICKS} ticks, {TICKS * SHOTS_PER_TICK} shots in {elapsed:.2f}s "
+          f"({elapsed / TICKS * 1000:.3f} ms/tick)")
+    print("gc collections per generation:", [b - a for a, b in zip(before, after)])
+    for name, stats in world.pool_stats().items():
+        print(f"{name:>14}: live {stats['live']:4d}  free {stats['free']:4d}  "
+              f"high water {stats['high_water']:4d}")
+
+
+if __name__ == "__main__":
+    main()
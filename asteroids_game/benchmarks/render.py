@@ -0,0 +1,59 @@
+# Full-screen flip against the dirty-rect renderer on the same replayed scene,
+# without and with particles (thrust, debris) on screen.
+# Run from the asteroids_game folder:  python -m benchmarks.render
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import time
+
+import pygame as pg
+
+import config as C
+from headless import Headless, random_script
+from systems.dirty import DirtyRenderer
+from systems.particles import Particles
+
+FRAMES = 1500
+
+
+def run(screen, renderer, particles):
+    sim = Headless(seed=7)
+    if particles:
+        sim.world.particles = Particles(seed=7)
+    sim.world.spawn_asteroids(20)
+    script = random_script(7)
+    elapsed = 0.0
+    for tick in range(FRAMES):
+        sim.step(script(tick, sim.world))
+        t0 = time.perf_counter()
+        if renderer:
+            renderer.begin()
+        else:
+            screen.fill(C.BLACK)
+        rects = sim.world.draw(screen, None)
+        if renderer:
+            renderer.present(rects)
+        else:
+            pg.display.flip()
+        elapsed += time.perf_counter() - t0
+    return elapsed / FRAMES
+
+
+def main():
+    pg.init()
+    screen = pg.display.set_mode((C.WIDTH, C.HEIGHT))
+    for particles in (False, True):
+        full = run(screen, None, particles)
+        renderer = DirtyRenderer(screen)
+        dirty = run(screen, renderer, particles)
+        frames = renderer.full_frames + renderer.dirty_frames
+        share = renderer.pushed_area / (frames * C.WIDTH * C.HEIGHT)
+        print("with particles" if particles else "no particles")
+        print(f"  full flip : {full * 1000:.3f} ms/frame")
+        print(f"  dirty rect: {dirty * 1000:.3f} ms/frame, {renderer.full_frames} full flips, "
+              f"{share:.1%} of the screen pushed on average")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+# Cached sprite blits against drawing every shape with pg.draw each frame.
+# Run from the asteroids_game folder:  python -m benchmarks.sprites
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import math
+import random
+import time
+
+import pygame as pg
+
+import config as C
+from audio.audio import NullAudio
+from systems.world import World
+
+SIZES = (100, 1000, 5000)
+FRAMES = 30
+
+
+def draw_primitives(world, screen):
+    # what the entity draw methods did before the sprite cache
+    p = world.player
+    pts = [(p.x + math.cos(math.radians(p.angle + d)) * r, p.y + math.sin(math.radians(p.angle + d)) * r)
+           for d, r in ((0, 15), (140, 12), (-140, 12))]
+    pg.draw.polygon(screen, C.WHITE, pts)
+    for a in world.asteroids:
+        pg.draw.circle(screen, C.WHITE, (int(a.x), int(a.y)), a.radius, 2)
+    for b in world.bullets:
+        pg.draw.circle(screen, C.WHITE, (int(b.x), int(b.y)), b.radius)
+    for e in world.enemies_small:
+        pg.draw.circle(screen, C.GREEN, (int(e.x), int(e.y)), 12)
+
+
+def timed(world, screen, draw):
+    t0 = time.perf_counter()
+    for _ in range(FRAMES):
+        screen.fill(C.BLACK)
+        world.player.angle += 7
+        draw(world, screen)
+    return (time.perf_counter() - t0) / FRAMES
+
+
+def main():
+    pg.init()
+    screen = pg.display.set_mode((C.WIDTH, C.HEIGHT))
+    print(f"{'entities':>9} {'pg.draw ms':>11} {'sprites ms':>11}")
+    for n in SIZES:
+        world = World(seed=n, audio=NullAudio())
+        world.spawn_asteroids(n)
+        for _ in range(n):
+            world.spawn_bullet(random.uniform(0, C.WIDTH), random.uniform(0, C.HEIGHT), 0, 0, "player")
+        for _ in range(n // 20):
+            world.enemies_small.acquire(random.uniform(0, C.WIDTH), random.uniform(0, C.HEIGHT))
+        prim = timed(world, screen, draw_primitives)
+        cached = timed(world, screen, lambda w, s: w.draw(s, None))
+        print(f"{2 * n + n // 20:9d} {prim * 1000:11.2f} {cached * 1000:11.2f}")
+    stats = world.sprites.stats()
+    print(f"sprite cache: {stats['entries']} surfaces, {stats['bytes'] / 1024:.0f} KiB, "
+          f"hit rate {stats['hit_rate']:.2%}")
+
+
+if __name__ == "__main__":
+    main()
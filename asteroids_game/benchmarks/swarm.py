@@ -0,0 +1,112 @@
+# Swarm benchmark: per-tick cost of steering waves of small enemies. The
+# batched Swarm (seek + separation + alignment, fire decisions included)
+# and the whole World tick, against the same flocking done row by row
+# (Swarm's small-swarm loop) and the plain per-object seek every
+# EnemySmall used to run. No asteroids, so nobody crashes.
+# Run from the asteroids_game folder:  python -m benchmarks.swarm
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import math
+import random
+import time
+
+import pygame as pg
+
+import config as C
+from audio.audio import NullAudio
+from entities.enemy_small import EnemySmall
+from systems.particles import Particles
+from systems.profiler import Profiler
+from systems.world import World
+
+SIZES = (10, 100, 1000)
+TICKS = 300
+LOOP_TICKS = 10     # the row-by-row flocking is O(n^2)
+
+
+class ScalarSeeker:
+    # the per-object update EnemySmall used to run (bullets only counted)
+    def __init__(self, rng):
+        self.x = rng.uniform(0, C.WIDTH)
+        self.y = rng.uniform(0, C.HEIGHT)
+        self.vx = self.vy = 0.0
+        self.timer = rng.uniform(0, EnemySmall.SHOOT_INTERVAL)
+
+    def update(self, dt, player):
+        dx = player.x - self.x
+        dy = player.y - self.y
+        dist = math.hypot(dx, dy) + 1e-6
+        self.vx = dx / dist * EnemySmall.SPEED
+        self.vy = dy / dist * EnemySmall.SPEED
+        self.x = (self.x + self.vx * dt) % C.WIDTH
+        self.y = (self.y + self.vy * dt) % C.HEIGHT
+        self.timer += dt
+        if self.timer >= EnemySmall.SHOOT_INTERVAL:
+            self.timer = 0
+            ang = math.atan2(dy, dx)
+            return math.cos(ang) * 250, math.sin(ang) * 250
+        return None
+
+
+def swarm_world(n):
+    world = World(seed=n, audio=NullAudio(), profiler=Profiler(enabled=True, window=TICKS),
+                  particles=Particles(0))
+    world.SMALL_SPAWN_CHANCE = world.BIG_SPAWN_CHANCE = 0.0
+    world.asteroids.clear()
+    rng = random.Random(n)
+    for _ in range(n):
+        e = world.enemies_small.acquire(rng.uniform(0, C.WIDTH), rng.uniform(0, C.HEIGHT))
+        e.timer = rng.uniform(0, EnemySmall.SHOOT_INTERVAL)
+    return world
+
+
+def batched(n):
+    world = swarm_world(n)
+    keys = pg.key.ScancodeWrapper([False] * 512)
+    dt = 1 / C.FPS
+    t0 = time.perf_counter()
+    for _ in range(TICKS):
+        world.update(dt, keys)
+    tick = (time.perf_counter() - t0) / TICKS
+    enemies = next(row for row in world.profiler.summary() if row[0] == "enemies")
+    return enemies[2], enemies[4], tick * 1000, len(world.enemies_small)
+
+
+def scalar(n):
+    rng = random.Random(n)
+    seekers = [ScalarSeeker(rng) for _ in range(n)]
+    player = World(seed=n, audio=NullAudio(), particles=Particles(0)).player
+    dt = 1 / C.FPS
+    t0 = time.perf_counter()
+    for _ in range(TICKS):
+        for s in seekers:
+            s.update(dt, player)
+    return (time.perf_counter() - t0) / TICKS * 1000
+
+
+def looped(n):
+    world = swarm_world(n)
+    steering = world.steering
+    steering.SCALAR = n
+    p = world.player
+    dt = 1 / C.FPS
+    t0 = time.perf_counter()
+    for _ in range(LOOP_TICKS):
+        steering.step(world.swarm, [p.x], [p.y], dt)
+    return (time.perf_counter() - t0) / LOOP_TICKS * 1000
+
+
+def main():
+    print(f"{TICKS} ticks per size; ms per tick")
+    print(f"{'enemies':>7} {'swarm mean':>11} {'p95':>7} {'world tick':>11} | "
+          f"{'looped flock':>12} {'per-object seek':>15}")
+    for n in SIZES:
+        mean, p95, tick, alive = batched(n)
+        assert alive == n
+        print(f"{n:7d} {mean:11.3f} {p95:7.3f} {tick:11.3f} | {looped(n):12.3f} {scalar(n):15.3f}")
+
+
+if __name__ == "__main__":
+    main()
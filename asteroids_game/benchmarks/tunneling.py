@@ -0,0 +1,98 @@
+# Tick-rate independence of collisions: the same shooting gallery (rocks,
+# a volley of bullets, enemies homing on a still player) simulated at
+# several rates with end-of-tick point tests and with swept tests. A 240 Hz
+# swept run is the reference; swept results at 20-30 Hz should match it,
+# point results lose the hits that fall between ticks. Then a shot fired
+# straight away from a still player BEHIND px behind the shooter, which must
+# never count as a hit, however low the rate.
+# Run from the asteroids_game folder:  python -m benchmarks.tunneling
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import math
+import random
+import time
+
+import pygame as pg
+
+import config as C
+from audio.audio import NullAudio
+from entities.enemy_big import EnemyBig
+from systems.world import World
+
+RATES = (60, 30, 20)
+REFERENCE_HZ = 240
+SECONDS = 3.0
+SEEDS = range(40)
+ROCKS = 30
+BULLETS = 30
+ENEMIES = 8
+BEHIND = 30
+
+
+def gallery(seed, hz, swept):
+    world = World(seed=seed, audio=NullAudio())
+    world.SWEPT = swept
+    world.SMALL_SPAWN_CHANCE = world.BIG_SPAWN_CHANCE = 0.0
+    rng = random.Random(seed)
+    world.spawn_asteroids(ROCKS - len(world.asteroids))
+    for _ in range(BULLETS):
+        ang = rng.uniform(0, 2 * math.pi)
+        world.spawn_bullet(rng.uniform(0, C.WIDTH), rng.uniform(0, C.HEIGHT),
+                           math.cos(ang) * 350, math.sin(ang) * 350, "player")
+    for _ in range(ENEMIES):
+        e = world.enemies_small.acquire(rng.uniform(0, C.WIDTH), rng.uniform(0, C.HEIGHT))
+        e.timer = -1e9  # never shoots, so only the rocks can hit it
+    keys = pg.key.ScancodeWrapper([False] * 512)
+    dt = 1 / hz
+    ticks = round(SECONDS * hz)
+    t0 = time.perf_counter()
+    for _ in range(ticks):
+        world.update(dt, keys)
+    elapsed = time.perf_counter() - t0
+    return world.counters["asteroids_destroyed"], world.counters["enemies_crashed"], elapsed
+
+
+def behind(hz):
+    # EnemyBig fires this tick, at its speed, with the player behind it
+    world = World(seed=0, audio=NullAudio())
+    world.SMALL_SPAWN_CHANCE = world.BIG_SPAWN_CHANCE = 0.0
+    world.asteroids.clear()
+    world.enemies_small.clear()
+    p = world.player
+    p.x, p.y, p.vx, p.vy = C.WIDTH / 2 - BEHIND, C.HEIGHT / 2, 0.0, 0.0
+    big = world.enemy_big = EnemyBig(side="left")
+    big.x, big.y, big.timer = C.WIDTH / 2 - big.SPEED / hz, C.HEIGHT / 2, big.SHOOT_INTERVAL
+    world.update(1 / hz, pg.key.ScancodeWrapper([False] * 512))
+    assert big.timer == 0  # it did fire
+    return world.counters["player_hits"]
+
+
+def run(hz, swept):
+    destroyed = crashed = elapsed = 0
+    for seed in SEEDS:
+        d, c, e = gallery(seed, hz, swept)
+        destroyed += d
+        crashed += c
+        elapsed += e
+    return destroyed, crashed, elapsed / (len(SEEDS) * SECONDS) * 1000
+
+
+def main():
+    ref_destroyed, ref_crashed, ref_ms = run(REFERENCE_HZ, True)
+    print(f"{len(SEEDS)} galleries of {SECONDS:.0f}s: {ROCKS} rocks, {BULLETS} bullets, {ENEMIES} enemies")
+    print(f"{'hz':>4} {'mode':>6} {'rocks hit':>10} {'vs ref':>7} {'enemies':>8} {'vs ref':>7} {'ms/sim s':>9}")
+    print(f"{REFERENCE_HZ:4d} {'swept':>6} {ref_destroyed:10d} {'100%':>7} {ref_crashed:8d} {'100%':>7} {ref_ms:9.2f}")
+    for hz in RATES:
+        for swept in (False, True):
+            destroyed, crashed, ms = run(hz, swept)
+            print(f"{hz:4d} {'swept' if swept else 'point':>6} {destroyed:10d} "
+                  f"{destroyed / ref_destroyed:7.0%} {crashed:8d} {crashed / max(1, ref_crashed):7.0%} {ms:9.2f}")
+    hits = {hz: behind(hz) for hz in (REFERENCE_HZ,) + RATES}
+    print(f"shot fired away from a player {BEHIND}px behind, hits: "
+          + ", ".join(f"{n} at {hz} Hz" for hz, n in hits.items()))
+
+
+if __name__ == "__main__":
+    main()
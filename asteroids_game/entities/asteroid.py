@@ -1,23 +1,39 @@
 import random
-import pygame as pg
 import config as C
-import math
+from systems.sprites import circle_surface
+from systems.store import column
 
 class Asteroid:
-    def __init__(self):
-        self.x = random.randint(0, C.WIDTH)
-        self.y = random.randint(0, C.HEIGHT)
-        self.vx = random.uniform(-80, 80)
-        self.vy = random.uniform(-80, 80)
-        self.radius = random.randint(20, 40)
-        self.alive = True
+    # thin view over one row of the world's asteroid store
+    x = column("x")
+    y = column("y")
+    vx = column("vx")
+    vy = column("vy")
+    radius = column("radius", int)
 
-    def update(self, dt):
-        self.x = (self.x + self.vx * dt) % C.WIDTH
-        self.y = (self.y + self.vy * dt) % C.HEIGHT
+    def __init__(self, store, rng=random):
+        self.store = store
+        self.rng = rng
+        self.slot = -1
+        self.alive = False
 
-    def draw(self, screen):
-        pg.draw.circle(screen, C.WHITE, (int(self.x), int(self.y)), self.radius, 2)
+    def spawn(self):
+        rng = self.rng
+        self.slot = self.store.add(self,
+                                   rng.randint(0, C.WIDTH),
+                                   rng.randint(0, C.HEIGHT),
+                                   rng.uniform(-80, 80),
+                                   rng.uniform(-80, 80),
+                                   rng.randint(20, 40))
+
+    def despawn(self):
+        self.store.remove(self.slot)
+        self.slot = -1
+
+    @staticmethod
+    def surface(sprites, radius):
+        # World.draw blits asteroids in one batch straight from the store
+        return sprites.get(("asteroid", radius), lambda: circle_surface(C.WHITE, radius, 2))
 
     def collides(self, x, y):
         return (self.x - x)**2 + (self.y - y)**2 < (self.radius)**2
@@ -1,23 +1,34 @@
-import pygame as pg
 import config as C
+from systems.sprites import circle_surface
+from systems.store import OWNERS, column
 
 class Bullet:
-    def __init__(self, x, y, vx, vy, owner):
-        self.x = x
-        self.y = y
-        self.vx = vx
-        self.vy = vy
-        self.owner = owner
-        self.radius = 3
-        self.life = 3.0
+    # thin view over one row of the world's bullet store
+    x = column("x")
+    y = column("y")
+    vx = column("vx")
+    vy = column("vy")
+    radius = column("radius", int)
+    life = column("life")
 
-    def update(self, dt):
-        self.x = (self.x + self.vx * dt)
-        self.y = (self.y + self.vy * dt)
-        self.x %= C.WIDTH
-        self.y %= C.HEIGHT
-        self.life -= dt
+    def __init__(self, store):
+        self.store = store
+        self.slot = -1
+        self.alive = False
 
-    def draw(self, screen):
-        color = C.WHITE if self.owner == "player" else C.RED
-        pg.draw.circle(screen, color, (int(self.x), int(self.y)), self.radius)
+    def spawn(self, x, y, vx, vy, owner):
+        self.slot = self.store.add(self, x, y, vx, vy, 3, 3.0, owner)
+
+    def despawn(self):
+        self.store.remove(self.slot)
+        self.slot = -1
+
+    @property
+    def owner(self):
+        return OWNERS[self.store.owner[self.slot]]
+
+    @staticmethod
+    def surface(sprites, owner, radius):
+        # World.draw blits bullets in one batch straight from the store
+        color = C.WHITE if owner == "player" else C.RED
+        return sprites.get(("bullet", color, radius), lambda: circle_surface(color, radius))
@@ -1,23 +1,23 @@
-import pygame as pg
 import random
 import config as C
-from entities.bullet import Bullet
+from systems.sprites import rect_surface
 
 class EnemyBig:
     SPEED = 140
     SHOOT_INTERVAL = 1.0
+    vy = 0.0  # only ever moves horizontally
 
-    def __init__(self, side=None):
+    def __init__(self, side=None, rng=random):
         # spawn just outside a random horizontal edge; travel horizontally across the screen
         if side is None:
-            side = random.choice(["left","right"])
+            side = rng.choice(["left","right"])
         if side == "left":
             self.x = -60
             self.vx = self.SPEED
         else:
             self.x = C.WIDTH + 60
             self.vx = -self.SPEED
-        self.y = random.randint(50, C.HEIGHT - 50)
+        self.y = rng.randint(50, C.HEIGHT - 50)
         self.timer = 0
         self.alive = True
 
@@ -34,8 +34,12 @@ class EnemyBig:
             self.timer = 0
             # shoot roughly outward (opposite side of screen): if coming from left, shoot right (positive vx)
             bullet_vx = 350 if self.vx>0 else -350
-            world.enemy_bullets.append(Bullet(self.x, self.y, bullet_vx, 0, "enemy"))
+            world.spawn_bullet(self.x, self.y, bullet_vx, 0, "enemy")
             world.audio.play("enemy_shoot")
 
-    def draw(self, screen):
-        pg.draw.rect(screen, C.YELLOW, (int(self.x)-24, int(self.y)-12, 48, 24), 0)
+    def sprite(self, sprites):
+        return self.surface(sprites), (int(self.x) - 24, int(self.y) - 12)
+
+    @staticmethod
+    def surface(sprites):
+        return sprites.get("enemy_big", lambda: rect_surface(C.YELLOW, 48, 24))
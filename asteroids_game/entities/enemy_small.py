@@ -1,39 +1,35 @@
-import pygame as pg
-import math
-import random
 import config as C
-from entities.bullet import Bullet
+from systems.sprites import circle_surface
+from systems.store import column
 
 class EnemySmall:
+    # thin view over one row of the world's swarm store; World steers
+    # every row at once (see systems.swarm)
     SPEED = 120
     SHOOT_INTERVAL = 2.0
+    BULLET_SPEED = 250
+    RADIUS = 12
+    x = column("x")
+    y = column("y")
+    vx = column("vx")
+    vy = column("vy")
+    timer = column("life")  # seconds since the last shot
 
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-        self.timer = 0
-        self.alive = True
+    def __init__(self, store):
+        self.store = store
+        self.slot = -1
+        self.alive = False
 
-    def update(self, dt, player, world):
-        # move towards player
-        dx = player.x - self.x
-        dy = player.y - self.y
-        dist = math.hypot(dx, dy) + 1e-6
-        nx = dx / dist
-        ny = dy / dist
-        self.x = (self.x + nx * self.SPEED * dt)
-        self.y = (self.y + ny * self.SPEED * dt)
-        self.x %= C.WIDTH
-        self.y %= C.HEIGHT
+    def spawn(self, x, y):
+        self.slot = self.store.add(self, x, y, 0.0, 0.0, self.RADIUS, 0.0)
 
-        self.timer += dt
-        if self.timer >= self.SHOOT_INTERVAL:
-            self.timer = 0
-            ang = math.atan2(dy, dx)
-            vx = math.cos(ang) * 250
-            vy = math.sin(ang) * 250
-            world.enemy_bullets.append(Bullet(self.x, self.y, vx, vy, "enemy"))
-            world.audio.play("enemy_shoot")
+    def despawn(self):
+        self.store.remove(self.slot)
+        self.slot = -1
 
-    def draw(self, screen):
-        pg.draw.circle(screen, C.GREEN, (int(self.x), int(self.y)), 12)
+    def sprite(self, sprites):
+        return self.surface(sprites), (int(self.x) - 13, int(self.y) - 13)
+
+    @staticmethod
+    def surface(sprites):
+        return sprites.get("enemy_small", lambda: circle_surface(C.GREEN, 12))
@@ -2,21 +2,30 @@ import pygame as pg
 import math
 import random
 import config as C
+from systems.controls import Keys
+from systems.sprites import blank
 
 class Player:
     SPEED = 200
     ROT = 180  # degrees per second
+    ROT_BUCKETS = 128
 
-    def __init__(self):
+    def __init__(self, rng=random):
+        self.rng = rng
         self.x = C.WIDTH // 2
         self.y = C.HEIGHT // 2
         self.angle = 0  # degrees
         self.dirx = 1
         self.diry = 0
+        # velocity over the last update, for swept collision tests
+        self.vx = 0.0
+        self.vy = 0.0
+        # held controls when driven by World.step_players (remote ships)
+        self.keys = Keys(0)
 
     def random_position(self):
-        self.x = random.randint(0, C.WIDTH)
-        self.y = random.randint(0, C.HEIGHT)
+        self.x = self.rng.randint(0, C.WIDTH)
+        self.y = self.rng.randint(0, C.HEIGHT)
 
     def update(self, dt, keys):
         if keys[pg.K_LEFT]:
@@ -29,18 +38,33 @@ class Player:
         self.diry = math.sin(rad)
 
         if keys[pg.K_UP]:
-            self.x += self.dirx * self.SPEED * dt
-            self.y += self.diry * self.SPEED * dt
+            self.vx = self.dirx * self.SPEED
+            self.vy = self.diry * self.SPEED
+            self.x += self.vx * dt
+            self.y += self.vy * dt
+        else:
+            self.vx = self.vy = 0.0
 
         self.x %= C.WIDTH
         self.y %= C.HEIGHT
 
-    def draw(self, screen):
-        import math
-        p1 = (self.x + math.cos(math.radians(self.angle)) * 15,
-              self.y + math.sin(math.radians(self.angle)) * 15)
-        p2 = (self.x + math.cos(math.radians(self.angle+140)) * 12,
-              self.y + math.sin(math.radians(self.angle+140)) * 12)
-        p3 = (self.x + math.cos(math.radians(self.angle-140)) * 12,
-              self.y + math.sin(math.radians(self.angle-140)) * 12)
-        pg.draw.polygon(screen, C.WHITE, [p1, p2, p3])
+    def sprite(self, sprites):
+        return self.surface(sprites, self.angle), (int(self.x) - 16, int(self.y) - 16)
+
+    @classmethod
+    def surface(cls, sprites, angle):
+        # the ship is pre-rendered once per rotation bucket
+        bucket = round(angle * cls.ROT_BUCKETS / 360) % cls.ROT_BUCKETS
+        return sprites.get(("ship", bucket), lambda: cls.render(bucket * 360 / cls.ROT_BUCKETS))
+
+    @staticmethod
+    def render(angle):
+        surf = blank(32, 32)
+        p1 = (16 + math.cos(math.radians(angle)) * 15,
+              16 + math.sin(math.radians(angle)) * 15)
+        p2 = (16 + math.cos(math.radians(angle+140)) * 12,
+              16 + math.sin(math.radians(angle+140)) * 12)
+        p3 = (16 + math.cos(math.radians(angle-140)) * 12,
+              16 + math.sin(math.radians(angle-140)) * 12)
+        pg.draw.polygon(surf, C.WHITE, [p1, p2, p3])
+        return surf
@@ -1,11 +1,17 @@
-import random
+import argparse
 import sys
 from dataclasses import dataclass
 import pygame as pg
 
 import config as C
+from systems.controls import FIRE, HYPER, held_mask
+from net.client import Connection, draw as draw_remote
+from systems.dirty import DirtyRenderer
+from systems.profiler import Profiler
+from systems.replay import Recorder, Replay, new_seed
+from systems.sprites import SpriteCache
 from systems.world import World
-from utils import text
+from utils import GlyphAtlas, text
 
 
 @dataclass
@@ -14,50 +20,131 @@ class Scene:
 
 
 class Game:
-    def __init__(self):
+    def __init__(self, record=None, replay=None, fast=False, profile=False, trace=None, dirty=False,
+                 connect=None):
         pg.init()
-        if C.RANDOM_SEED is not None:
-            random.seed(C.RANDOM_SEED)
         self.screen = pg.display.set_mode((C.WIDTH, C.HEIGHT))
         pg.display.set_caption("Asteroides+")
         self.clock = pg.time.Clock()
         self.font = pg.font.SysFont("consolas", 20)
         self.big = pg.font.SysFont("consolas", 48)
+        self.small = pg.font.SysFont("consolas", 14)
+        self.hud = GlyphAtlas(self.font, C.WHITE)
+        self.renderer = DirtyRenderer(self.screen) if dirty else None
         self.scene = Scene("menu")
-        self.world = World()
+        self.fast = fast
+        self.recorder = None
+        self.replay = None
+        seed = C.RANDOM_SEED
+        if replay:
+            # replays skip the menu and run on the recorded seed and input
+            recording = Replay.load(replay)
+            self.replay = recording.frames()
+            seed = recording.seed
+            self.scene = Scene("play")
+        elif record:
+            if seed is None:
+                seed = new_seed()
+            self.recorder = Recorder(record, seed)
+        # F3 toggles the profiler and its overlay
+        self.profiler = Profiler(enabled=profile, trace=trace is not None)
+        self.trace = trace
+        # thin client: the server owns the world, we send input and draw
+        # its snapshots (no local simulation, no dirty rects)
+        self.remote = None
+        if connect:
+            host, _, port = connect.rpartition(":")
+            self.remote = Connection(host or "127.0.0.1", int(port))
+            self.sprites = SpriteCache()
+            self.renderer = None
+            self.world = None
+        else:
+            self.world = World(seed=seed, profiler=self.profiler)
+
+    def quit(self):
+        if self.remote:
+            self.remote.close()
+        if self.recorder:
+            self.recorder.close()
+        if self.trace:
+            self.profiler.export(self.trace)
+        pg.quit()
+        sys.exit()
 
     def run(self):
+        prof = self.profiler
         while True:
-            dt = self.clock.tick(C.FPS) / 1000.0
-            for e in pg.event.get():
-                if e.type == pg.QUIT:
-                    pg.quit()
-                    sys.exit()
+            ms = self.clock.tick(0 if self.fast else C.FPS)
+            dt = ms / 1000.0
+            controls = 0
+            with prof.section("input"):
+                for e in pg.event.get():
+                    if e.type == pg.QUIT:
+                        self.quit()
+
+                    if e.type == pg.KEYDOWN and e.key == pg.K_ESCAPE:
+                        self.quit()
 
-                if e.type == pg.KEYDOWN and e.key == pg.K_ESCAPE:
-                    pg.quit()
-                    sys.exit()
+                    prof.handle_event(e)
 
-                if self.scene.name == "play":
-                    if e.type == pg.KEYDOWN and e.key == pg.K_SPACE:
-                        self.world.try_fire()
-                    if e.type == pg.KEYDOWN and e.key == pg.K_LSHIFT:
-                        self.world.hyperspace()
+                    if self.scene.name == "play":
+                        if e.type == pg.KEYDOWN and e.key == pg.K_SPACE:
+                            controls |= FIRE
+                        if e.type == pg.KEYDOWN and e.key == pg.K_LSHIFT:
+                            controls |= HYPER
 
-                elif self.scene.name == "menu":
-                    if e.type == pg.KEYDOWN:
-                        self.scene = Scene("play")
+                    elif self.scene.name == "menu":
+                        if e.type == pg.KEYDOWN:
+                            self.scene = Scene("play")
+                            if self.renderer:
+                                self.renderer.invalidate()
 
-            keys = pg.key.get_pressed()
-            self.screen.fill(C.BLACK)
+            if self.renderer:
+                self.renderer.begin()
+            else:
+                self.screen.fill(C.BLACK)
 
+            rects = {}
             if self.scene.name == "menu":
                 self.draw_menu()
+            elif self.remote:
+                controls |= held_mask(pg.key.get_pressed())
+                with prof.section("net"):
+                    self.remote.send(controls)
+                    if not self.remote.poll():
+                        self.quit()
+                with prof.section("draw"):
+                    draw_remote(self.screen, self.sprites, self.remote.state)
+                    self.draw_hud()
             else:
-                self.world.update(dt, keys)
-                self.world.draw(self.screen, self.font)
+                if self.replay:
+                    frame = next(self.replay, None)
+                    if frame is None:
+                        self.quit()
+                    controls, dt = frame
+                else:
+                    controls |= held_mask(pg.key.get_pressed())
+                    if self.recorder:
+                        self.recorder.record(controls, ms)
+                with prof.section("update"):
+                    self.world.step(dt, controls)
+                with prof.section("draw"):
+                    rects = self.world.draw(self.screen, self.font)
+                    rects["hud"] = self.draw_hud()
 
-            pg.display.flip()
+            rects["profiler"] = prof.draw(self.screen, self.small)
+            with prof.section("flip"):
+                if self.renderer:
+                    self.renderer.present(rects)
+                else:
+                    pg.display.flip()
+
+    def draw_hud(self):
+        if self.remote:
+            score = self.remote.state.snapshot["score"]
+        else:
+            score = self.world.counters["asteroids_destroyed"]
+        return self.hud.draw(self.screen, f"SCORE {score:05d}", C.WIDTH - 170, 8)
 
     def draw_menu(self):
         text(self.screen, self.big, "ASTEROIDS+", C.WIDTH//2 - 160, 180)
@@ -66,4 +153,17 @@ class Game:
 
 
 if __name__ == "__main__":
-    Game().run()
+    parser = argparse.ArgumentParser(description="Asteroids+")
+    parser.add_argument("--record", metavar="FILE", help="record seed and input to FILE")
+    parser.add_argument("--replay", metavar="FILE", help="play back a recording")
+    parser.add_argument("--fast", action="store_true", help="do not cap the frame rate")
+    parser.add_argument("--dirty", action="store_true", help="redraw and push only the rects that changed")
+    parser.add_argument("--profile", action="store_true", help="start with the profiler overlay on (F3)")
+    parser.add_argument("--trace", metavar="FILE",
+                        help="on exit write timings to FILE (.json: Chrome trace, otherwise CSV)")
+    parser.add_argument("--connect", metavar="HOST:PORT", help="play on a server (python -m net.server)")
+    args = parser.parse_args()
+    Game(record=args.record, replay=args.replay, fast=args.fast,
+         profile=args.profile or args.trace is not None, trace=args.trace, dirty=args.dirty,
+         connect=args.connect).run()
+
@@ -0,0 +1,124 @@
+# Headless fixed-timestep runner: no window, no sound, as fast as the CPU goes.
+#   python headless.py --ticks 20000 --seed 1 --script random --record run.rep
+#   python headless.py --replay run.rep
+import argparse
+import random
+import time
+
+import config as C
+from audio.audio import NullAudio
+from systems.controls import FIRE, HYPER, LEFT, RIGHT, UP
+from systems.particles import Particles
+from systems.profiler import Profiler
+from systems.replay import Recorder, Replay, new_seed
+from systems.world import World
+
+
+class Headless:
+    def __init__(self, seed=C.RANDOM_SEED, hz=C.FPS, record=None, profiler=None):
+        self.recorder = None
+        if record:
+            seed = seed if seed is not None else new_seed()
+            self.recorder = Recorder(record, seed, hz)
+        self.world = World(seed=seed, audio=NullAudio(), profiler=profiler, particles=Particles(0))
+        self.dt = 1.0 / hz
+        self.tick = 0
+        self.sim_time = 0.0
+
+    def step(self, controls=0, dt=None):
+        dt = self.dt if dt is None else dt
+        if self.recorder:
+            self.recorder.record(controls)
+        self.world.step(dt, controls)
+        self.tick += 1
+        self.sim_time += dt
+
+    def run(self, ticks, script=None):
+        # script(tick, world) -> controls bitmask; None means no input
+        t0 = time.perf_counter()
+        for _ in range(ticks):
+            self.step(script(self.tick, self.world) if script else 0)
+        return self._stats(ticks, time.perf_counter() - t0)
+
+    def play(self, replay):
+        # feed a recording back at max speed, with its own dt per tick
+        t0 = time.perf_counter()
+        ticks = 0
+        for controls, dt in replay.frames():
+            self.step(controls, dt)
+            ticks += 1
+        return self._stats(ticks, time.perf_counter() - t0)
+
+    def close(self):
+        if self.recorder:
+            self.recorder.close()
+
+    def _stats(self, ticks, elapsed):
+        return {
+            "ticks": ticks,
+            "seconds": elapsed,
+            "ticks_per_second": ticks / elapsed if elapsed > 0 else float("inf"),
+            "sim_seconds": self.sim_time,
+        }
+
+
+def random_script(seed=None, hold=15):
+    # mashes buttons: new held keys every `hold` ticks, frequent shots
+    rng = random.Random(seed)
+    state = {"held": 0}
+
+    def script(tick, world):
+        if tick % hold == 0:
+            state["held"] = rng.choice((0, LEFT, RIGHT, UP, UP | LEFT, UP | RIGHT))
+        controls = state["held"]
+        if rng.random() < 0.2:
+            controls |= FIRE
+        if rng.random() < 0.002:
+            controls |= HYPER
+        return controls
+
+    return script
+
+
+SCRIPTS = {
+    "idle": lambda seed: None,
+    "random": random_script,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the Asteroids+ simulation without a display.")
+    parser.add_argument("--ticks", type=int, default=10000)
+    parser.add_argument("--hz", type=float, default=C.FPS, help="fixed simulation rate")
+    parser.add_argument("--seed", type=int, default=C.RANDOM_SEED)
+    parser.add_argument("--script", choices=sorted(SCRIPTS), default="random")
+    parser.add_argument("--record", metavar="FILE", help="record seed and input to FILE")
+    parser.add_argument("--replay", metavar="FILE", help="play back a recording instead of a script")
+    parser.add_argument("--profile", action="store_true", help="time each update stage")
+    parser.add_argument("--trace", metavar="FILE",
+                        help="write timings to FILE (.json: Chrome trace, otherwise CSV)")
+    args = parser.parse_args()
+
+    profiler = Profiler(enabled=args.profile or args.trace is not None, trace=args.trace is not None)
+    if args.replay:
+        replay = Replay.load(args.replay)
+        sim = Headless(seed=replay.seed, hz=replay.hz or C.FPS, profiler=profiler)
+        stats = sim.play(replay)
+    else:
+        sim = Headless(seed=args.seed, hz=args.hz, record=args.record, profiler=profiler)
+        stats = sim.run(args.ticks, SCRIPTS[args.script](args.seed))
+        sim.close()
+    print(f"{stats['ticks']} ticks ({stats['sim_seconds']:.1f}s simulated) in {stats['seconds']:.2f}s "
+          f"-> {stats['ticks_per_second']:.0f} ticks/s")
+    print("counters:", sim.world.counters)
+    print("audio:", sim.world.audio.stats)
+    if profiler.enabled:
+        print(f"{'section':<14}{'mean':>8}{'p50':>8}{'p95':>8}{'p99':>8}  ms (last {profiler.window} ticks)")
+        for name, _, mean, p50, p95, p99 in profiler.summary():
+            print(f"{name:<14}{mean:8.3f}{p50:8.3f}{p95:8.3f}{p99:8.3f}")
+    if args.trace:
+        profiler.export(args.trace)
+
+
+if __name__ == "__main__":
+    main()
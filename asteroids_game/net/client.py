@@ -0,0 +1,143 @@
+# Client side of net.protocol: a sans-IO state machine shared by the thin
+# client in game.py (non-blocking socket, polled once per frame) and the
+# load test (asyncio streams), plus drawing a decoded snapshot.
+import socket
+
+import config as C
+from entities.asteroid import Asteroid
+from entities.bullet import Bullet
+from entities.enemy_big import EnemyBig
+from entities.enemy_small import EnemySmall
+from entities.player import Player
+from net import protocol as P
+from net.snapshot import EMPTY, angle, decode, positions
+
+KEEP = 32   # decoded snapshots kept as possible delta bases
+
+
+class ClientState:
+    """Frames in, decoded snapshots and input frames out.
+
+    With decode=False snapshots are only acknowledged, never decoded: the
+    load test uses that to simulate many clients cheaply.
+    """
+
+    def __init__(self, decode=True):
+        self.reader = P.FrameReader()
+        self.decode = decode
+        self.player = None
+        self.match = None
+        self.hz = None
+        self.seq = 0
+        self.snapshot = EMPTY
+        self.history = {}
+        self.bytes_received = 0
+        self.snapshots = 0
+
+    def hello(self):
+        return P.frame(P.HELLO)
+
+    def input(self, controls):
+        # also acknowledges the newest snapshot we hold
+        return P.frame(P.INPUT, P.INPUT_BODY.pack(controls, self.seq))
+
+    def feed(self, data):
+        self.bytes_received += len(data)
+        for kind, payload in self.reader.feed(data):
+            if kind == P.WELCOME:
+                self.player, self.match, self.hz = P.WELCOME_BODY.unpack(payload)
+            elif kind == P.SNAPSHOT:
+                self._snapshot(payload)
+
+    def _snapshot(self, payload):
+        seq, base = P.SNAPSHOT_HEAD.unpack_from(payload)
+        if seq <= self.seq:
+            return
+        if self.decode:
+            base_snap = self.history.get(base) if base else EMPTY
+            if base_snap is None:
+                return
+            self.snapshot = decode(payload[P.SNAPSHOT_HEAD.size:], base_snap)
+            # the server skips seqs for clients that fall behind, so drop
+            # everything too old rather than just the one KEEP back
+            history = {s: snap for s, snap in self.history.items() if s > seq - KEEP}
+            history[seq] = self.snapshot
+            self.history = history
+        self.seq = seq
+        self.snapshots += 1
+
+    def positions(self):
+        return positions(self.snapshot, self.seq, self.hz or C.FPS)
+
+
+class Connection:
+    """Blocking-free TCP connection for a frame loop that polls it.
+
+    Input frames go through an outgoing buffer: a non-blocking send may
+    take only part of it, and the rest goes out on later calls, so the
+    server never sees a frame cut short.
+    """
+
+    MAX_PENDING = 4096  # stop queueing input while the server isn't reading
+
+    def __init__(self, host, port):
+        self.state = ClientState()
+        self.sock = socket.create_connection((host, port))
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.sock.sendall(self.state.hello())
+        self.sock.setblocking(False)
+        self.outgoing = bytearray()
+
+    def poll(self):
+        # send what is left over, then read everything that has arrived;
+        # False once the server is gone
+        self._flush()
+        while True:
+            try:
+                data = self.sock.recv(65536)
+            except BlockingIOError:
+                return True
+            if not data:
+                return False
+            self.state.feed(data)
+
+    def send(self, controls):
+        if len(self.outgoing) < self.MAX_PENDING:
+            self.outgoing += self.state.input(controls)
+        self._flush()
+
+    def _flush(self):
+        if not self.outgoing:
+            return
+        try:
+            sent = self.sock.send(self.outgoing)
+        except BlockingIOError:
+            return
+        del self.outgoing[:sent]
+
+    def close(self):
+        self.sock.close()
+
+
+def draw(screen, sprites, state):
+    # the decoded world as one Surface.blits call, like World.draw
+    seq = []
+    for kind, (ids, x, y, values) in state.positions().items():
+        xs = x.astype(int).tolist()
+        ys = y.astype(int).tolist()
+        if kind == "rocks":
+            for px, py, r in zip(xs, ys, values[:, 5].astype(int).tolist()):
+                seq.append((Asteroid.surface(sprites, r), (px - r - 1, py - r - 1)))
+        elif kind in ("bullets", "enemy_bullets"):
+            surf = Bullet.surface(sprites, "player" if kind == "bullets" else "enemy", 3)
+            seq.extend((surf, (px - 4, py - 4)) for px, py in zip(xs, ys))
+        elif kind == "enemies":
+            surf = EnemySmall.surface(sprites)
+            seq.extend((surf, (px - 13, py - 13)) for px, py in zip(xs, ys))
+        elif kind == "bosses":
+            surf = EnemyBig.surface(sprites)
+            seq.extend((surf, (px - 24, py - 12)) for px, py in zip(xs, ys))
+        elif kind == "ships":
+            for px, py, a in zip(xs, ys, values[:, 2].tolist()):
+                seq.append((Player.surface(sprites, angle(a)), (px - 16, py - 16)))
+    screen.blits(seq, doreturn=False)
@@ -0,0 +1,54 @@
+import struct
+
+# TCP framing: every message is  length u32 | type u8 | payload  (little
+# endian, length counts the payload only).
+#   HELLO     client -> server  (empty)
+#   WELCOME   server -> client  player serial u16 | match u16 | hz f32
+#   INPUT     client -> server  controls u8 | acked seq u32
+#   SNAPSHOT  server -> client  seq u32 | base seq u32 | snapshot.encode() bits
+# A client acks the newest snapshot it decoded; the server encodes the next
+# one against it (base 0 means a full snapshot). Inputs are latest-wins for
+# held keys, while FIRE/HYPER presses are kept until the next server tick.
+HELLO = 1
+WELCOME = 2
+INPUT = 3
+SNAPSHOT = 4
+
+FRAME = struct.Struct("<IB")
+WELCOME_BODY = struct.Struct("<HHf")
+INPUT_BODY = struct.Struct("<BI")
+SNAPSHOT_HEAD = struct.Struct("<II")
+MAX_READ = 1 << 16  # longest frame read_frame() accepts (the server reads input)
+
+
+def frame(kind, payload=b""):
+    return FRAME.pack(len(payload), kind) + payload
+
+
+class FrameReader:
+    # reassembles frames from a byte stream fed in arbitrary chunks
+    def __init__(self):
+        self.buffer = bytearray()
+
+    def feed(self, data):
+        self.buffer += data
+        frames = []
+        buf = self.buffer
+        pos = 0
+        while len(buf) - pos >= FRAME.size:
+            length, kind = FRAME.unpack_from(buf, pos)
+            end = pos + FRAME.size + length
+            if end > len(buf):
+                break
+            frames.append((kind, bytes(buf[pos + FRAME.size:end])))
+            pos = end
+        del buf[:pos]
+        return frames
+
+
+async def read_frame(reader, limit=MAX_READ):
+    length, kind = FRAME.unpack(await reader.readexactly(FRAME.size))
+    if length > limit:
+        # a peer that sends this is broken or hostile; don't buffer it
+        raise ConnectionError(f"frame of {length} bytes (limit {limit})")
+    return kind, await reader.readexactly(length)
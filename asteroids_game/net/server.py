@@ -0,0 +1,268 @@
+# Authoritative multi-player server: owns the worlds, steps them on a fixed
+# tick and streams delta snapshots to every client (see net.protocol).
+#   python -m net.server --port 7777 --hz 30 --players-per-match 8
+import argparse
+import asyncio
+import itertools
+import json
+import socket
+import time
+
+from audio.audio import NullAudio
+from net import protocol as P
+from net.snapshot import EMPTY, Capture, encode
+from systems.controls import FIRE, HYPER
+from systems.particles import Particles
+from systems.profiler import Profiler
+from systems.world import World
+
+HISTORY = 64                # snapshots per match a client may ack against
+MAX_BUFFERED = 64 * 1024    # don't queue more for a client that can't keep up
+PRESSES = FIRE | HYPER
+
+
+class Client:
+    def __init__(self, writer, match, player):
+        self.writer = writer
+        self.match = match
+        self.player = player
+        self.held = 0
+        self.pressed = 0
+        self.ack = 0
+        self.bytes_sent = 0
+        self.snapshots = 0
+        self.full = 0
+        self.skipped = 0
+        self.oversize = 0
+        self.joined = time.perf_counter()
+
+
+class Match:
+    """One World, the clients playing in it and their recent snapshots."""
+
+    def __init__(self, match_id, seed, hz):
+        self.id = match_id
+        self.world = World(seed=seed, audio=NullAudio(), players=0, particles=Particles(0))
+        self.capture = Capture(self.world, hz)
+        self.clients = []
+        self.history = {}
+        self.seq = 0
+        self.encodes = 0
+        self.warned = False
+
+    def tick(self, dt):
+        inputs = {}
+        for c in self.clients:
+            inputs[c.player] = c.held | c.pressed
+            c.pressed = 0
+        self.world.step_players(dt, inputs)
+        if not len(self.world.asteroids):
+            self.world.spawn_asteroids(6)
+
+    def broadcast(self):
+        self.seq += 1
+        snap = self.history[self.seq] = self.capture(self.seq)
+        self.history.pop(self.seq - HISTORY, None)
+        # clients that acked the same snapshot share one encoding (None if
+        # the snapshot doesn't fit the format against that base)
+        frames = {}
+        for c in self.clients:
+            transport = c.writer.transport
+            if transport.is_closing() or transport.get_write_buffer_size() > MAX_BUFFERED:
+                c.skipped += 1
+                continue
+            base = c.ack if c.ack in self.history else 0
+            if base not in frames:
+                self.encodes += 1
+                try:
+                    body = encode(snap, self.history[base] if base else EMPTY)
+                except ValueError as e:
+                    # the world outgrew the format: these clients keep their
+                    # last snapshot instead of the match going down
+                    if not self.warned:
+                        print(f"match {self.id}: {e}", flush=True)
+                        self.warned = True
+                    frames[base] = None
+                else:
+                    frames[base] = P.frame(P.SNAPSHOT, P.SNAPSHOT_HEAD.pack(self.seq, base) + body)
+            data = frames[base]
+            if data is None:
+                c.oversize += 1
+                continue
+            c.writer.write(data)
+            c.bytes_sent += len(data)
+            c.snapshots += 1
+            c.full += base == 0
+
+
+class Server:
+    """Fixed-tick host for any number of matches of up to players_per_match."""
+
+    def __init__(self, hz=30, players_per_match=8, seed=None):
+        self.hz = hz
+        self.players_per_match = players_per_match
+        self.seed = seed
+        self.matches = {}
+        self.match_ids = itertools.count(1)
+        self.clients = set()
+        self.profiler = Profiler(enabled=True, window=max(1, int(hz * 60)))
+        self.ticks = 0
+        self.late_ticks = 0
+        # totals of clients that already left, so metrics cover the whole run
+        self.gone = {"clients": 0, "bytes_sent": 0, "seconds": 0.0, "snapshots": 0, "full": 0, "skipped": 0,
+                     "oversize": 0}
+        self.encodes = 0
+
+    def _match_with_room(self):
+        for m in self.matches.values():
+            if len(m.clients) < self.players_per_match:
+                return m
+        match_id = next(self.match_ids)
+        seed = None if self.seed is None else self.seed + match_id
+        m = self.matches[match_id] = Match(match_id, seed, self.hz)
+        return m
+
+    async def handle(self, reader, writer):
+        try:
+            kind, _ = await P.read_frame(reader)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            writer.close()
+            return
+        if kind != P.HELLO:
+            writer.close()
+            return
+        sock = writer.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        match = self._match_with_room()
+        player = match.world.add_player()
+        client = Client(writer, match, player)
+        match.clients.append(client)
+        self.clients.add(client)
+        writer.write(P.frame(P.WELCOME, P.WELCOME_BODY.pack(player.serial & 0xFFFF, match.id & 0xFFFF, self.hz)))
+        try:
+            while True:
+                kind, payload = await P.read_frame(reader)
+                if kind == P.INPUT:
+                    controls, ack = P.INPUT_BODY.unpack(payload)
+                    client.held = controls & ~PRESSES
+                    client.pressed |= controls & PRESSES
+                    if client.ack < ack <= match.seq:
+                        client.ack = ack
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self._drop(client)
+            writer.close()
+
+    def _drop(self, client):
+        if client not in self.clients:
+            return
+        self.clients.discard(client)
+        match = client.match
+        match.clients.remove(client)
+        match.world.remove_player(client.player)
+        if not match.clients:
+            self.encodes += match.encodes
+            del self.matches[match.id]
+        gone = self.gone
+        gone["clients"] += 1
+        gone["bytes_sent"] += client.bytes_sent
+        gone["seconds"] += time.perf_counter() - client.joined
+        gone["snapshots"] += client.snapshots
+        gone["full"] += client.full
+        gone["skipped"] += client.skipped
+        gone["oversize"] += client.oversize
+
+    async def run(self, duration=None, stats_every=None):
+        loop = asyncio.get_running_loop()
+        dt = 1.0 / self.hz
+        prof = self.profiler
+        start = next_tick = loop.time()
+        last_stats = start
+        while duration is None or loop.time() - start < duration:
+            with prof.section("tick"):
+                with prof.section("simulate"):
+                    for m in list(self.matches.values()):
+                        m.tick(dt)
+                with prof.section("snapshot"):
+                    for m in list(self.matches.values()):
+                        m.broadcast()
+            self.ticks += 1
+            next_tick += dt
+            now = loop.time()
+            if next_tick < now:
+                # fell behind: skip the missed ticks rather than bursting
+                self.late_ticks += 1
+                next_tick = now
+            if stats_every and now - last_stats >= stats_every:
+                last_stats = now
+                self.print_stats()
+            await asyncio.sleep(next_tick - now)
+
+    def metrics(self):
+        now = time.perf_counter()
+        live = self.clients
+        gone = self.gone
+        sent = gone["bytes_sent"] + sum(c.bytes_sent for c in live)
+        seconds = gone["seconds"] + sum(now - c.joined for c in live)
+        snapshots = gone["snapshots"] + sum(c.snapshots for c in live)
+        out = {
+            "clients": len(live),
+            "clients_total": gone["clients"] + len(live),
+            "matches": len(self.matches),
+            "ticks": self.ticks,
+            "late_ticks": self.late_ticks,
+            "bytes_per_client_per_s": sent / seconds if seconds else 0.0,
+            "bytes_per_snapshot": sent / snapshots if snapshots else 0.0,
+            "snapshots": snapshots,
+            "full_snapshots": gone["full"] + sum(c.full for c in live),
+            "skipped_snapshots": gone["skipped"] + sum(c.skipped for c in live),
+            "encodes": self.encodes + sum(m.encodes for m in self.matches.values()),
+            "oversize_snapshots": gone["oversize"] + sum(c.oversize for c in live),
+        }
+        for name, count, mean, p50, p95, p99 in self.profiler.summary():
+            out[f"{name}_ms"] = {"mean": mean, "p50": p50, "p95": p95, "p99": p99}
+        return out
+
+    def print_stats(self):
+        m = self.metrics()
+        tick = m.get("tick_ms", {"p50": 0.0, "p99": 0.0})
+        print(f"{m['clients']} clients in {m['matches']} matches | tick p50 {tick['p50']:.2f} ms "
+              f"p99 {tick['p99']:.2f} ms | {m['bytes_per_client_per_s'] / 1024:.2f} KiB/s per client "
+              f"| {m['bytes_per_snapshot']:.0f} B/snapshot", flush=True)
+
+
+async def serve(host, port, hz, players_per_match, seed, duration, stats_every, as_json):
+    server = Server(hz, players_per_match, seed)
+    listener = await asyncio.start_server(server.handle, host, port)
+    port = listener.sockets[0].getsockname()[1]
+    print(f"listening on {host}:{port}", flush=True)
+    async with listener:
+        await server.run(duration, stats_every)
+    if as_json:
+        print(json.dumps(server.metrics()), flush=True)
+    else:
+        server.print_stats()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Asteroids+ multi-player server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7777, help="0 picks a free port")
+    parser.add_argument("--hz", type=float, default=30, help="simulation and snapshot rate")
+    parser.add_argument("--players-per-match", type=int, default=8)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--duration", type=float, help="stop after this many seconds")
+    parser.add_argument("--stats-every", type=float, default=5.0, help="seconds between stats lines (0: off)")
+    parser.add_argument("--json", action="store_true", help="print the final metrics as one JSON line")
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args.host, args.port, args.hz, args.players_per_match, args.seed,
+                          args.duration, args.stats_every, args.json))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
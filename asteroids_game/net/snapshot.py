@@ -0,0 +1,275 @@
+import numpy as np
+import config as C
+
+# A snapshot is {"kinds": {kind: {id: (field, ...)}}, "score": n} of
+# quantized unsigned ints; ids are the low 16 bits of the entity's serial
+# (see Pool). Positions are half pixels with an offset, so the big enemy's
+# off-screen entry (x down to -100) still fits in 12 bits; angles are 1/256
+# turns; velocities 1/4 px/s with an offset.
+#
+# Rocks and bullets fly in straight lines, so they are sent dead-reckoned:
+# an origin (x, y at tick t0) and a velocity. Those rows don't change from
+# tick to tick, so after the first snapshot they cost nothing; the client
+# extrapolates them (see positions()). The origin is refreshed every
+# `rebase` seconds to bound the drift from quantizing the velocity.
+#
+# Encoding (bit-packed, MSB first), against a base snapshot the client has
+# acknowledged (EMPTY for a full snapshot), for each kind in KINDS:
+#   removed count (COUNT_BITS), then their ids
+#   written count (COUNT_BITS), then for each: id | new flag (1)
+#       new:      every field at full width
+#       changed:  field mask (1 bit per field), then per changed field
+#                 small flag (1) + signed SMALL_BITS delta, or full width
+# followed by score changed (1) [+ score (SCORE_BITS)].
+# Entities identical to the base cost nothing. encode() raises ValueError
+# rather than truncate a count, id or field that doesn't fit its width.
+# Ids wrap at 16 bits by design (Capture masks serials), so they always fit.
+LINEAR = ("x", "y", "vx", "vy", "t0")
+KINDS = {
+    "ships": ("x", "y", "angle"),
+    "rocks": LINEAR + ("radius",),
+    "bullets": LINEAR,
+    "enemy_bullets": LINEAR,
+    "enemies": ("x", "y"),
+    "bosses": ("x", "y"),
+}
+BITS = {"x": 12, "y": 12, "angle": 8, "radius": 6, "vx": 14, "vy": 14, "t0": 16}
+ID_BITS = 16
+COUNT_BITS = 12
+SMALL_BITS = 7
+SCORE_BITS = 24
+POS_SCALE = 2
+POS_OFFSET = 128
+VEL_SCALE = 4
+VEL_OFFSET = 1 << 13
+
+EMPTY = {"kinds": {kind: {} for kind in KINDS}, "score": 0}
+
+
+def quantize_pos(v):
+    q = np.rint((np.asarray(v, dtype=float) + POS_OFFSET) * POS_SCALE).astype(int)
+    return np.clip(q, 0, (1 << BITS["x"]) - 1)
+
+
+def position(q):
+    return np.asarray(q) / POS_SCALE - POS_OFFSET
+
+
+def quantize_vel(v):
+    q = np.rint(np.asarray(v, dtype=float) * VEL_SCALE).astype(int) + VEL_OFFSET
+    return np.clip(q, 0, (1 << BITS["vx"]) - 1)
+
+
+def velocity(q):
+    return (np.asarray(q) - VEL_OFFSET) / VEL_SCALE
+
+
+def quantize_angle(deg):
+    return round(deg * 256 / 360) % 256
+
+
+def angle(q):
+    return q * 360 / 256
+
+
+def _rows(ids, *columns):
+    return dict(zip(ids, zip(*(c.tolist() for c in columns))))
+
+
+def _ids(objs):
+    return [o.serial & 0xFFFF for o in objs]
+
+
+class Capture:
+    """Quantized snapshots of one world, one per tick, numbered by seq."""
+
+    def __init__(self, world, hz=C.FPS, rebase=4.0):
+        self.world = world
+        self.rebase = max(1, round(rebase * hz))
+        self.origins = {"rocks": {}, "bullets": {}, "enemy_bullets": {}}
+
+    def _linear(self, kind, seq, ids, x, y, vx, vy, *extra):
+        # keep each entity's origin while its velocity holds and it is
+        # younger than `rebase` ticks; otherwise start a new one here
+        old = self.origins[kind]
+        rows = {}
+        t0 = seq & 0xFFFF
+        columns = [quantize_pos(x).tolist(), quantize_pos(y).tolist(),
+                   quantize_vel(vx).tolist(), quantize_vel(vy).tolist()]
+        columns += [c.tolist() for c in extra]
+        for i, qx, qy, qvx, qvy, *rest in zip(ids, *columns):
+            row = old.get(i)
+            if row is None or row[2] != qvx or row[3] != qvy or (t0 - row[4]) % 65536 >= self.rebase:
+                row = (qx, qy, qvx, qvy, t0, *rest)
+            rows[i] = row
+        self.origins[kind] = rows
+        return rows
+
+    def __call__(self, seq):
+        world = self.world
+        rocks = world.rocks
+        n = rocks.count
+        kinds = {
+            "ships": {p.serial & 0xFFFF: (int(quantize_pos(p.x)), int(quantize_pos(p.y)),
+                                          quantize_angle(p.angle))
+                      for p in world.players},
+            "rocks": self._linear("rocks", seq, _ids(rocks.views[:n]), rocks.x[:n], rocks.y[:n],
+                                  rocks.vx[:n], rocks.vy[:n], rocks.radius[:n].astype(int)),
+        }
+        shots = world.shots
+        owner = shots.owner[:shots.count]
+        for kind, code in (("bullets", 1), ("enemy_bullets", 2)):
+            rows = np.flatnonzero(owner == code)
+            kinds[kind] = self._linear(kind, seq, _ids([shots.views[r] for r in rows.tolist()]),
+                                       shots.x[rows], shots.y[rows], shots.vx[rows], shots.vy[rows])
+        swarm = world.swarm
+        n = swarm.count
+        kinds["enemies"] = _rows(_ids(swarm.views[:n]), quantize_pos(swarm.x[:n]), quantize_pos(swarm.y[:n]))
+        big = world.enemy_big
+        kinds["bosses"] = {0: (int(quantize_pos(big.x)), int(quantize_pos(big.y)))} if big else {}
+        return {"kinds": kinds, "score": world.counters["asteroids_destroyed"]}
+
+
+def positions(snapshot, seq, hz):
+    # {kind: (ids, x, y, rows)} in pixels at tick seq, extrapolating the
+    # dead-reckoned kinds from their origin
+    out = {}
+    for kind, rows in snapshot["kinds"].items():
+        ids = list(rows)
+        values = np.array(list(rows.values()), dtype=float).reshape(len(ids), len(KINDS[kind]))
+        x, y = position(values[:, 0]), position(values[:, 1])
+        if KINDS[kind][:5] == LINEAR:
+            age = ((seq & 0xFFFF) - values[:, 4]) % 65536 / hz
+            x = (x + velocity(values[:, 2]) * age) % C.WIDTH
+            y = (y + velocity(values[:, 3]) * age) % C.HEIGHT
+        out[kind] = (ids, x, y, values)
+    return out
+
+
+class BitWriter:
+    # whole bytes go straight to the buffer; only the bits of a byte not
+    # yet complete stay in the accumulator, so every write is O(1)
+    def __init__(self):
+        self.buf = bytearray()
+        self.acc = 0
+        self.bits = 0
+
+    def write(self, value, bits):
+        acc = (self.acc << bits) | (value & ((1 << bits) - 1))
+        n = self.bits + bits
+        while n >= 8:
+            n -= 8
+            self.buf.append((acc >> n) & 0xFF)
+        self.acc = acc & ((1 << n) - 1)
+        self.bits = n
+
+    def getvalue(self):
+        if self.bits:
+            return bytes(self.buf) + bytes([(self.acc << (8 - self.bits)) & 0xFF])
+        return bytes(self.buf)
+
+
+class BitReader:
+    # pulls bytes into a small cache as reads need them
+    def __init__(self, data):
+        self.data = data
+        self.pos = 0
+        self.cache = 0
+        self.bits = 0
+
+    def read(self, bits):
+        cache, n = self.cache, self.bits
+        while n < bits:
+            if self.pos >= len(self.data):
+                raise ValueError("snapshot truncated")
+            cache = (cache << 8) | self.data[self.pos]
+            self.pos += 1
+            n += 8
+        n -= bits
+        self.cache = cache & ((1 << n) - 1)
+        self.bits = n
+        return cache >> n
+
+    def read_signed(self, bits):
+        v = self.read(bits)
+        return v - (1 << bits) if v >> (bits - 1) else v
+
+
+def _count(n, kind):
+    if n >> COUNT_BITS:
+        raise ValueError(f"snapshot too large: {n} {kind} rows (at most {(1 << COUNT_BITS) - 1})")
+    return n
+
+
+def _fit(v, bits, *what):
+    # what names the field, joined only when it doesn't fit
+    if v < 0 or v >> bits:
+        raise ValueError(f"snapshot {'.'.join(what)} {v} does not fit in {bits} bits")
+    return v
+
+
+def encode(snapshot, base=EMPTY):
+    out = BitWriter()
+    write = out.write
+    small = 1 << (SMALL_BITS - 1)
+    for kind, fields in KINDS.items():
+        cur = snapshot["kinds"][kind]
+        old = base["kinds"][kind]
+        removed = [i for i in old if i not in cur]
+        write(_count(len(removed), kind), COUNT_BITS)
+        for i in removed:
+            write(i, ID_BITS)
+        written = [(i, row, old.get(i)) for i, row in cur.items() if old.get(i) != row]
+        write(_count(len(written), kind), COUNT_BITS)
+        widths = [BITS[f] for f in fields]
+        for i, row, prev in written:
+            write(_fit(i, ID_BITS, kind, "id"), ID_BITS)
+            write(prev is None, 1)
+            if prev is None:
+                for v, w, f in zip(row, widths, fields):
+                    write(_fit(v, w, kind, f), w)
+                continue
+            mask = 0
+            for v, p in zip(row, prev):
+                mask = (mask << 1) | (v != p)
+            write(mask, len(fields))
+            for v, p, w, f in zip(row, prev, widths, fields):
+                if v == p:
+                    continue
+                d = v - p
+                if -small <= d < small:
+                    write(1, 1)
+                    write(d, SMALL_BITS)
+                else:
+                    write(0, 1)
+                    write(_fit(v, w, kind, f), w)
+    changed = snapshot["score"] != base["score"]
+    write(changed, 1)
+    if changed:
+        write(_fit(snapshot["score"], SCORE_BITS, "score"), SCORE_BITS)
+    return out.getvalue()
+
+
+def decode(data, base=EMPTY):
+    inp = BitReader(data)
+    read = inp.read
+    kinds = {}
+    for kind, fields in KINDS.items():
+        rows = dict(base["kinds"][kind])
+        for _ in range(read(COUNT_BITS)):
+            rows.pop(read(ID_BITS), None)
+        widths = [BITS[f] for f in fields]
+        for _ in range(read(COUNT_BITS)):
+            i = read(ID_BITS)
+            if read(1):
+                rows[i] = tuple(read(w) for w in widths)
+                continue
+            mask = read(len(fields))
+            row = list(rows[i])
+            for f, w in enumerate(widths):
+                if mask >> (len(fields) - 1 - f) & 1:
+                    row[f] = row[f] + inp.read_signed(SMALL_BITS) if read(1) else read(w)
+            rows[i] = tuple(row)
+        kinds[kind] = rows
+    score = read(SCORE_BITS) if read(1) else base["score"]
+    return {"kinds": kinds, "score": score}
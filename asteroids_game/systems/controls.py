@@ -0,0 +1,27 @@
+import pygame as pg
+
+# one bit per control; held keys plus this frame's fire/hyperspace presses
+LEFT = 1
+RIGHT = 2
+UP = 4
+FIRE = 8
+HYPER = 16
+
+KEY_BITS = {pg.K_LEFT: LEFT, pg.K_RIGHT: RIGHT, pg.K_UP: UP}
+
+
+class Keys:
+    # stands in for pg.key.get_pressed() when input comes from a bitmask
+    def __init__(self, mask):
+        self.mask = mask
+
+    def __getitem__(self, key):
+        return bool(self.mask & KEY_BITS.get(key, 0))
+
+
+def held_mask(keys):
+    mask = 0
+    for key, bit in KEY_BITS.items():
+        if keys[key]:
+            mask |= bit
+    return mask
@@ -0,0 +1,66 @@
+import pygame as pg
+import config as C
+
+
+class DirtyRenderer:
+    """Erase and push only the rects that changed since the last frame.
+
+    present() takes {key: rect} for everything drawn this frame, keyed by
+    entity (or any stable name). Each key's previous and current rects are
+    merged when they overlap, and rects of keys that went away are erased.
+    When the dirty area passes `threshold` of the screen a plain flip is
+    cheaper, so it does that instead.
+    """
+
+    def __init__(self, screen, background=C.BLACK, threshold=0.35):
+        self.screen = screen
+        self.background = background
+        self.max_area = threshold * screen.get_width() * screen.get_height()
+        self.previous = {}
+        self.full = True
+        self.full_frames = 0
+        self.dirty_frames = 0
+        self.pushed_area = 0
+
+    def invalidate(self):
+        # next frame repaints and flips the whole screen
+        self.full = True
+
+    def begin(self):
+        if self.full:
+            self.screen.fill(self.background)
+        else:
+            for r in self.previous.values():
+                self.screen.fill(self.background, r)
+
+    def present(self, rects):
+        previous = self.previous
+        current = {}
+        dirty = []
+        for key, r in rects.items():
+            if not r:
+                continue
+            current[key] = r
+            old = previous.get(key)
+            if old is None:
+                dirty.append(r)
+            elif old.colliderect(r):
+                dirty.append(old.union(r))
+            else:
+                dirty.append(old)
+                dirty.append(r)
+        for key, old in previous.items():
+            if key not in current:
+                dirty.append(old)
+
+        area = sum(r.w * r.h for r in dirty)
+        if self.full or area > self.max_area:
+            pg.display.flip()
+            self.full_frames += 1
+            self.pushed_area += self.screen.get_width() * self.screen.get_height()
+        else:
+            pg.display.update(dirty)
+            self.dirty_frames += 1
+            self.pushed_area += area
+        self.full = False
+        self.previous = current
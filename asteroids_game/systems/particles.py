@@ -0,0 +1,165 @@
+import math
+import numpy as np
+import pygame as pg
+import config as C
+
+
+class Particles:
+    """Short-lived sparks and debris in preallocated arrays.
+
+    Rows 0..count-1 are live. update() moves, wraps and ages every row in
+    one vectorized pass and packs the survivors to the front. At most
+    `budget` particles live at once; emits past it are dropped and counted.
+    Particles are cosmetic: they have their own RNG, so they never change
+    what a seed or replay does.
+    """
+
+    DRAG = 1.5  # per second; debris slows down as it fades
+    SIZE = 2    # pixels per side
+    CELL = 64   # draw() reports one dirty rect per occupied cell this big
+
+    def __init__(self, budget=4096, seed=None):
+        self.budget = budget
+        self.rng = np.random.default_rng(seed)
+        self.count = 0
+        self.x = np.zeros(budget)
+        self.y = np.zeros(budget)
+        self.vx = np.zeros(budget)
+        self.vy = np.zeros(budget)
+        self.life = np.zeros(budget)
+        self.span = np.ones(budget)
+        self.color = np.zeros((budget, 3))
+        self.stats = {"emitted": 0, "dropped": 0, "peak": 0}
+
+    def _rows(self, n):
+        # claim up to n rows at the end of the live range
+        n = max(0, int(n))
+        room = min(n, self.budget - self.count)
+        self.stats["dropped"] += n - room
+        if room <= 0:
+            return None
+        rows = slice(self.count, self.count + room)
+        self.count += room
+        self.stats["emitted"] += room
+        self.stats["peak"] = max(self.stats["peak"], self.count)
+        return rows
+
+    def _fill(self, rows, x, y, vx, vy, life, color):
+        n = rows.stop - rows.start
+        self.x[rows] = x
+        self.y[rows] = y
+        self.vx[rows] = vx
+        self.vy[rows] = vy
+        self.life[rows] = self.span[rows] = life * self.rng.uniform(0.5, 1.0, n)
+        self.color[rows] = color
+
+    def burst(self, x, y, n, speed, life, color, vx=0.0, vy=0.0):
+        # n particles flying out every way from (x, y), on top of (vx, vy)
+        rows = self._rows(n)
+        if rows is None:
+            return
+        k = rows.stop - rows.start
+        ang = self.rng.uniform(0, 2 * math.pi, k)
+        s = speed * np.sqrt(self.rng.random(k))
+        self._fill(rows, x, y, vx + np.cos(ang) * s, vy + np.sin(ang) * s, life, color)
+
+    def stream(self, x, y, n, angle, spread, speed, life, color):
+        # a cone of particles around angle (radians); a fractional n is
+        # rounded up or down at random so low rates still average out
+        rows = self._rows(math.floor(n + self.rng.random()))
+        if rows is None:
+            return
+        k = rows.stop - rows.start
+        ang = angle + self.rng.uniform(-spread, spread, k)
+        s = speed * self.rng.uniform(0.6, 1.0, k)
+        self._fill(rows, x, y, np.cos(ang) * s, np.sin(ang) * s, life, color)
+
+    def update(self, dt):
+        n = self.count
+        if n == 0:
+            return
+        x, y, vx, vy = self.x[:n], self.y[:n], self.vx[:n], self.vy[:n]
+        drag = math.exp(-self.DRAG * dt)
+        vx *= drag
+        vy *= drag
+        x += vx * dt
+        y += vy * dt
+        np.mod(x, C.WIDTH, out=x)
+        np.mod(y, C.HEIGHT, out=y)
+        life = self.life[:n]
+        life -= dt
+        keep = np.flatnonzero(life > 0)
+        if len(keep) < n:
+            k = len(keep)
+            for col in (self.x, self.y, self.vx, self.vy, self.life, self.span, self.color):
+                col[:k] = col[keep]
+            self.count = k
+
+    def clear(self):
+        self.count = 0
+
+    def draw(self, screen):
+        # every live particle in one go, faded by its remaining life;
+        # returns {key: rect} for the dirty renderer, one rect per cell of
+        # the screen that has particles, so a thrust trail and a far away
+        # explosion don't add up to one screen-sized rect
+        n = self.count
+        if n == 0:
+            return {}
+        w, h = screen.get_size()
+        x = self.x[:n].astype(np.intp)
+        y = self.y[:n].astype(np.intp)
+        np.clip(x, 0, w - self.SIZE, out=x)
+        np.clip(y, 0, h - self.SIZE, out=y)
+        rgb = (self.color[:n] * (self.life[:n] / self.span[:n])[:, None]).astype(np.uint32)
+        if screen.get_bytesize() == 4:
+            self._pixels(screen, x, y, rgb)
+        else:
+            self._blits(screen, x, y, rgb)
+        return self._rects(x, y, h)
+
+    def _rects(self, x, y, height):
+        # bounding box of the particles in each occupied cell
+        rows = -(-height // self.CELL)
+        cell = x // self.CELL * rows + y // self.CELL
+        order = np.argsort(cell, kind="stable")
+        cell = cell[order]
+        x = x[order]
+        y = y[order]
+        starts = np.flatnonzero(np.r_[True, cell[1:] != cell[:-1]])
+        left = np.minimum.reduceat(x, starts).tolist()
+        top = np.minimum.reduceat(y, starts).tolist()
+        right = np.maximum.reduceat(x, starts).tolist()
+        bottom = np.maximum.reduceat(y, starts).tolist()
+        size = self.SIZE
+        return {("particles", c): pg.Rect(l, t, r - l + size, b - t + size)
+                for c, l, t, r, b in zip(cell[starts].tolist(), left, top, right, bottom)}
+
+    def _pixels(self, screen, x, y, rgb):
+        # pack the colors in the screen's own pixel format and write them
+        # straight into its memory: one fancy-indexed store per sub-pixel
+        shifts = screen.get_shifts()
+        losses = screen.get_losses()
+        mapped = np.zeros(len(x), dtype=np.uint32)
+        for c in range(3):
+            mapped |= (rgb[:, c] >> losses[c]) << shifts[c]
+        pixels = pg.surfarray.pixels2d(screen)
+        try:
+            for dx in range(self.SIZE):
+                for dy in range(self.SIZE):
+                    pixels[x + dx, y + dy] = mapped
+        finally:
+            del pixels   # unlocks the surface
+
+    def _blits(self, screen, x, y, rgb):
+        # other pixel formats: one small square per color, 16 fade levels
+        levels = (rgb >> 4).tolist()
+        squares = {}
+        seq = []
+        for px, py, key in zip(x.tolist(), y.tolist(), map(tuple, levels)):
+            surf = squares.get(key)
+            if surf is None:
+                surf = squares[key] = pg.Surface((self.SIZE, self.SIZE))
+                surf.fill(tuple(v << 4 for v in key))
+            seq.append((surf, (px, py)))
+        screen.blits(seq, doreturn=False)
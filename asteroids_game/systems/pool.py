@@ -0,0 +1,60 @@
+class Pool:
+    """Preallocated objects with free-list reuse and O(1) swap-remove.
+
+    Pooled objects implement spawn(*args) to (re)initialise themselves and
+    despawn() to let go of anything they hold, and carry an `alive` flag.
+    Iterating a pool walks the live objects; their order is not stable.
+    Every acquire stamps the object with a new `serial`, so a recycled
+    object never looks like the one it used to be (network snapshots key
+    entities on it).
+    """
+
+    def __init__(self, factory, capacity=0):
+        self.factory = factory
+        self.live = []
+        self.free = [factory() for _ in range(capacity)]
+        self.high_water = 0
+        self.spawned = 0
+
+    def __iter__(self):
+        return iter(self.live)
+
+    def __len__(self):
+        return len(self.live)
+
+    def acquire(self, *args):
+        obj = self.free.pop() if self.free else self.factory()
+        obj.spawn(*args)
+        obj.alive = True
+        self.spawned += 1
+        obj.serial = self.spawned
+        obj.pool_index = len(self.live)
+        self.live.append(obj)
+        if len(self.live) > self.high_water:
+            self.high_water = len(self.live)
+        return obj
+
+    def release(self, obj):
+        i = obj.pool_index
+        last = self.live.pop()
+        if last is not obj:
+            self.live[i] = last
+            last.pool_index = i
+        obj.pool_index = -1
+        obj.alive = False
+        obj.despawn()
+        self.free.append(obj)
+
+    def sweep(self):
+        # walk backwards so a swap only ever moves an object already checked
+        live = self.live
+        for i in range(len(live) - 1, -1, -1):
+            if not live[i].alive:
+                self.release(live[i])
+
+    def clear(self):
+        for obj in list(self.live):
+            self.release(obj)
+
+    def stats(self):
+        return {"live": len(self.live), "free": len(self.free), "high_water": self.high_water}
@@ -0,0 +1,10 @@
+# The profiler is shared with megaman_game and lives in gamekit/ at the
+# repository root; this module puts the root on the path and re-exports it.
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+
+from gamekit.profiler import NULL_SECTION, Profiler  # noqa: E402,F401
@@ -0,0 +1,122 @@
+import random
+import struct
+
+# File layout (little endian):
+#   header  "ASTR" | version u8 | flags u8 | seed i64 | hz f64
+#   records controls u8 | [dt in ms, varint] | run length varint
+# The dt field is only present when flags has VARIABLE_DT (live games use
+# clock.tick, headless runs a fixed hz). Records are written and flushed to
+# the OS as soon as a run of identical ticks ends, so a crash only loses
+# the run in progress.
+MAGIC = b"ASTR"
+VERSION = 1
+VARIABLE_DT = 1
+HEADER = struct.Struct("<4sBBqd")
+
+
+def new_seed():
+    return random.randrange(2**31)
+
+
+def _varint(n):
+    out = bytearray()
+    while True:
+        byte = n & 0x7F
+        n >>= 7
+        if n:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return out
+
+
+def _read_varint(data, pos):
+    n = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        n |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return n, pos
+        shift += 7
+
+
+class Recorder:
+    # hz=None records the per-frame dt in milliseconds as well
+    def __init__(self, path, seed, hz=None):
+        self.file = open(path, "wb")
+        self.variable = hz is None
+        flags = VARIABLE_DT if self.variable else 0
+        self.file.write(HEADER.pack(MAGIC, VERSION, flags, seed, hz or 0.0))
+        self.file.flush()
+        self.run = None
+        self.count = 0
+        self.ticks = 0
+
+    def record(self, controls, dt_ms=0):
+        key = (controls, dt_ms if self.variable else 0)
+        self.ticks += 1
+        if key == self.run:
+            self.count += 1
+            return
+        self._flush()
+        self.run = key
+        self.count = 1
+
+    def _flush(self):
+        if not self.count:
+            return
+        controls, dt_ms = self.run
+        out = bytearray([controls])
+        if self.variable:
+            out += _varint(dt_ms)
+        out += _varint(self.count)
+        self.file.write(out)
+        self.file.flush()
+
+    def close(self):
+        if self.file.closed:
+            return
+        self._flush()
+        self.count = 0
+        self.file.close()
+
+
+class Replay:
+    def __init__(self, seed, hz, runs):
+        self.seed = seed
+        self.hz = hz
+        self.runs = runs    # [(controls, dt_ms, count)]
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            data = f.read()
+        if len(data) < HEADER.size:
+            raise ValueError(f"{path}: not an Asteroids+ replay")
+        magic, version, flags, seed, hz = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path}: not an Asteroids+ replay")
+        variable = flags & VARIABLE_DT
+        runs = []
+        pos = HEADER.size
+        while pos < len(data):
+            controls = data[pos]
+            pos += 1
+            dt_ms = 0
+            if variable:
+                dt_ms, pos = _read_varint(data, pos)
+            count, pos = _read_varint(data, pos)
+            runs.append((controls, dt_ms, count))
+        return cls(seed, None if variable else hz, runs)
+
+    def __len__(self):
+        return sum(count for _, _, count in self.runs)
+
+    def frames(self):
+        # yields (controls, dt) for every recorded tick
+        fixed = 1.0 / self.hz if self.hz else None
+        for controls, dt_ms, count in self.runs:
+            dt = fixed if fixed else dt_ms / 1000.0
+            for _ in range(count):
+                yield controls, dt
@@ -0,0 +1,138 @@
+import numpy as np
+import config as C
+
+DENSE = 24  # pairs_within tests all pairs up to this many points
+ALL_PAIRS = [np.triu_indices(n, 1) for n in range(DENSE + 1)]
+
+
+class SpatialHash:
+    """Uniform grid broad phase that tiles the wrapping screen.
+
+    Items are stored in the cell that holds their center, per layer. A query
+    widens its box by the largest radius inserted in that layer, so any item
+    whose circle can touch the query circle is returned as a candidate.
+    """
+
+    def __init__(self, cell_size=64, width=C.WIDTH, height=C.HEIGHT):
+        self.width = width
+        self.height = height
+        self.cell_size = None
+        self.clear(cell_size)
+
+    def clear(self, cell_size=None):
+        if cell_size is not None and cell_size != self.cell_size:
+            # cells must tile the screen exactly so wrapped indices line up
+            self.cell_size = cell_size
+            self.cols = max(1, round(self.width / cell_size))
+            self.rows = max(1, round(self.height / cell_size))
+            self.cell_w = self.width / self.cols
+            self.cell_h = self.height / self.rows
+        self.layers = {}
+        self.reach = {}
+
+    def insert(self, layer, item, x, y, radius=0.0):
+        cells = self.layers.get(layer)
+        if cells is None:
+            cells = self.layers[layer] = {}
+            self.reach[layer] = 0.0
+        key = (int(x // self.cell_w) % self.cols, int(y // self.cell_h) % self.rows)
+        bucket = cells.get(key)
+        if bucket is None:
+            cells[key] = [item]
+        else:
+            bucket.append(item)
+        if radius > self.reach[layer]:
+            self.reach[layer] = radius
+
+    def query(self, layer, x, y, radius=0.0):
+        cells = self.layers.get(layer)
+        if not cells:
+            return []
+        reach = radius + self.reach[layer]
+        xs = self._span(x - reach, x + reach, self.cell_w, self.cols)
+        ys = self._span(y - reach, y + reach, self.cell_h, self.rows)
+        found = []
+        for cx in xs:
+            for cy in ys:
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found.extend(bucket)
+        return found
+
+    @staticmethod
+    def _span(lo, hi, size, count):
+        first = int(lo // size)
+        last = int(hi // size)
+        if last - first + 1 >= count:
+            return range(count)
+        return [c % count for c in range(first, last + 1)]
+
+
+def pairs_within(x, y, radius, width=C.WIDTH, height=C.HEIGHT):
+    """Every ordered pair (i, j), i != j, of points closer than radius.
+
+    The vectorized counterpart of SpatialHash for one layer of points in
+    arrays: points are bucketed into cells at least radius wide that tile
+    the wrapping screen, and each point is paired with the points in its
+    own and the surrounding cells (wrapped). Returns i, j and the offset
+    from i to j along the shortest wrapped path, plus its squared length.
+    """
+    n = len(x)
+    if n <= DENSE:
+        # a handful of points: testing every pair beats bucketing them
+        i, j = ALL_PAIRS[n]
+        return _mirror(*_within(x, y, i, j, radius, width, height))
+    cols = max(1, int(width // radius))
+    rows = max(1, int(height // radius))
+    cx = (x * cols // width).astype(np.intp) % cols
+    cy = (y * rows // height).astype(np.intp) % rows
+    cell = cx * rows + cy
+    order = np.argsort(cell, kind="stable")
+    ordered = cell[order]
+    # each unordered pair is found once: from its own cell and half of the
+    # 8 neighbours, the other half being the mirror image. A screen under
+    # 3 cells across would see some neighbours twice, so there every
+    # distinct neighbour is visited and only i < j kept
+    half = cols >= 3 and rows >= 3
+    if half:
+        offsets = ((0, 0), (1, -1), (1, 0), (1, 1), (0, 1))
+    else:
+        offsets = {(ox % cols, oy % rows) for ox in (-1, 0, 1) for oy in (-1, 0, 1)}
+    ii, jj = [], []
+    for ox, oy in offsets:
+        near = (cx + ox) % cols * rows + (cy + oy) % rows
+        start = np.searchsorted(ordered, near, "left")
+        count = np.searchsorted(ordered, near, "right") - start
+        total = int(count.sum())
+        if total == 0:
+            continue
+        # expand each point's [start, start + count) run of the order
+        first = np.repeat(start - (np.cumsum(count) - count), count)
+        i = np.repeat(np.arange(n), count)
+        j = order[np.arange(total) + first]
+        if not half or (ox, oy) == (0, 0):
+            keep = np.flatnonzero(i < j)
+            i, j = i[keep], j[keep]
+        ii.append(i)
+        jj.append(j)
+    if not ii:
+        empty = np.zeros(0)
+        return empty.astype(np.intp), empty.astype(np.intp), empty, empty, empty
+    return _mirror(*_within(x, y, np.concatenate(ii), np.concatenate(jj), radius, width, height))
+
+
+def _within(x, y, i, j, radius, width, height):
+    # keep the candidate pairs that really are closer than radius
+    dx = x[j] - x[i]
+    dy = y[j] - y[i]
+    dx -= width * np.rint(dx / width)
+    dy -= height * np.rint(dy / height)
+    d2 = dx * dx + dy * dy
+    keep = np.flatnonzero(d2 < radius * radius)
+    return i[keep], j[keep], dx[keep], dy[keep], d2[keep]
+
+
+def _mirror(i, j, dx, dy, d2):
+    # (i, j) pairs found once -> both directions
+    return (np.concatenate((i, j)), np.concatenate((j, i)), np.concatenate((dx, -dx)),
+            np.concatenate((dy, -dy)), np.concatenate((d2, d2)))
@@ -0,0 +1,64 @@
+import pygame as pg
+
+# shapes are flat and not antialiased, so a color key loses nothing and
+# RLE colorkey blits are several times faster than per-pixel alpha
+KEY = (255, 0, 255)
+
+
+class SpriteCache:
+    """Pre-rendered entity surfaces, built once per key on first use.
+
+    Entities ask for get(key, build); build() draws the shape onto a new
+    surface (see blank()) the first time a key is seen. Keys carry
+    everything that changes the pixels (radius, color, rotation bucket...).
+    """
+
+    def __init__(self):
+        self.surfaces = {}
+        self.hits = 0
+        self.misses = 0
+        self.bytes = 0
+
+    def get(self, key, build):
+        surf = self.surfaces.get(key)
+        if surf is not None:
+            self.hits += 1
+            return surf
+        self.misses += 1
+        surf = build()
+        if pg.display.get_surface() is not None:
+            surf = surf.convert()
+            surf.set_colorkey(KEY, pg.RLEACCEL)
+        self.surfaces[key] = surf
+        self.bytes += surf.get_width() * surf.get_height() * surf.get_bytesize()
+        return surf
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self.surfaces),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "bytes": self.bytes,
+        }
+
+
+def blank(w, h):
+    surf = pg.Surface((w, h))
+    surf.fill(KEY)
+    surf.set_colorkey(KEY, pg.RLEACCEL)
+    return surf
+
+
+def circle_surface(color, radius, width=0):
+    size = radius * 2 + 2
+    surf = blank(size, size)
+    pg.draw.circle(surf, color, (radius + 1, radius + 1), radius, width)
+    return surf
+
+
+def rect_surface(color, w, h):
+    surf = blank(w, h)
+    surf.fill(color)
+    return surf
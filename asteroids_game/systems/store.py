@@ -0,0 +1,123 @@
+import numpy as np
+import config as C
+
+OWNERS = ("none", "player", "enemy")
+
+
+class EntityStore:
+    """Structure-of-arrays storage for simple moving circles.
+
+    Rows 0..count-1 are live and packed; removing a row moves the last one
+    into the hole. Each row keeps a reference to the view object that owns
+    it so the view's slot can follow the swap.
+    """
+
+    def __init__(self, capacity=64):
+        self.count = 0
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.vx = np.zeros(capacity)
+        self.vy = np.zeros(capacity)
+        self.radius = np.zeros(capacity)
+        self.life = np.zeros(capacity)
+        self.owner = np.zeros(capacity, dtype=np.int8)
+        self.views = [None] * capacity
+
+    def _grow(self):
+        capacity = len(self.views) * 2
+        for name in ("x", "y", "vx", "vy", "radius", "life", "owner"):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+        self.views.extend([None] * (capacity - len(self.views)))
+
+    def add(self, view, x, y, vx, vy, radius, life=np.inf, owner="none"):
+        if self.count == len(self.views):
+            self._grow()
+        row = self.count
+        self.x[row] = x
+        self.y[row] = y
+        self.vx[row] = vx
+        self.vy[row] = vy
+        self.radius[row] = radius
+        self.life[row] = life
+        self.owner[row] = OWNERS.index(owner)
+        self.views[row] = view
+        self.count += 1
+        return row
+
+    def remove(self, row):
+        last = self.count - 1
+        if row != last:
+            for col in (self.x, self.y, self.vx, self.vy, self.radius, self.life, self.owner):
+                col[row] = col[last]
+            moved = self.views[last]
+            self.views[row] = moved
+            moved.slot = row
+        self.views[last] = None
+        self.count = last
+
+    def integrate(self, dt):
+        # move, wrap and age every live row in one pass
+        n = self.count
+        x, y = self.x[:n], self.y[:n]
+        x += self.vx[:n] * dt
+        y += self.vy[:n] * dt
+        np.mod(x, C.WIDTH, out=x)
+        np.mod(y, C.HEIGHT, out=y)
+        self.life[:n] -= dt
+
+    def expired(self):
+        return np.flatnonzero(self.life[:self.count] <= 0)
+
+    def overlap(self, rows, px, py, reach=None):
+        # vectorized point-in-circle test for the given rows; reach replaces
+        # the stored radius when the probe has its own hit range
+        dx = self.x[rows] - px
+        dy = self.y[rows] - py
+        r = self.radius[rows] if reach is None else reach
+        return dx * dx + dy * dy < r * r
+
+    def max_speed(self):
+        n = self.count
+        if n == 0:
+            return 0.0
+        return float(np.sqrt((self.vx[:n] ** 2 + self.vy[:n] ** 2).max()))
+
+    def impact(self, rows, px, py, pvx, pvy, dt, reach=None):
+        # swept version of overlap: a probe now at (px, py) moving at (pvx,
+        # pvy) and each row moving at its own velocity both travelled in a
+        # straight line over the last dt. Returns the fraction of the tick
+        # (0..1) at which they first came within reach, inf if they never
+        # did. Offsets use the nearest wrapped image, so paths that cross
+        # a screen edge are tested in one piece.
+        dx = px - self.x[rows]
+        dy = py - self.y[rows]
+        dx -= C.WIDTH * np.round(dx / C.WIDTH)
+        dy -= C.HEIGHT * np.round(dy / C.HEIGHT)
+        r = self.radius[rows] if reach is None else reach
+        # relative motion during the tick, and the offset it started from
+        ex = (pvx - self.vx[rows]) * dt
+        ey = (pvy - self.vy[rows]) * dt
+        sx = dx - ex
+        sy = dy - ey
+        a = ex * ex + ey * ey
+        b = sx * ex + sy * ey
+        c = sx * sx + sy * sy - r * r
+        disc = b * b - a * c
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = (-b - np.sqrt(disc)) / a
+        hit = (a > 0) & (disc >= 0) & (t >= 0) & (t <= 1)
+        return np.where(c < 0, 0.0, np.where(hit, t, np.inf))
+
+
+def column(name, cast=float):
+    # property that reads and writes one field of the owning store's row
+    def get(self):
+        return cast(getattr(self.store, name)[self.slot])
+
+    def set(self, value):
+        getattr(self.store, name)[self.slot] = value
+
+    return property(get, set)
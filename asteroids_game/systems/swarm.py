@@ -0,0 +1,160 @@
+import math
+import numpy as np
+import config as C
+from systems.spatial import pairs_within
+
+
+class Swarm:
+    """Steers every row of a store at once: seek, separation, alignment.
+
+    Each row heads for its nearest target, away from rows closer than
+    SEPARATION_RADIUS and along the mean heading of rows within
+    NEIGHBOR_RADIUS, always at `speed`. A row with no neighbours just
+    seeks, as a lone EnemySmall always did. The store's life column holds
+    each row's time since its last shot; step() moves the rows, advances
+    those timers and returns who fires this tick.
+    """
+
+    NEIGHBOR_RADIUS = 48.0
+    SEPARATION_RADIUS = 30.0
+    SEEK = 1.0
+    SEPARATION = 1.5
+    ALIGNMENT = 0.5
+    # up to this many rows a plain loop beats NumPy's per-call overhead
+    SCALAR = 8
+
+    def __init__(self, speed, shoot_interval, bullet_speed):
+        self.speed = speed
+        self.shoot_interval = shoot_interval
+        self.bullet_speed = bullet_speed
+
+    def step(self, store, tx, ty, dt):
+        # tx, ty: lists of target positions; returns (rows, bullet vx, bullet vy)
+        n = store.count
+        if n == 0 or not tx:
+            return np.zeros(0, dtype=np.intp), np.zeros(0), np.zeros(0)
+        if n <= self.SCALAR:
+            return self._step_scalar(store, n, tx, ty, dt)
+        vx, vy, sx, sy = self._steer(store, n, tx, ty)
+        store.vx[:n] = vx
+        store.vy[:n] = vy
+        x, y = store.x[:n], store.y[:n]
+        x += vx * dt
+        y += vy * dt
+        np.mod(x, C.WIDTH, out=x)
+        np.mod(y, C.HEIGHT, out=y)
+
+        # every row whose timer ran out fires at its target this tick
+        timer = store.life[:n]
+        timer += dt
+        fire = np.flatnonzero(timer >= self.shoot_interval)
+        timer[fire] = 0.0
+        return fire, sx[fire] * self.bullet_speed, sy[fire] * self.bullet_speed
+
+    def _steer(self, store, n, tx, ty):
+        # new velocities and unit aims at the target, for all rows at once
+        x, y, vx, vy = store.x[:n], store.y[:n], store.vx[:n], store.vy[:n]
+
+        # seek the nearest target in a straight line, as World.nearest_player
+        if len(tx) == 1:
+            dx = tx[0] - x
+            dy = ty[0] - y
+        else:
+            tx = np.asarray(tx, dtype=float)
+            ty = np.asarray(ty, dtype=float)
+            nearest = ((tx - x[:, None]) ** 2 + (ty - y[:, None]) ** 2).argmin(axis=1)
+            dx = tx[nearest] - x
+            dy = ty[nearest] - y
+        dist = np.hypot(dx, dy) + 1e-6
+        sx = dx / dist
+        sy = dy / dist
+        hx = self.SEEK * sx
+        hy = self.SEEK * sy
+
+        i, j, ox, oy, d2 = pairs_within(x, y, self.NEIGHBOR_RADIUS)
+        if len(i):
+            # separation: push away from close rows, harder the closer
+            d = np.sqrt(d2) + 1e-6
+            push = np.maximum(1 - d / self.SEPARATION_RADIUS, 0) / d
+            hx -= self.SEPARATION * np.bincount(i, ox * push, n)
+            hy -= self.SEPARATION * np.bincount(i, oy * push, n)
+            # alignment: last tick's mean heading of the neighbourhood
+            count = np.maximum(np.bincount(i, minlength=n), 1) * self.speed
+            hx += self.ALIGNMENT * np.bincount(i, vx[j], n) / count
+            hy += self.ALIGNMENT * np.bincount(i, vy[j], n) / count
+
+        norm = np.hypot(hx, hy)
+        flat = norm < 1e-6
+        if flat.any():
+            # the pulls cancel out: fall back to seeking
+            hx[flat] = sx[flat]
+            hy[flat] = sy[flat]
+            norm[flat] = 1.0
+        scale = self.speed / norm
+        return hx * scale, hy * scale, sx, sy
+
+    def _step_scalar(self, store, n, tx, ty, dt):
+        # the same rules as step(), row by row, for a handful of rows
+        xs = store.x[:n].tolist()
+        ys = store.y[:n].tolist()
+        vxs = store.vx[:n].tolist()
+        vys = store.vy[:n].tolist()
+        timers = store.life[:n].tolist()
+        targets = list(zip(tx, ty))
+        reach2 = self.NEIGHBOR_RADIUS ** 2
+        steered = []
+        for k in range(n):
+            px, py = xs[k], ys[k]
+            gx, gy = min(targets, key=lambda t: (t[0] - px) ** 2 + (t[1] - py) ** 2)
+            dx = gx - px
+            dy = gy - py
+            dist = math.hypot(dx, dy) + 1e-6
+            sx = dx / dist
+            sy = dy / dist
+            hx = self.SEEK * sx
+            hy = self.SEEK * sy
+            sep_x = sep_y = al_x = al_y = 0.0
+            count = 0
+            for o in range(n):
+                if o == k:
+                    continue
+                ox = xs[o] - px
+                oy = ys[o] - py
+                ox -= C.WIDTH * round(ox / C.WIDTH)
+                oy -= C.HEIGHT * round(oy / C.HEIGHT)
+                d2 = ox * ox + oy * oy
+                if d2 >= reach2:
+                    continue
+                d = math.sqrt(d2) + 1e-6
+                push = max(1 - d / self.SEPARATION_RADIUS, 0) / d
+                sep_x += ox * push
+                sep_y += oy * push
+                al_x += vxs[o]
+                al_y += vys[o]
+                count += 1
+            if count:
+                hx += self.ALIGNMENT * al_x / (count * self.speed) - self.SEPARATION * sep_x
+                hy += self.ALIGNMENT * al_y / (count * self.speed) - self.SEPARATION * sep_y
+            norm = math.hypot(hx, hy)
+            if norm < 1e-6:
+                hx, hy, norm = sx, sy, 1.0
+            steered.append((hx * self.speed / norm, hy * self.speed / norm, sx, sy))
+
+        fire, fire_vx, fire_vy = [], [], []
+        for k, (vx, vy, sx, sy) in enumerate(steered):
+            vxs[k] = vx
+            vys[k] = vy
+            xs[k] = (xs[k] + vx * dt) % C.WIDTH
+            ys[k] = (ys[k] + vy * dt) % C.HEIGHT
+            timers[k] += dt
+            if timers[k] >= self.shoot_interval:
+                timers[k] = 0.0
+                fire.append(k)
+                fire_vx.append(sx * self.bullet_speed)
+                fire_vy.append(sy * self.bullet_speed)
+        store.x[:n] = xs
+        store.y[:n] = ys
+        store.vx[:n] = vxs
+        store.vy[:n] = vys
+        store.life[:n] = timers
+        return np.array(fire, dtype=np.intp), np.array(fire_vx), np.array(fire_vy)
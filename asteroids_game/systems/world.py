@@ -1,4 +1,6 @@
+import math
 import random
+import numpy as np
 import config as C
 from entities.player import Player
 from entities.asteroid import Asteroid
@@ -6,125 +8,348 @@ from entities.bullet import Bullet
 from entities.enemy_small import EnemySmall
 from entities.enemy_big import EnemyBig
 from audio.audio import Audio
+from systems.controls import FIRE, HYPER, Keys
+from systems.particles import Particles
+from systems.pool import Pool
+from systems.profiler import Profiler
+from systems.spatial import SpatialHash
+from systems.sprites import SpriteCache
+from systems.store import OWNERS, EntityStore
+from systems.swarm import Swarm
 
 class World:
-    def __init__(self):
-        self.player = Player()
-        self.asteroids = []
-        self.bullets = []
-        self.enemy_bullets = []
-        self.enemies_small = []
+    # spawn probabilities per 1/C.FPS of game time (scaled by dt, so lower
+    # tick rates spawn as often); batch runs override them per world
+    SMALL_SPAWN_CHANCE = 0.01
+    BIG_SPAWN_CHANCE = 0.002
+    # random spawns stop at this many small enemies (spawn_wave ignores it)
+    SMALL_MAX = 2
+    # swept collision tests over each tick's motion; False tests only the
+    # end-of-tick positions, which tunnels at low tick rates
+    SWEPT = True
+    # engine exhaust, particles per second while thrusting
+    THRUST_RATE = 180
+
+    def __init__(self, seed=None, audio=None, profiler=None, players=1, particles=None):
+        # each world owns its RNG so several can run side by side
+        self.rng = random.Random(seed)
+        # self.player is the local ship driven by step()/update(); a server
+        # starts with players=0 and adds one ship per client
+        self.players = [Player(self.rng) for _ in range(players)]
+        self.player = self.players[0] if self.players else None
+        for serial, p in enumerate(self.players):
+            p.serial = serial
+        self.player_serial = players
+        # asteroids, bullets and small enemies keep their numbers in array stores
+        self.rocks = EntityStore()
+        self.shots = EntityStore()
+        self.swarm = EntityStore()
+        self.steering = Swarm(EnemySmall.SPEED, EnemySmall.SHOOT_INTERVAL, EnemySmall.BULLET_SPEED)
+        # live entities come from preallocated pools and are recycled
+        self.asteroids = Pool(lambda: Asteroid(self.rocks, self.rng), 32)
+        self.bullets = Pool(lambda: Bullet(self.shots), 64)
+        self.enemy_bullets = Pool(lambda: Bullet(self.shots), 64)
+        self.enemies_small = Pool(lambda: EnemySmall(self.swarm), 4)
         self.enemy_big = None
+        self.grid = SpatialHash()
+        self.sprites = SpriteCache()
+        self.counters = {"asteroids_destroyed": 0, "player_hits": 0,
+                         "enemies_crashed": 0, "collisions": 0}
 
-        self.audio = Audio()
+        self.audio = audio if audio is not None else Audio()
+        # headless runs pass Particles(0): nothing is ever drawn there
+        self.particles = particles if particles is not None else Particles(seed=seed)
+        self.profiler = profiler if profiler is not None else Profiler()
         self.spawn_asteroids(6)
 
-    def try_fire(self):
-        vx = self.player.dirx * 350
-        vy = self.player.diry * 350
-        self.bullets.append(Bullet(self.player.x, self.player.y, vx, vy, "player"))
+    def add_player(self):
+        player = Player(self.rng)
+        player.random_position()
+        player.serial = self.player_serial
+        self.player_serial += 1
+        self.players.append(player)
+        return player
+
+    def remove_player(self, player):
+        self.players.remove(player)
+        if player is self.player:
+            self.player = self.players[0] if self.players else None
+
+    def nearest_player(self, x, y):
+        players = self.players
+        if len(players) < 2:
+            return players[0] if players else None
+        return min(players, key=lambda p: (p.x - x) ** 2 + (p.y - y) ** 2)
+
+    def try_fire(self, player=None):
+        player = player or self.player
+        vx = player.dirx * 350
+        vy = player.diry * 350
+        self.spawn_bullet(player.x, player.y, vx, vy, "player")
         self.audio.play("laser")
 
-    def hyperspace(self):
-        self.player.random_position()
+    def spawn_bullet(self, x, y, vx, vy, owner):
+        pool = self.bullets if owner == "player" else self.enemy_bullets
+        return pool.acquire(x, y, vx, vy, owner)
+
+    def hyperspace(self, player=None):
+        (player or self.player).random_position()
 
     def spawn_asteroids(self, n):
         for _ in range(n):
-            self.asteroids.append(Asteroid())
+            self.asteroids.acquire()
+
+    def spawn_small(self):
+        rng = self.rng
+        return self.enemies_small.acquire(rng.choice([0, C.WIDTH]), rng.randint(0, C.HEIGHT))
+
+    def spawn_wave(self, n):
+        # n small enemies from the side edges at once, past SMALL_MAX
+        for _ in range(n):
+            self.spawn_small()
+
+    def pool_stats(self):
+        return {
+            "asteroids": self.asteroids.stats(),
+            "bullets": self.bullets.stats(),
+            "enemy_bullets": self.enemy_bullets.stats(),
+            "enemies_small": self.enemies_small.stats(),
+        }
+
+    def step(self, dt, controls):
+        # advance one tick from a controls bitmask (see systems.controls)
+        if controls & FIRE:
+            self.try_fire()
+        if controls & HYPER:
+            self.hyperspace()
+        self.update(dt, Keys(controls))
+
+    def step_players(self, dt, inputs):
+        # advance one tick with a controls bitmask per player ({player:
+        # controls}); players left out keep drifting with no keys held
+        for player, controls in inputs.items():
+            if controls & FIRE:
+                self.try_fire(player)
+            if controls & HYPER:
+                self.hyperspace(player)
+            player.keys = Keys(controls)
+        self.update(dt, None)
 
     def update(self, dt, keys):
-        self.player.update(dt, keys)
-        for a in self.asteroids:
-            a.update(dt)
-
-        for b in list(self.bullets):
-            b.update(dt)
-            if b.life <= 0:
-                try:
-                    self.bullets.remove(b)
-                except ValueError:
-                    pass
-
-        for eb in list(self.enemy_bullets):
-            eb.update(dt)
-            if eb.life <= 0:
-                try:
-                    self.enemy_bullets.remove(eb)
-                except ValueError:
-                    pass
-
-        # spawn small enemies if none
-        if len(self.enemies_small) < 2 and random.random() < 0.01:
-            side_x = random.choice([0, C.WIDTH])
-            side_y = random.randint(0, C.HEIGHT)
-            self.enemies_small.append(EnemySmall(side_x, side_y))
-
-        # maybe spawn a big enemy occasionally
-        if self.enemy_big is None and random.random() < 0.002:
-            self.enemy_big = EnemyBig()
-
-        for e in list(self.enemies_small):
-            e.update(dt, self.player, self)
+        # keys drives self.player; other players use their own .keys
+        prof = self.profiler
+        with prof.section("player"):
+            for p in self.players:
+                p.update(dt, keys if keys is not None and p is self.player else p.keys)
+                if p.vx or p.vy:
+                    self.particles.stream(p.x - p.dirx * 12, p.y - p.diry * 12, self.THRUST_RATE * dt,
+                                          math.atan2(-p.diry, -p.dirx), 0.35, 120, 0.4, C.YELLOW)
 
-        if self.enemy_big:
-            self.enemy_big.update(dt, self)
+        with prof.section("enemies"):
+            # spawn small enemies up to SMALL_MAX
+            rng = self.rng
+            ticks = dt * C.FPS
+            if len(self.enemies_small) < self.SMALL_MAX and rng.random() < self.SMALL_SPAWN_CHANCE * ticks:
+                self.spawn_small()
 
-        self.handle_collisions()
+            # maybe spawn a big enemy occasionally
+            if self.enemy_big is None and rng.random() < self.BIG_SPAWN_CHANCE * ticks:
+                self.enemy_big = EnemyBig(rng=rng)
 
-    def handle_collisions(self):
-        # bullets hitting asteroids
-        for b in list(self.bullets):
-            for a in list(self.asteroids):
-                if a.collides(b.x, b.y):
-                    try:
-                        self.bullets.remove(b)
-                    except ValueError:
-                        pass
-                    try:
-                        self.asteroids.remove(a)
-                    except ValueError:
-                        pass
-                    self.audio.play("explosion")
-                    break
+            # the whole swarm steers and decides who fires in one step
+            players = self.players
+            if players and self.swarm.count:
+                rows, bvx, bvy = self.steering.step(self.swarm, [p.x for p in players],
+                                                    [p.y for p in players], dt)
+                if len(rows):
+                    swarm = self.swarm
+                    for x, y, vx, vy in zip(swarm.x[rows].tolist(), swarm.y[rows].tolist(),
+                                            bvx.tolist(), bvy.tolist()):
+                        self.spawn_bullet(x, y, vx, vy, "enemy")
+                        self.audio.play("enemy_shoot")
+
+            if self.enemy_big:
+                self.enemy_big.update(dt, self)
+
+        # one vectorized step moves, wraps and ages every asteroid and bullet;
+        # enemies fire before it, like players, so a bullet fired this tick
+        # has travelled this tick's path when the swept tests look back on it
+        with prof.section("move"):
+            self.rocks.integrate(dt)
+            self.shots.integrate(dt)
+            expired = self.shots.expired()
+            if len(expired):
+                for row in expired:
+                    self.shots.views[row].alive = False
+                self.bullets.sweep()
+                self.enemy_bullets.sweep()
+
+        with prof.section("particles"):
+            self.particles.update(dt)
 
-        # enemy bullets hitting player
-        for eb in list(self.enemy_bullets):
-            if (self.player.x - eb.x)**2 + (self.player.y - eb.y)**2 < 15**2:
-                try:
-                    self.enemy_bullets.remove(eb)
-                except ValueError:
-                    pass
+        with prof.section("collisions"):
+            self.handle_collisions(dt if self.SWEPT else 0.0)
+
+        # everything requested this tick (including try_fire) starts here
+        with prof.section("audio"):
+            self.audio.flush(dt)
+
+    def handle_collisions(self, dt=0.0):
+        # one broad phase per tick, shared by every collision pair; with dt
+        # every pair is tested along its motion over the tick, so fast or
+        # low-rate movers can't skip through each other
+        grid = self.grid
+        rocks = self.rocks
+        # size cells so each holds about one asteroid, whatever the wave size
+        density = (C.WIDTH * C.HEIGHT / max(1, rocks.count)) ** 0.5
+        grid.clear(max(16, min(128, int(density))))
+        n = rocks.count
+        for row, x, y, r in zip(range(n), rocks.x[:n].tolist(), rocks.y[:n].tolist(),
+                                rocks.radius[:n].tolist()):
+            grid.insert("asteroids", row, x, y, r)
+        for eb in self.enemy_bullets:
+            grid.insert("enemy_bullets", eb.slot, eb.x, eb.y, eb.radius)
+
+        # how far the fastest asteroid moved this tick widens every query
+        rock_speed = rocks.max_speed() if dt else 0.0
+
+        # bullets hitting asteroids
+        for b, a in self._hits("asteroids", rocks, self._store_probes(self.shots, "player"), dt, rock_speed):
+            if b.alive and a.alive:
+                b.alive = False
+                a.alive = False
+                self._count("asteroids_destroyed")
                 self.audio.play("explosion")
-                self.player.random_position()
-                break
+                # fragments keep some of the rock's drift
+                self.particles.burst(a.x, a.y, a.radius * 2, 140, 0.9, C.WHITE, a.vx * 0.5, a.vy * 0.5)
 
-        # enemies destroyed by asteroids
-        for e in list(self.enemies_small):
-            for a in list(self.asteroids):
-                if a.collides(e.x, e.y):
-                    try:
-                        self.enemies_small.remove(e)
-                    except ValueError:
-                        pass
+        # enemy bullets hitting players
+        shot_speed = self.shots.max_speed() if dt and len(self.enemy_bullets) else 0.0
+        for player in self.players:
+            px, py, pvx, pvy = player.x, player.y, player.vx, player.vy
+            reach = (math.hypot(pvx, pvy) + shot_speed) * dt
+            rows = grid.query("enemy_bullets", px, py, 15 + reach)
+            if rows:
+                toi = self.shots.impact(rows, px, py, pvx, pvy, dt, 15)
+                # earliest bullet that is still live: another player may
+                # already have taken the first one this tick
+                views = self.shots.views
+                hit = None
+                for k in np.argsort(toi, kind="stable").tolist():
+                    if not np.isfinite(toi[k]):
+                        break
+                    if views[rows[k]].alive:
+                        hit = views[rows[k]]
+                        break
+                if hit is not None:
+                    hit.alive = False
+                    self._count("player_hits")
                     self.audio.play("explosion")
-                    break
+                    self.particles.burst(px, py, 60, 180, 1.2, C.YELLOW)
+                    player.random_position()
+
+        # enemies destroyed by asteroids
+        for e, a in self._hits("asteroids", rocks, self._store_probes(self.swarm), dt, rock_speed):
+            if e.alive and a.alive:
+                e.alive = False
+                self._count("enemies_crashed")
+                self.audio.play("explosion")
+                self.particles.burst(e.x, e.y, 40, 160, 1.0, C.GREEN, e.vx, e.vy)
 
         if self.enemy_big:
-            for a in list(self.asteroids):
-                if a.collides(self.enemy_big.x, self.enemy_big.y):
+            for _, a in self._hits("asteroids", rocks, self._probes([self.enemy_big]), dt, rock_speed):
+                if a.alive:
+                    big = self.enemy_big
                     self.enemy_big = None
+                    self._count("enemies_crashed")
                     self.audio.play("explosion")
+                    self.particles.burst(big.x, big.y, 120, 200, 1.5, C.YELLOW, big.vx, big.vy)
                     break
 
+        # hand everything that died back to its pool
+        self.bullets.sweep()
+        self.asteroids.sweep()
+        self.enemy_bullets.sweep()
+        self.enemies_small.sweep()
+
+    def _count(self, name):
+        self.counters[name] += 1
+        self.counters["collisions"] += 1
+
+    @staticmethod
+    def _store_probes(store, owner=None):
+        # store-backed movers: positions and velocities straight from the
+        # arrays, optionally only the rows of one owner
+        n = store.count
+        if n == 0:
+            return [], None, None, None, None
+        if owner is None:
+            return (store.views[:n], store.x[:n], store.y[:n], store.vx[:n], store.vy[:n])
+        rows = np.flatnonzero(store.owner[:n] == OWNERS.index(owner))
+        views = store.views
+        return ([views[r] for r in rows.tolist()],
+                store.x[rows], store.y[rows], store.vx[rows], store.vy[rows])
+
+    @staticmethod
+    def _probes(movers):
+        movers = list(movers)
+        return (movers, np.array([m.x for m in movers], dtype=float),
+                np.array([m.y for m in movers], dtype=float),
+                np.array([m.vx for m in movers], dtype=float),
+                np.array([m.vy for m in movers], dtype=float))
+
+    def _hits(self, layer, store, probes, dt=0.0, store_speed=0.0):
+        # broad phase on the shared grid, widened by how far a mover and the
+        # fastest row (store_speed) could have closed in during the tick, then one
+        # vectorized swept test over every candidate pair; hits come back
+        # earliest first (in mover order on ties)
+        movers, x, y, vx, vy = probes
+        if not movers:
+            return []
+        reach = ((np.hypot(vx, vy) + store_speed) * dt).tolist() if dt else [0.0] * len(movers)
+        query = self.grid.query
+        owner, rows = [], []
+        for i, px, py, r in zip(range(len(movers)), x.tolist(), y.tolist(), reach):
+            found = query(layer, px, py, r)
+            if found:
+                owner.extend([i] * len(found))
+                rows.extend(found)
+        if not rows:
+            return []
+        owner = np.array(owner)
+        toi = store.impact(rows, x[owner], y[owner], vx[owner], vy[owner], dt)
+        hit = np.flatnonzero(np.isfinite(toi))
+        hit = hit[np.argsort(toi[hit], kind="stable")]
+        return [(movers[owner[i]], store.views[rows[i]]) for i in hit.tolist()]
+
     def draw(self, screen, font):
-        self.player.draw(screen)
-        for a in self.asteroids:
-            a.draw(screen)
-        for b in self.bullets:
-            b.draw(screen)
-        for eb in self.enemy_bullets:
-            eb.draw(screen)
-        for e in self.enemies_small:
-            e.draw(screen)
+        # every entity is one cached sprite, so the whole scene is one
+        # Surface.blits call over the particles, which are written straight
+        # into the screen; returns {entity: rect} for the dirty renderer
+        sprites = self.sprites
+        spark = self.particles.draw(screen)
+        entities = [self.player]
+        seq = [self.player.sprite(sprites)]
+        self._batch(self.rocks, lambda r, o: Asteroid.surface(sprites, r), entities, seq)
+        self._batch(self.shots, lambda r, o: Bullet.surface(sprites, OWNERS[o], r), entities, seq)
+        self._batch(self.swarm, lambda r, o: EnemySmall.surface(sprites), entities, seq)
         if self.enemy_big:
-            self.enemy_big.draw(screen)
+            entities.append(self.enemy_big)
+            seq.append(self.enemy_big.sprite(sprites))
+        rects = dict(zip(entities, screen.blits(seq)))
+        rects.update(spark)
+        return rects
+
+    def _batch(self, store, surface, entities, seq):
+        # store-backed entities: positions and sizes come straight from the
+        # arrays, and each distinct (radius, owner) looks its sprite up once
+        n = store.count
+        if n == 0:
+            return
+        radius = store.radius[:n].astype(int)
+        keys = list(zip(radius.tolist(), store.owner[:n].tolist()))
+        surfs = {k: surface(*k) for k in set(keys)}
+        left = (store.x[:n].astype(int) - radius - 1).tolist()
+        top = (store.y[:n].astype(int) - radius - 1).tolist()
+        entities.extend(store.views[:n])
+        seq.extend((surfs[k], (x, y)) for k, x, y in zip(keys, left, top))
@@ -1,3 +1,18 @@
+# TextCache and GlyphAtlas are shared with megaman_game and live in
+# gamekit/ at the repository root; this module puts the root on the path.
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+
+from gamekit.text import GlyphAtlas, TextCache  # noqa: E402,F401
+
+
+_cache = TextCache()
+
+
 def text(screen, font, msg, x, y, color=(255,255,255)):
-    surf = font.render(msg, True, color)
-    screen.blit(surf, (x, y))
+    surf = _cache.render(font, msg, color)
+    return screen.blit(surf, (x, y))
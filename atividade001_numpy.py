@@ -0,0 +1,98 @@
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+from evolution.operators import CloneBest, Matches, PointMutation, decode, random_genomes
+from evolution.population import Population
+
+# Same problem as atividade001
+POSSIBLE_CHARACTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ "
+TARGET_PHRASE = "METHINKS IT IS LIKE A WEASEL"
+QUANTITY_OF_COPIES = 100
+CHANCE_OF_MUTATION = 0.05
+
+# Characters as bytes, so a phrase is a uint8 row and a population is a
+# (copies, len(TARGET_PHRASE)) uint8 array
+ALPHABET = np.frombuffer(POSSIBLE_CHARACTERS.encode("ascii"), np.uint8)
+TARGET = np.frombuffer(TARGET_PHRASE.encode("ascii"), np.uint8)
+
+
+def evolve(copies=QUANTITY_OF_COPIES, chance=CHANCE_OF_MUTATION, seed=None, on_generation=None):
+    # Run one evolution until a copy matches TARGET_PHRASE; return (generations, phrase).
+    # The RNG is seeded once; seed=None takes fresh entropy from the OS.
+    rng = np.random.default_rng(seed)
+
+    #   1. Random initial sequence, and the copies made from it (one row each)
+    parent = random_genomes(ALPHABET, 1, len(TARGET), rng)
+    population = Population(np.tile(parent, (copies, 1)), Matches(TARGET),
+                            PointMutation(ALPHABET, chance), CloneBest(), rng)
+
+    #   2-5. Every generation the best copy is cloned into all rows, one random mask
+    #        mutates them and a single comparison scores them (see evolution.operators)
+    def report(metrics):
+        on_generation(metrics["generation"], population.best, metrics["best_fitness"])
+
+    population.run(sys.maxsize, target=len(TARGET), callback=None if on_generation is None else report)
+    return population.generation, decode(population.best)
+
+
+def run_original(path):
+    # Time one run of the original script; its output has one line per generation
+    start_time = time.perf_counter()
+    output = subprocess.run([sys.executable, path], capture_output=True, text=True, check=True).stdout
+    elapsed = time.perf_counter() - start_time
+    return output.count("Generation:"), elapsed
+
+
+def compare(runs, original_runs, seed):
+    print(f"{'engine':>10} {'runs':>5} {'generations':>12} {'wall s':>9} {'s/run':>9} {'gen/s':>11}")
+
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "atividade001")
+    generations = elapsed = 0
+    for _ in range(original_runs):
+        g, e = run_original(path)
+        generations += g
+        elapsed += e
+    print(f"{'original':>10} {original_runs:5d} {generations:12d} {elapsed:9.3f} "
+          f"{elapsed / original_runs:9.4f} {generations / elapsed:11.0f}")
+
+    rng = np.random.default_rng(seed)
+    generations = 0
+    start_time = time.perf_counter()
+    for _ in range(runs):
+        generations += evolve(seed=rng)[0]
+    elapsed = time.perf_counter() - start_time
+    print(f"{'numpy':>10} {runs:5d} {generations:12d} {elapsed:9.3f} "
+          f"{elapsed / runs:9.4f} {generations / elapsed:11.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Weasel program with a vectorized NumPy population.")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--quiet", action="store_true", help="only print the final result")
+    parser.add_argument("--compare", action="store_true",
+                        help="benchmark against the original atividade001 script")
+    parser.add_argument("--runs", type=int, default=200, help="NumPy runs for --compare")
+    parser.add_argument("--original-runs", type=int, default=5, help="original script runs for --compare")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(args.runs, args.original_runs, args.seed)
+        return
+
+    def show(generation, parent, max_points):
+        print(f"Generation: {generation} - {list(parent.tobytes().decode('ascii'))} - Points: {max_points}")
+
+    start_time = time.perf_counter()
+    generation, phrase = evolve(seed=args.seed, on_generation=None if args.quiet else show)
+    elapsed_time = time.perf_counter() - start_time
+    print(f"{phrase!r} after {generation} generations in {elapsed_time:.4f}s "
+          f"({generation / elapsed_time:.0f} generations/s)")
+
+
+if __name__ == "__main__":
+    main()
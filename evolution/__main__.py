@@ -0,0 +1,57 @@
+# Weasel search on an island model, for long random targets.
+#   python -m evolution --length 5000 --copies 1000 --islands 8
+import argparse
+import os
+import time
+
+import numpy as np
+
+from evolution.islands import Islands
+from evolution.operators import CloneBest, Matches, PointMutation, Tournament, random_genomes
+from evolution.population import Population
+
+ALPHABET = np.frombuffer(b"ABCDEFGHIJKLMNOPQRSTUVWXYZ ", np.uint8)
+SELECTIONS = {"clone-best": CloneBest, "tournament": Tournament}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evolve random text targets on parallel islands.")
+    parser.add_argument("--length", type=int, default=1000, help="target length in characters")
+    parser.add_argument("--copies", type=int, default=200, help="genomes per island")
+    parser.add_argument("--islands", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--chance", type=float, help="per-character mutation chance (default 1/length)")
+    parser.add_argument("--selection", choices=sorted(SELECTIONS), default="clone-best")
+    parser.add_argument("--generations", type=int, default=20000)
+    parser.add_argument("--migrate-every", type=int, default=50)
+    parser.add_argument("--migrants", type=int, default=2)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--every", type=int, default=100, help="report every N generations")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    target = random_genomes(ALPHABET, 1, args.length, rng)[0]
+    fitness = Matches(target)
+    mutate = PointMutation(ALPHABET, args.chance or 1 / args.length)
+    select = SELECTIONS[args.selection]()
+    populations = [Population(random_genomes(ALPHABET, args.copies, args.length, rng),
+                              fitness, mutate, select, rng.spawn(1)[0])
+                   for _ in range(args.islands)]
+    islands = Islands(populations, args.migrate_every, args.migrants, args.workers)
+
+    def report(m):
+        if m["generation"] % args.every == 0:
+            print(f"island {m['island']:3d} gen {m['generation']:6d}  best {m['best_fitness']:6d}/{args.length}"
+                  f"  mean {m['mean_fitness']:9.1f}  {m['generations_per_second']:7.0f} gen/s")
+
+    start = time.perf_counter()
+    island, best = islands.run(args.generations, target=args.length, callback=report)
+    elapsed = time.perf_counter() - start
+    generations = sum(p.generation for p in islands.populations)
+    print(f"best {best.best_fitness}/{args.length} on island {island} after {best.generation} generations; "
+          f"{generations} island-generations in {elapsed:.2f}s on {islands.workers} workers "
+          f"({generations / elapsed:.0f} gen/s)")
+
+
+if __name__ == "__main__":
+    main()
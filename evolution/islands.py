@@ -0,0 +1,72 @@
+# Island model: independent populations evolving in a process pool, with
+# the best genomes of each island migrating around a ring between epochs.
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+
+def run_epoch(job):
+    # one island for up to `generations` steps in a worker; the metrics come
+    # back with the population and are streamed to the callback per epoch
+    population, generations, target = job
+    metrics = []
+    population.run(generations, target, metrics.append)
+    return population, metrics
+
+
+class Islands:
+    """Populations that evolve apart and exchange `migrants` every epoch.
+
+    Each epoch runs migrate_every generations of every island in parallel
+    (one task per island, so up to `workers` cores are busy). Afterwards the
+    top `migrants` genomes of island i replace the worst ones of island i+1.
+    """
+
+    def __init__(self, populations, migrate_every=25, migrants=2, workers=None):
+        self.populations = list(populations)
+        self.migrate_every = migrate_every
+        self.migrants = migrants
+        self.workers = workers or min(len(self.populations), os.cpu_count() or 1)
+
+    @property
+    def best(self):
+        # (island, population) with the highest best_fitness
+        return max(enumerate(self.populations), key=lambda p: p[1].best_fitness)
+
+    def migrate(self):
+        k = self.migrants
+        pops = self.populations
+        if k <= 0 or len(pops) < 2:
+            return
+        emigrants = [p.genomes[np.argsort(p.scores)[-k:]].copy() for p in pops]
+        for i, genomes in enumerate(emigrants):
+            dest = pops[(i + 1) % len(pops)]
+            worst = np.argsort(dest.scores)[:k]
+            dest.genomes[worst] = genomes
+            dest.scores[worst] = dest.fitness(genomes)
+
+    def run(self, max_generations, target=None, callback=None):
+        # callback(metrics) gets every generation of every island, tagged
+        # with "island" and the overall "elapsed" seconds
+        start = time.perf_counter()
+        done = 0
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            while done < max_generations:
+                n = min(self.migrate_every, max_generations - done)
+                jobs = [(p, n, target) for p in self.populations]
+                results = list(pool.map(run_epoch, jobs))
+                self.populations = [p for p, _ in results]
+                done += n
+                if callback is not None:
+                    elapsed = time.perf_counter() - start
+                    for island, (_, metrics) in enumerate(results):
+                        for m in metrics:
+                            m["island"] = island
+                            m["elapsed"] = elapsed
+                            callback(m)
+                if target is not None and self.best[1].best_fitness >= target:
+                    break
+                self.migrate()
+        return self.best
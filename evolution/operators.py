@@ -0,0 +1,72 @@
+# Pluggable operators for evolution.population.Population.
+#
+# A population is a (copies, length) uint8 array, one genome per row.
+#   fitness(genomes) -> one score per row (higher is better)
+#   mutate(genomes, rng) -> changes genomes in place
+#   select(genomes, scores, rng) -> the next generation, same shape
+# They are small classes rather than closures so islands can pickle them
+# into worker processes.
+import numpy as np
+
+
+def encode(text):
+    return np.frombuffer(text.encode("ascii"), np.uint8).copy()
+
+
+def decode(genome):
+    return genome.tobytes().decode("ascii")
+
+
+def random_genomes(alphabet, copies, length, rng):
+    return alphabet[rng.integers(len(alphabet), size=(copies, length))]
+
+
+class Matches:
+    # number of characters equal to the target, in the same position
+    def __init__(self, target):
+        self.target = target
+
+    def __call__(self, genomes):
+        return np.count_nonzero(genomes == self.target, axis=1)
+
+
+class PointMutation:
+    # every character changes to a random one of alphabet with `chance`,
+    # drawn as one mask for the whole population. Below SPARSE the mask would
+    # be almost all False, so only the mutated positions are drawn: a
+    # binomial count, then that many flat indices (a repeated index just
+    # mutates the same character twice)
+    SPARSE = 0.01
+
+    def __init__(self, alphabet, chance):
+        self.alphabet = alphabet
+        self.chance = chance
+
+    def __call__(self, genomes, rng):
+        if self.chance < self.SPARSE:
+            flat = genomes.reshape(-1)
+            where = rng.integers(flat.size, size=rng.binomial(flat.size, self.chance))
+            flat[where] = self.alphabet[rng.integers(len(self.alphabet), size=len(where))]
+            return
+        mask = rng.random(genomes.shape) < self.chance
+        genomes[mask] = self.alphabet[rng.integers(len(self.alphabet), size=np.count_nonzero(mask))]
+
+
+class CloneBest:
+    # the weasel rule: every copy of the next generation is the best genome
+    # (the first one on ties)
+    def __call__(self, genomes, scores, rng):
+        genomes[:] = genomes[int(scores.argmax())].copy()
+        return genomes
+
+
+class Tournament:
+    # each slot goes to the best of `size` genomes picked at random
+    def __init__(self, size=3):
+        self.size = size
+
+    def __call__(self, genomes, scores, rng):
+        n = len(genomes)
+        picks = rng.integers(n, size=(n, self.size))
+        winners = picks[np.arange(n), scores[picks].argmax(axis=1)]
+        return genomes[winners]
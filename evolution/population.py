@@ -0,0 +1,57 @@
+# One population evolving under pluggable operators (see evolution.operators).
+import time
+
+import numpy as np
+
+
+class Population:
+    """Genomes plus the operators that evolve them, one generation per step().
+
+    A generation is select -> mutate -> score. The RNG is seeded once (an
+    int, a Generator, or None for OS entropy) and travels with the
+    population, so a pickled population resumes exactly where it stopped.
+    """
+
+    def __init__(self, genomes, fitness, mutate, select, rng=None):
+        self.genomes = genomes
+        self.fitness = fitness
+        self.mutate = mutate
+        self.select = select
+        self.rng = np.random.default_rng(rng)
+        self.scores = fitness(genomes)
+        self.generation = 0
+
+    @property
+    def best(self):
+        return self.genomes[int(self.scores.argmax())]
+
+    @property
+    def best_fitness(self):
+        return int(self.scores.max())
+
+    def step(self):
+        genomes = self.select(self.genomes, self.scores, self.rng)
+        self.mutate(genomes, self.rng)
+        self.genomes = genomes
+        self.scores = self.fitness(genomes)
+        self.generation += 1
+
+    def metrics(self, elapsed, generations):
+        return {
+            "generation": self.generation,
+            "best_fitness": self.best_fitness,
+            "mean_fitness": float(self.scores.mean()),
+            "generations_per_second": generations / elapsed if elapsed > 0 else 0.0,
+        }
+
+    def run(self, generations, target=None, callback=None):
+        # up to `generations` steps, stopping early once best_fitness reaches
+        # target; callback(metrics) is called after every generation
+        start = time.perf_counter()
+        for done in range(1, generations + 1):
+            if target is not None and self.best_fitness >= target:
+                break
+            self.step()
+            if callback is not None:
+                callback(self.metrics(time.perf_counter() - start, done))
+        return self
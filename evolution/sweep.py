@@ -0,0 +1,173 @@
+# Parameter sweep over the weasel search: population size x mutation chance x
+# target length, many seeded trials each, run in parallel and silently.
+#   python -m evolution.sweep --trials 20 --out sweep.json
+#   python -m evolution.sweep --baseline evolution/baseline.json
+import argparse
+import csv
+import itertools
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from evolution.operators import CloneBest, Matches, PointMutation, encode
+from evolution.population import Population
+
+ALPHABET = np.frombuffer(b"ABCDEFGHIJKLMNOPQRSTUVWXYZ ", np.uint8)
+PHRASE = "METHINKS IT IS LIKE A WEASEL"
+
+COPIES = (50, 100, 200)
+CHANCES = (0.02, 0.05, 0.1)
+LENGTHS = (28, 56)
+MAX_GENERATIONS = 2000
+
+TRIAL_FIELDS = ("copies", "chance", "length", "seed", "generations", "converged", "seconds",
+                "generations_per_second")
+CONFIG = ("copies", "chance", "length")
+
+
+def target_for(length):
+    # the weasel phrase, repeated (space separated) up to `length` characters
+    return encode(" ".join([PHRASE] * (length // len(PHRASE) + 1))[:length])
+
+
+def run_trial(job):
+    copies, chance, length, seed, max_generations = job
+    rng = np.random.default_rng(seed)
+    target = target_for(length)
+    parent = ALPHABET[rng.integers(len(ALPHABET), size=length)]
+    population = Population(np.tile(parent, (copies, 1)), Matches(target),
+                            PointMutation(ALPHABET, chance), CloneBest(), rng)
+    start = time.perf_counter()
+    population.run(max_generations, target=length)
+    seconds = time.perf_counter() - start
+    return {"copies": copies, "chance": chance, "length": length, "seed": seed,
+            "generations": population.generation,
+            "converged": population.best_fitness >= length,
+            "seconds": seconds,
+            "generations_per_second": population.generation / seconds if seconds > 0 else 0.0}
+
+
+def run_sweep(copies=COPIES, chances=CHANCES, lengths=LENGTHS, trials=20, base_seed=0,
+              max_generations=MAX_GENERATIONS, workers=None):
+    # trial i of every configuration uses seed base_seed + i, so configs are
+    # compared on the same seeds and reruns are reproducible
+    jobs = [(c, p, n, base_seed + i, max_generations)
+            for c, p, n in itertools.product(copies, chances, lengths) for i in range(trials)]
+    workers = workers or os.cpu_count() or 1
+    chunk = max(1, len(jobs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(run_trial, jobs, chunksize=chunk))
+
+
+def summarise(rows):
+    # one entry per configuration, keyed "copies/chance/length"
+    groups = {}
+    for row in rows:
+        groups.setdefault(tuple(row[k] for k in CONFIG), []).append(row)
+    out = {}
+    for config, group in groups.items():
+        generations = np.array([r["generations"] for r in group])
+        seconds = np.array([r["seconds"] for r in group])
+        rate = np.array([r["generations_per_second"] for r in group])
+        g50, g95 = np.percentile(generations, (50, 95))
+        s50, s95 = np.percentile(seconds, (50, 95))
+        r5, r50, r95 = np.percentile(rate, (5, 50, 95))
+        out["/".join(map(str, config))] = {
+            **dict(zip(CONFIG, config)),
+            "trials": len(group),
+            "converged": sum(r["converged"] for r in group),
+            "generations_mean": float(generations.mean()),
+            "generations_p50": float(g50), "generations_p95": float(g95),
+            "seconds_p50": float(s50), "seconds_p95": float(s95),
+            "gen_per_s_p5": float(r5), "gen_per_s_p50": float(r50), "gen_per_s_p95": float(r95),
+        }
+    return out
+
+
+def write_results(path, rows, summary):
+    # .json: summary and every trial; otherwise CSV with one row per trial
+    if path.endswith(".json"):
+        with open(path, "w") as f:
+            json.dump({"summary": summary, "trials": rows}, f, indent=1)
+        return
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=TRIAL_FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def check(summary, baseline, tolerance, rate_tolerance):
+    # regressions against a stored summary: more generations to converge (the
+    # search got worse) or fewer generations per second (it got slower).
+    # Generations are deterministic for a seed; throughput depends on the
+    # machine, hence its own, looser tolerance
+    problems = []
+    for key, old in baseline.items():
+        new = summary.get(key)
+        if new is None:
+            continue
+        if new["converged"] / new["trials"] < old["converged"] / old["trials"]:
+            problems.append(f"{key}: converged {new['converged']}/{new['trials']} "
+                            f"(baseline {old['converged']}/{old['trials']})")
+        if new["generations_p50"] > old["generations_p50"] * (1 + tolerance):
+            problems.append(f"{key}: median generations {new['generations_p50']:.0f} "
+                            f"(baseline {old['generations_p50']:.0f})")
+        if new["gen_per_s_p50"] < old["gen_per_s_p50"] * (1 - rate_tolerance):
+            problems.append(f"{key}: median {new['gen_per_s_p50']:.0f} gen/s "
+                            f"(baseline {old['gen_per_s_p50']:.0f})")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sweep the weasel search parameters over seeded trials.")
+    parser.add_argument("--copies", type=int, nargs="+", default=COPIES)
+    parser.add_argument("--chances", type=float, nargs="+", default=CHANCES)
+    parser.add_argument("--lengths", type=int, nargs="+", default=LENGTHS)
+    parser.add_argument("--trials", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first trial")
+    parser.add_argument("--max-generations", type=int, default=MAX_GENERATIONS)
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--out", help="write results to FILE (.json: summary and trials, otherwise CSV)")
+    parser.add_argument("--save-baseline", metavar="FILE", help="store this summary as a baseline")
+    parser.add_argument("--baseline", metavar="FILE", help="fail if worse than this baseline")
+    parser.add_argument("--tolerance", type=float, default=0.1,
+                        help="allowed relative increase of median generations")
+    parser.add_argument("--rate-tolerance", type=float, default=0.5,
+                        help="allowed relative drop of median gen/s (only meaningful on the baseline's machine)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    rows = run_sweep(args.copies, args.chances, args.lengths, args.trials, args.seed,
+                     args.max_generations, args.workers)
+    elapsed = time.perf_counter() - start
+    summary = summarise(rows)
+
+    print(f"{len(rows)} trials in {elapsed:.2f}s")
+    print(f"{'copies':>6} {'chance':>6} {'length':>6} {'conv':>5} {'gen p50':>8} {'gen p95':>8} "
+          f"{'s p50':>8} {'gen/s p5':>9} {'p50':>7} {'p95':>7}")
+    for s in summary.values():
+        print(f"{s['copies']:6d} {s['chance']:6.3f} {s['length']:6d} {s['converged']:5d} "
+              f"{s['generations_p50']:8.0f} {s['generations_p95']:8.0f} {s['seconds_p50']:8.4f} "
+              f"{s['gen_per_s_p5']:9.0f} {s['gen_per_s_p50']:7.0f} {s['gen_per_s_p95']:7.0f}")
+
+    if args.out:
+        write_results(args.out, rows, summary)
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            json.dump(summary, f, indent=1)
+    if args.baseline:
+        with open(args.baseline) as f:
+            problems = check(summary, json.load(f), args.tolerance, args.rate_tolerance)
+        for p in problems:
+            print("REGRESSION", p)
+        if problems:
+            sys.exit(1)
+        print(f"no regressions against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
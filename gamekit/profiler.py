@@ -0,0 +1,137 @@
+import csv
+import json
+import time
+from collections import deque
+
+import pygame as pg
+
+
+class _Null:
+    # what section() hands out while profiling is off: two empty calls
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+NULL_SECTION = _Null()
+
+
+class _Section:
+    __slots__ = ("profiler", "name", "t0")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.t0 = 0.0
+
+    def __enter__(self):
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.add(self.name, self.t0, time.perf_counter())
+        return False
+
+
+class Profiler:
+    """Named frame timers with rolling percentiles, an overlay and trace export.
+
+        with profiler.section("update"):
+            world.update(dt, keys)
+
+    Sections may nest but a name must not nest inside itself. While
+    disabled, section() returns a shared no-op context manager.
+    """
+
+    TOGGLE_KEY = pg.K_F3
+    REFRESH = 0.25  # seconds between overlay redraws
+
+    def __init__(self, enabled=False, window=300, trace=False, max_events=200000):
+        self.enabled = enabled
+        self.window = window
+        self.samples = {}
+        self.sections = {}
+        self.events = [] if trace else None
+        self.max_events = max_events
+        self.origin = time.perf_counter()
+        self.overlay = None
+        self.overlay_key = None
+        self.overlay_at = 0.0
+
+    def section(self, name):
+        if not self.enabled:
+            return NULL_SECTION
+        s = self.sections.get(name)
+        if s is None:
+            s = self.sections[name] = _Section(self, name)
+        return s
+
+    def add(self, name, t0, t1):
+        ms = (t1 - t0) * 1000.0
+        buf = self.samples.get(name)
+        if buf is None:
+            buf = self.samples[name] = deque(maxlen=self.window)
+        buf.append(ms)
+        if self.events is not None and len(self.events) < self.max_events:
+            self.events.append({"name": name, "ph": "X", "pid": 0, "tid": 0,
+                                "ts": (t0 - self.origin) * 1e6, "dur": ms * 1000.0})
+
+    def handle_event(self, e):
+        if e.type == pg.KEYDOWN and e.key == self.TOGGLE_KEY:
+            self.enabled = not self.enabled
+
+    def percentiles(self, name):
+        values = sorted(self.samples[name])
+        last = len(values) - 1
+        return tuple(values[round(last * q)] for q in (0.50, 0.95, 0.99))
+
+    def summary(self):
+        rows = []
+        for name, buf in self.samples.items():
+            if buf:
+                p50, p95, p99 = self.percentiles(name)
+                rows.append((name, len(buf), sum(buf) / len(buf), p50, p95, p99))
+        return rows
+
+    def draw(self, screen, font, x=8, y=8, color=(255, 255, 0)):
+        # the table is rendered into one surface at most every REFRESH
+        # seconds, so the overlay costs a single blit in the frames it measures
+        if not self.enabled:
+            return None
+        now = time.perf_counter()
+        key = (font, tuple(color))
+        if self.overlay is None or key != self.overlay_key or now - self.overlay_at >= self.REFRESH:
+            self.overlay = self._render(font, color)
+            self.overlay_key = key
+            self.overlay_at = now
+        return screen.blit(self.overlay, (x, y))
+
+    def _render(self, font, color):
+        lines = [f"{'section':<14}{'p50':>7}{'p95':>7}{'p99':>7}  ms"]
+        for name, _, _, p50, p95, p99 in self.summary():
+            lines.append(f"{name:<14}{p50:7.2f}{p95:7.2f}{p99:7.2f}")
+        rendered = [font.render(line, True, color) for line in lines]
+        step = font.get_linesize()
+        surf = pg.Surface((max(s.get_width() for s in rendered), step * len(rendered)), pg.SRCALPHA)
+        for i, s in enumerate(rendered):
+            surf.blit(s, (0, i * step))
+        return surf
+
+    def export(self, path):
+        # .json writes Chrome trace events (chrome://tracing, Perfetto) when
+        # tracing is on and the summary otherwise; anything else is CSV
+        if path.endswith(".json"):
+            with open(path, "w") as f:
+                if self.events is not None:
+                    json.dump({"traceEvents": self.events, "displayTimeUnit": "ms"}, f)
+                else:
+                    json.dump([dict(zip(("name", "count", "mean", "p50", "p95", "p99"), row))
+                               for row in self.summary()], f, indent=1)
+            return
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(("name", "count", "mean_ms", "p50_ms", "p95_ms", "p99_ms"))
+            for row in self.summary():
+                writer.writerow([row[0], row[1]] + [f"{v:.4f}" for v in row[2:]])
@@ -0,0 +1,55 @@
+from collections import OrderedDict
+
+import pygame as pg
+
+
+class TextCache:
+    # rendered text surfaces, least recently used evicted first
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, msg, color, antialias=True):
+        key = (font, msg, tuple(color), antialias)
+        surf = self.entries.get(key)
+        if surf is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return surf
+        self.misses += 1
+        surf = font.render(msg, antialias, color)
+        self.entries[key] = surf
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return surf
+
+
+class GlyphAtlas:
+    # one surface per character, so numbers that change every frame (score,
+    # FPS) are composed from cached glyphs instead of being re-rasterized
+    def __init__(self, font, color=(255,255,255), chars="0123456789", antialias=True):
+        self.font = font
+        self.color = color
+        self.antialias = antialias
+        self.glyphs = {}
+        for ch in chars:
+            self.glyph(ch)
+
+    def glyph(self, ch):
+        g = self.glyphs.get(ch)
+        if g is None:
+            g = self.glyphs[ch] = self.font.render(ch, self.antialias, self.color)
+        return g
+
+    def draw(self, screen, msg, x, y):
+        seq = []
+        start = x
+        for ch in msg:
+            g = self.glyph(ch)
+            seq.append((g, (x, y)))
+            x += g.get_width()
+        screen.blits(seq, doreturn=False)
+        return pg.Rect(start, y, x - start, self.font.get_height())
+
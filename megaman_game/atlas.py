@@ -0,0 +1,154 @@
+# atlas.py
+# Empacota os frames de cada personagem num único PNG (atlas) com um índice
+# JSON, e carrega esse atlas em tempo de execução fatiando com subsurface.
+#
+# Gerar/atualizar os atlas (de dentro da pasta megaman_game):
+#     python atlas.py
+import json
+import math
+import os
+import sys
+
+import pygame
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+ASSETS_DIR = os.path.join(BASE_DIR, "assets")
+ATLAS_DIR = os.path.join(ASSETS_DIR, "atlas")
+PERSONAGENS = ("megaman1", "megamanx")
+VERSAO = 1
+MARGEM = 1  # pixels vazios entre frames, evita vazamento em flips/escala
+
+_carregados = {}
+
+
+# --------------------
+# Empacotador (offline)
+# --------------------
+def frames_da_pasta(caminho_base):
+    """Arquivos .png de uma animação, na mesma ordem que os jogos usavam.
+
+    Prefere a pasta *_cortado se ela existir e tiver frames.
+    """
+    for caminho in (caminho_base + "_cortado", caminho_base):
+        if os.path.isdir(caminho):
+            arquivos = [os.path.join(caminho, arq) for arq in sorted(os.listdir(caminho))
+                        if arq.lower().endswith(".png")]
+            if arquivos:
+                return arquivos
+    return []
+
+
+def posicionar(tamanhos):
+    """Empacotamento em prateleiras: frames mais altos primeiro, linha a linha.
+
+    Recebe [(w, h)] e devolve ([(x, y)] na mesma ordem, (largura, altura)).
+    """
+    area = sum((w + MARGEM) * (h + MARGEM) for w, h in tamanhos)
+    limite = max(max(w for w, _ in tamanhos), math.ceil(math.sqrt(area)))
+    posicoes = [None] * len(tamanhos)
+    x = y = altura_linha = largura = 0
+    for i in sorted(range(len(tamanhos)), key=lambda i: -tamanhos[i][1]):
+        w, h = tamanhos[i]
+        if x + w > limite:
+            x = 0
+            y += altura_linha + MARGEM
+            altura_linha = 0
+        posicoes[i] = (x, y)
+        x += w + MARGEM
+        altura_linha = max(altura_linha, h)
+        largura = max(largura, x - MARGEM)
+    return posicoes, (largura, y + altura_linha)
+
+
+def empacotar(personagem, destino=ATLAS_DIR):
+    """Gera <destino>/<personagem>.png e .json a partir de assets/<personagem>/*."""
+    origem = os.path.join(ASSETS_DIR, personagem)
+    entradas = []   # (animação, surface)
+    for anim in sorted(os.listdir(origem)):
+        if anim.endswith("_cortado") or not os.path.isdir(os.path.join(origem, anim)):
+            continue
+        for arq in frames_da_pasta(os.path.join(origem, anim)):
+            entradas.append((anim, pygame.image.load(arq)))
+    if not entradas:
+        raise ValueError(f"nenhum frame em {origem}")
+
+    posicoes, tamanho = posicionar([img.get_size() for _, img in entradas])
+    atlas = pygame.Surface(tamanho, pygame.SRCALPHA)
+    atlas.fill((0, 0, 0, 0))
+    indice = {}
+    for (anim, img), (x, y) in zip(entradas, posicoes):
+        atlas.blit(img, (x, y))
+        indice.setdefault(anim, []).append([x, y, img.get_width(), img.get_height()])
+
+    os.makedirs(destino, exist_ok=True)
+    png = os.path.join(destino, personagem + ".png")
+    pygame.image.save(atlas, png)
+    with open(os.path.join(destino, personagem + ".json"), "w") as f:
+        json.dump({"versao": VERSAO, "imagem": personagem + ".png",
+                   "tamanho": list(tamanho), "animacoes": indice}, f)
+    return png, len(entradas)
+
+
+# --------------------
+# Carregador (em jogo)
+# --------------------
+def carregar_atlas(personagem, pasta=ATLAS_DIR):
+    """{animação: [Surface]} de um personagem, lido do atlas uma vez só.
+
+    Os frames são subsurfaces do atlas (sem cópia de pixels). Se o atlas
+    não existir, cai para os PNGs soltos em assets/<personagem>. Cada
+    chamada recebe listas novas, então o chamador pode alterá-las.
+    """
+    chave = (personagem, pasta)
+    if chave not in _carregados:
+        _carregados[chave] = _ler_atlas(personagem, pasta)
+    return {anim: list(frames) for anim, frames in _carregados[chave].items()}
+
+
+def _ler_atlas(personagem, pasta):
+    indice_json = os.path.join(pasta, personagem + ".json")
+    try:
+        with open(indice_json) as f:
+            indice = json.load(f)
+    except FileNotFoundError:
+        print(f"[AVISO] Atlas não encontrado: {os.path.relpath(indice_json)} "
+              f"(rode python atlas.py). Carregando os PNGs soltos.")
+        anims = _carregar_pastas(personagem)
+    else:
+        if indice.get("versao") != VERSAO:
+            raise ValueError(f"{indice_json}: versão de atlas não suportada")
+        atlas = pygame.image.load(os.path.join(pasta, indice["imagem"]))
+        if pygame.display.get_surface() is not None:
+            atlas = atlas.convert_alpha()
+        anims = {anim: [atlas.subsurface(r) for r in rects]
+                 for anim, rects in indice["animacoes"].items()}
+        total = sum(len(v) for v in anims.values())
+        print(f"✅ Atlas {personagem}: {total} frame(s) em {len(anims)} animação(ões).")
+    return anims
+
+
+def _carregar_pastas(personagem):
+    origem = os.path.join(ASSETS_DIR, personagem)
+    anims = {}
+    if not os.path.isdir(origem):
+        return anims
+    for anim in sorted(os.listdir(origem)):
+        if anim.endswith("_cortado"):
+            continue
+        frames = [pygame.image.load(arq) for arq in frames_da_pasta(os.path.join(origem, anim))]
+        if pygame.display.get_surface() is not None:
+            frames = [f.convert_alpha() for f in frames]
+        if frames:
+            anims[anim] = frames
+    return anims
+
+
+def main(argv=None):
+    personagens = (argv if argv is not None else sys.argv[1:]) or PERSONAGENS
+    for personagem in personagens:
+        png, n = empacotar(personagem)
+        print(f"[OK] {os.path.relpath(png)}: {n} frame(s)")
+
+
+if __name__ == "__main__":
+    main()
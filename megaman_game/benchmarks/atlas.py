@@ -0,0 +1,102 @@
+# Carregamento dos sprites: PNGs soltos (como os jogos faziam) contra o atlas.
+# Conta arquivos abertos / diretórios listados e mede o tempo de carga.
+# Rodar de dentro da pasta megaman_game:  python -m benchmarks.atlas
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import builtins
+import contextlib
+import io
+import time
+
+import pygame
+
+import atlas
+
+ASSETS_DIR = atlas.ASSETS_DIR
+ANIMACOES = {
+    "megaman1": ("walk", "jump", "shoot"),
+    "megamanx": ("idle", "walk", "run", "jump", "shoot"),
+}
+REPETICOES = 50
+
+
+class Contador:
+    # embrulha as chamadas que tocam o disco enquanto está ativo
+    ALVOS = ((pygame.image, "load"), (os, "listdir"), (os.path, "exists"),
+             (os.path, "isdir"), (builtins, "open"))
+
+    def __init__(self):
+        self.chamadas = dict.fromkeys((nome for _, nome in self.ALVOS), 0)
+
+    def __enter__(self):
+        self.originais = [(mod, nome, getattr(mod, nome)) for mod, nome in self.ALVOS]
+        for mod, nome, fn in self.originais:
+            setattr(mod, nome, self._contar(nome, fn))
+        return self
+
+    def __exit__(self, *exc):
+        for mod, nome, fn in self.originais:
+            setattr(mod, nome, fn)
+        return False
+
+    def _contar(self, nome, fn):
+        def chamada(*args, **kwargs):
+            self.chamadas[nome] += 1
+            return fn(*args, **kwargs)
+        return chamada
+
+    @property
+    def arquivos(self):
+        return self.chamadas["load"] + self.chamadas["open"]
+
+    @property
+    def sondagens(self):
+        return self.chamadas["listdir"] + self.chamadas["exists"] + self.chamadas["isdir"]
+
+
+def antes(personagem):
+    # o que carregar_sprites / carregar_sprites_try faziam a cada construção
+    anims = {}
+    for anim in ANIMACOES[personagem]:
+        base = os.path.join(ASSETS_DIR, personagem, anim)
+        for caminho in (base + "_cortado", base):
+            if os.path.exists(caminho) and os.path.isdir(caminho):
+                frames = [pygame.image.load(os.path.join(caminho, arq)).convert_alpha()
+                          for arq in sorted(os.listdir(caminho)) if arq.lower().endswith(".png")]
+                if frames:
+                    anims[anim] = frames
+                    break
+    return anims
+
+
+def depois(personagem):
+    return atlas.carregar_atlas(personagem)
+
+
+def medir(carregar, personagem, frio):
+    # o carregador avisa no stdout a cada leitura do atlas
+    with Contador() as c, contextlib.redirect_stdout(io.StringIO()):
+        t0 = time.perf_counter()
+        for _ in range(REPETICOES):
+            if frio:
+                atlas._carregados.clear()
+            carregar(personagem)
+        t = (time.perf_counter() - t0) / REPETICOES
+    return t, c.arquivos / REPETICOES, c.sondagens / REPETICOES
+
+
+def main():
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    print(f"{'':>9} {'':>16} {'ms':>7} {'arquivos':>9} {'sondagens':>10}")
+    for personagem in ANIMACOES:
+        for rotulo, carregar, frio in (("PNGs soltos", antes, True),
+                                       ("atlas (frio)", depois, True),
+                                       ("atlas (cache)", depois, False)):
+            t, arquivos, sondagens = medir(carregar, personagem, frio)
+            print(f"{personagem:>9} {rotulo:>16} {t * 1000:7.3f} {arquivos:9.1f} {sondagens:10.1f}")
+
+
+if __name__ == "__main__":
+    main()
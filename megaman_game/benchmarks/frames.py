@@ -0,0 +1,66 @@
+# Alocações de Surface por quadro: copy()+flip() por quadro contra o FrameStore.
+# Rodar de dentro da pasta megaman_game:  python -m benchmarks.frames
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import time
+
+import pygame
+
+from frames import FrameStore
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+QUADROS = 6000
+
+
+def carregar(pasta):
+    frames = []
+    for arq in sorted(os.listdir(pasta)):
+        if arq.lower().endswith(".png"):
+            frames.append(pygame.image.load(os.path.join(pasta, arq)).convert_alpha())
+    return frames
+
+
+def antes(frames, direcoes, classico):
+    # o que MegaMan.atualizar / MegaManX.update faziam a cada quadro
+    alocs = 0
+    for i, direcao in enumerate(direcoes):
+        img = frames[i % len(frames)].copy()
+        alocs += 1
+        if direcao == (1 if classico else -1):
+            img = pygame.transform.flip(img, True, False)
+            alocs += 1
+        if classico and direcao == -1:
+            img = pygame.transform.flip(img, True, False)
+            alocs += 1
+    return alocs
+
+
+def depois(store, n, direcoes):
+    for i, direcao in enumerate(direcoes):
+        store.get("walk", direcao)[i % n]
+
+
+def main():
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    direcoes = [1 if (i // 120) % 2 == 0 else -1 for i in range(QUADROS)]
+    for nome, pasta, classico in (("classic", "megaman1", True), ("x", "megamanx", False)):
+        frames = carregar(os.path.join(BASE_DIR, "assets", pasta, "walk"))
+        store = FrameStore({"walk": frames}, "left" if classico else "right")
+
+        t0 = time.perf_counter()
+        alocs = antes(frames, direcoes, classico)
+        t_antes = (time.perf_counter() - t0) / QUADROS
+        t0 = time.perf_counter()
+        depois(store, len(frames), direcoes)
+        t_depois = (time.perf_counter() - t0) / QUADROS
+
+        w, h = frames[0].get_size()
+        print(f"{nome:>8}: antes {alocs / QUADROS:.2f} Surfaces/quadro "
+              f"(~{alocs / QUADROS * w * h * 4 / 1024:.1f} KiB), {t_antes * 1e6:.1f} us | "
+              f"depois 0 Surfaces/quadro, {t_depois * 1e6:.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+# Custo por quadro da fase em tiles conforme a largura da fase cresce:
+# chunks pré-renderizados e descarregados (nivel.Mapa) contra desenhar todos
+# os tiles da fase a cada quadro. Também mede memória e sondas de colisão.
+# Rodar de dentro da pasta megaman_game:  python -m benchmarks.nivel
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import random
+import time
+
+import pygame
+
+from nivel import CORES, TILE, Camera, FonteProcedural, Mapa
+
+LARGURA, ALTURA = 800, 400
+COLUNAS_POR_TELA = LARGURA // TILE
+TELAS = (1, 10, 100, 1000)
+QUADROS = 600
+VELOCIDADE = 12     # pixels de câmera por quadro
+SONDAS = 100000
+
+
+def ingenuo(tela, mapa, cam_x):
+    # sem cache nem corte: todos os tiles da fase, todo quadro
+    for col in range(mapa.colunas):
+        for lin in range(mapa.linhas):
+            cor = CORES.get(mapa.tile(col, lin))
+            if cor is not None:
+                tela.fill(cor, (col * TILE - cam_x, lin * TILE, TILE, TILE))
+
+
+def chunks(tela, mapa, cam_x):
+    mapa.atualizar(cam_x, LARGURA)
+    mapa.desenhar(tela, cam_x)
+
+
+def medir(desenhar, telas, quadros):
+    tela = pygame.display.get_surface()
+    mapa = Mapa(FonteProcedural(telas * COLUNAS_POR_TELA, semente=1), fundo=(30, 120, 255))
+    camera = Camera(LARGURA, mapa.largura_px)
+    # começa no meio da fase e anda para a direita (ida e volta nas curtas)
+    x = mapa.largura_px // 2
+    direcao = 1
+    tempos = []
+    pico_bytes = pico_chunks = 0
+    for _ in range(quadros):
+        x += VELOCIDADE * direcao
+        if not 0 <= x <= mapa.largura_px:
+            direcao = -direcao
+        camera.seguir(x)
+        t0 = time.perf_counter()
+        tela.fill((30, 120, 255))
+        desenhar(tela, mapa, camera.x)
+        tempos.append(time.perf_counter() - t0)
+        s = mapa.stats()
+        pico_bytes = max(pico_bytes, s["bytes_imagem"])
+        pico_chunks = max(pico_chunks, s["chunks_dados"])
+    tempos.sort()
+    media = sum(tempos) / len(tempos)
+    return media * 1000, tempos[int(len(tempos) * 0.99)] * 1000, pico_chunks, pico_bytes, mapa, camera
+
+
+def sondas(mapa, camera):
+    # como no jogo: pontos perto do jogador, dentro da área da câmera
+    rng = random.Random(0)
+    pontos = [(camera.x + rng.randrange(LARGURA), rng.randrange(mapa.altura_px)) for _ in range(SONDAS)]
+    solido = mapa.solido
+    t0 = time.perf_counter()
+    for x, y in pontos:
+        solido(x, y)
+    return (time.perf_counter() - t0) / SONDAS * 1e9
+
+
+def main():
+    pygame.init()
+    pygame.display.set_mode((LARGURA, ALTURA))
+    print(f"{'telas':>6} {'modo':>8} {'média ms':>9} {'p99 ms':>8} {'chunks':>7} {'KiB img':>8} {'ns/sonda':>9}")
+    for telas in TELAS:
+        media, p99, pico_chunks, pico_bytes, mapa, camera = medir(chunks, telas, QUADROS)
+        print(f"{telas:6d} {'chunks':>8} {media:9.3f} {p99:8.3f} {pico_chunks:7d} "
+              f"{pico_bytes / 1024:8.0f} {sondas(mapa, camera):9.0f}")
+        if telas <= 100:
+            # o ingênuo cresce com a fase; poucas amostras bastam
+            media, p99 = medir(ingenuo, telas, 20)[:2]
+            print(f"{telas:6d} {'ingênuo':>8} {media:9.3f} {p99:8.3f}")
+
+
+if __name__ == "__main__":
+    main()
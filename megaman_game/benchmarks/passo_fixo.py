@@ -0,0 +1,70 @@
+# Mesma entrada, taxas de desenho diferentes: com passo fixo as trajetórias
+# saem idênticas; com um passo por quadro (como era antes) o jogo anda mais
+# devagar ou mais rápido conforme a taxa. Também mostra o limite de passos
+# por quadro quando a máquina não aguenta (5 quadros por segundo).
+# Rodar de dentro da pasta megaman_game:  python -m benchmarks.passo_fixo
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import collections
+
+import pygame
+
+import megaman_classic
+import megaman_x
+from passo_fixo import PassoFixo
+
+TAXAS = (30, 60, 144)
+SEGUNDOS = 5
+
+
+def roteiro(tick):
+    # corre para a direita atirando e pula a cada 40 passos
+    teclas = collections.defaultdict(bool)
+    teclas[pygame.K_RIGHT] = True
+    teclas[pygame.K_z] = True
+    teclas[pygame.K_SPACE] = tick % 40 == 0
+    return teclas
+
+
+def jogador(jogo):
+    return jogo.jogador if hasattr(jogo, "jogador") else jogo.player
+
+
+def rodar(modulo, hz_desenho, fixo=True, segundos=SEGUNDOS):
+    jogo = modulo.Jogo(tela=pygame.Surface((modulo.LARGURA, modulo.ALTURA)))
+    relogio = PassoFixo(modulo.HZ)
+    trajetoria = []
+    tick = 0
+    for _ in range(int(segundos * hz_desenho)):
+        passos = relogio.avancar(1.0 / hz_desenho) if fixo else 1
+        for _ in range(passos):
+            jogo.passo(roteiro(tick))
+            tick += 1
+            trajetoria.append(jogador(jogo).rect.topleft)
+        jogo.desenhar(relogio.alfa if fixo else 1.0)
+    return trajetoria, relogio
+
+
+def main():
+    pygame.init()
+    for modulo in (megaman_classic, megaman_x):
+        print(f"== {modulo.__name__} ({SEGUNDOS} s de tempo real, física a {modulo.HZ} Hz)")
+        referencia = None
+        for hz in TAXAS:
+            traj, _ = rodar(modulo, hz)
+            referencia = referencia or traj
+            n = min(len(traj), len(referencia))
+            iguais = traj[:n] == referencia[:n]
+            print(f"   passo fixo  {hz:3d} Hz: {len(traj):4d} passos, x final {traj[-1][0]:5d}, "
+                  f"trajetória igual à de {TAXAS[0]} Hz: {'sim' if iguais else 'NÃO'}")
+        for hz in TAXAS:
+            traj, _ = rodar(modulo, hz, fixo=False)
+            print(f"   1 por quadro {hz:3d} Hz: {len(traj):4d} passos, x final {traj[-1][0]:5d}")
+        traj, relogio = rodar(modulo, 5)
+        print(f"   passo fixo    5 Hz: {len(traj):4d} passos (máx. {relogio.max_passos}/quadro), "
+              f"{relogio.descartado:.2f} s descartados")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+# Tiros como pygame.sprite.Sprite (uma Surface por tiro, Group.update e
+# Group.draw) contra projeteis.Projeteis (arrays + um Surface.blits).
+# Rodar de dentro da pasta megaman_game:  python -m benchmarks.projeteis
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import random
+import time
+
+import pygame
+
+from projeteis import Projeteis
+
+LARGURA, ALTURA = 800, 400
+QUANTIDADES = (10, 100, 500, 1000)
+QUADROS = 200
+TIPOS = {"tiro": ((255, 220, 80), (12, 5))}
+
+
+class Tiro(pygame.sprite.Sprite):
+    # como o Tiro dos dois jogos era antes
+    def __init__(self, x, y, vel):
+        super().__init__()
+        self.image = pygame.Surface((12, 5), pygame.SRCALPHA)
+        self.image.fill((255, 220, 80))
+        self.rect = self.image.get_rect(center=(x, y))
+        self.vel = vel
+
+    def update(self):
+        self.rect.x += self.vel
+        if self.rect.right < 0 or self.rect.left > LARGURA:
+            self.kill()
+
+
+def posicoes(n):
+    # vão e voltam devagar, então a população fica estável e na tela
+    rng = random.Random(n)
+    return [(rng.randrange(100, LARGURA - 100), rng.randrange(ALTURA), rng.choice((-1, 1)))
+            for _ in range(n)]
+
+
+def antes(tela, n):
+    grupo = pygame.sprite.Group()
+    t0 = time.perf_counter()
+    for x, y, vel in posicoes(n):
+        grupo.add(Tiro(x, y, vel))
+    disparo = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    for _ in range(QUADROS):
+        grupo.update()
+        grupo.draw(tela)
+    return disparo / n, (time.perf_counter() - t0) / QUADROS, n
+
+
+def depois(tela, n):
+    tiros = Projeteis(TIPOS)
+    t0 = time.perf_counter()
+    for x, y, vel in posicoes(n):
+        tiros.disparar(x, y, vel, "tiro", 1e9)
+    disparo = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    for _ in range(QUADROS):
+        tiros.atualizar()
+        tiros.desenhar(tela)
+    return disparo / n, (time.perf_counter() - t0) / QUADROS, len(TIPOS)
+
+
+def main():
+    pygame.init()
+    tela = pygame.display.set_mode((LARGURA, ALTURA))
+    print(f"{'tiros':>6} {'modo':>10} {'us/disparo':>11} {'ms/quadro':>10} {'Surfaces':>9}")
+    for n in QUANTIDADES:
+        for rotulo, fn in (("Sprite", antes), ("Projeteis", depois)):
+            disparo, quadro, surfaces = fn(tela, n)
+            print(f"{n:6d} {rotulo:>10} {disparo * 1e6:11.2f} {quadro * 1000:10.3f} {surfaces:9d}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+# Custo de preparar os efeitos sonoros: WAV escrito amostra a amostra (como
+# os jogos faziam no import) contra a síntese em memória de sons.py.
+# Rodar de dentro da pasta megaman_game:  python -m benchmarks.sons
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import struct
+import tempfile
+import time
+import wave
+
+import numpy as np
+import pygame
+
+from sons import Som
+
+# os cinco sons dos dois jogos
+SONS = (("shoot", 880, 0.1, "quadrada"), ("jump", 440, 0.25, "quadrada"),
+        ("x_shoot", 1100, 0.09, "quadrada"), ("x_jump", 520, 0.18, "senoide"),
+        ("x_run", 140, 0.04, "quadrada"))
+
+
+def antes(pasta):
+    # gerar_som / gerar_som_local + pygame.mixer.Sound(caminho)
+    for nome, freq, dur, tipo in SONS:
+        taxa = 44100
+        t = np.linspace(0, dur, int(taxa * dur), False)
+        if tipo == "quadrada":
+            onda = 0.5 * np.sign(np.sin(2 * np.pi * freq * t))
+        else:
+            onda = 0.5 * np.sin(2 * np.pi * freq * t)
+        onda = np.int16(onda * 32767)
+        caminho = os.path.join(pasta, f"{nome}.wav")
+        with wave.open(caminho, "w") as f:
+            f.setparams((1, 2, taxa, 0, "NONE", "not compressed"))
+            for s in onda:
+                f.writeframes(struct.pack("h", s))
+        pygame.mixer.Sound(caminho)
+
+
+def depois(cache_dir=None, tocar=True):
+    sons = [Som(nome, freq, dur, tipo, cache_dir=cache_dir) for nome, freq, dur, tipo in SONS]
+    if tocar:
+        for som in sons:
+            som.carregar()
+    return sons
+
+
+def medir(fn, *args, repeticoes=5):
+    melhor = float("inf")
+    for _ in range(repeticoes):
+        t0 = time.perf_counter()
+        fn(*args)
+        melhor = min(melhor, time.perf_counter() - t0)
+    return melhor * 1000
+
+
+def main():
+    pygame.mixer.pre_init(44100, -16, 2, 512)
+    pygame.init()
+    pygame.mixer.init()
+    with tempfile.TemporaryDirectory() as pasta:
+        linhas = [
+            ("WAV amostra a amostra", medir(antes, pasta, repeticoes=2)),
+            ("memória, só criar (lazy)", medir(depois, None, False)),
+            ("memória, todos tocados", medir(depois)),
+        ]
+        cache = os.path.join(pasta, "cache")
+        t0 = time.perf_counter()
+        depois(cache)
+        linhas.append(("cache em disco, 1a vez", (time.perf_counter() - t0) * 1000))
+        linhas.append(("cache em disco, depois", medir(depois, cache)))
+    print(f"{len(SONS)} sons")
+    for rotulo, ms in linhas:
+        print(f"{rotulo:>26}: {ms:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+# Tempo de inicialização dos dois jogos: imports mais pesados (python -X
+# importtime) e tempo até o primeiro quadro, cada medida num processo novo.
+# Rodar de dentro da pasta megaman_game:  python -m benchmarks.startup
+import json
+import os
+import subprocess
+import sys
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+JOGOS = (("megaman_classic", "jogador"), ("megaman_x", "player"))
+TOP = 6
+
+# roda no processo filho; cada etapa grava o tempo desde o início do script
+PRIMEIRO_QUADRO = """
+import time, json, collections
+t = [("inicio", time.perf_counter())]
+import pygame
+import {modulo} as jogo_mod
+t.append(("import", time.perf_counter()))
+janela_no_import = pygame.display.get_init()
+jogo = jogo_mod.Jogo()
+jogo.iniciar()
+t.append(("pygame.init", time.perf_counter()))
+jogo.tela
+t.append(("janela", time.perf_counter()))
+jogo.{jogador}
+t.append(("sprites", time.perf_counter()))
+jogo.passo(collections.defaultdict(bool))
+jogo.desenhar()
+pygame.display.flip()
+t.append(("1o quadro", time.perf_counter()))
+print(json.dumps({{"etapas": [(n, (v - t[0][1]) * 1000) for n, v in t[1:]],
+                  "janela_no_import": janela_no_import}}))
+"""
+
+
+def ambiente():
+    env = dict(os.environ)
+    env.setdefault("SDL_VIDEODRIVER", "dummy")
+    env.setdefault("SDL_AUDIODRIVER", "dummy")
+    env["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+    return env
+
+
+def imports(modulo):
+    # (total_us, [(cumulativo_us, nome)] dos imports diretos do módulo),
+    # lidos de python -X importtime: os filhos vêm antes do pai, com dois
+    # espaços a mais de recuo
+    saida = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {modulo}"],
+                           cwd=BASE_DIR, env=ambiente(), capture_output=True, text=True)
+    filhos = []
+    for linha in saida.stderr.splitlines():
+        if not linha.startswith("import time:") or "self [us]" in linha:
+            continue
+        _, cumulativo, nome = linha[len("import time:"):].split("|")
+        recuo = len(nome) - len(nome.lstrip()) - 1
+        nome = nome.strip()
+        if recuo == 2:
+            filhos.append((int(cumulativo), nome))
+        elif recuo == 0:
+            if nome == modulo:
+                return int(cumulativo), filhos
+            filhos = []
+    raise RuntimeError(f"{modulo} não aparece em -X importtime:\n{saida.stderr[-500:]}")
+
+
+def primeiro_quadro(modulo, jogador):
+    codigo = PRIMEIRO_QUADRO.format(modulo=modulo, jogador=jogador)
+    t0 = time.perf_counter()
+    saida = subprocess.run([sys.executable, "-c", codigo], cwd=BASE_DIR, env=ambiente(),
+                           capture_output=True, text=True, check=True)
+    total = (time.perf_counter() - t0) * 1000
+    dados = json.loads(saida.stdout.strip().splitlines()[-1])
+    return dados, total
+
+
+def main():
+    for modulo, jogador in JOGOS:
+        total, filhos = imports(modulo)
+        print(f"== {modulo}: import {total / 1000:.1f} ms (python -X importtime)")
+        for cumulativo, nome in sorted(filhos, reverse=True)[:TOP]:
+            print(f"   {cumulativo / 1000:7.2f} ms  {nome}")
+
+        dados, total = primeiro_quadro(modulo, jogador)
+        print(f"   janela aberta no import: {'sim' if dados['janela_no_import'] else 'não'}")
+        for nome, ms in dados["etapas"]:
+            print(f"   {nome:>12}: {ms:7.1f} ms")
+        print(f"   processo inteiro (com o interpretador): {total:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,24 @@
+import pygame
+
+
+class FrameStore:
+    """Frames de cada animação já virados para os dois lados.
+
+    Os flips são feitos uma vez só, no carregamento; get() devolve sempre
+    as mesmas surfaces, sem copiar nada por quadro.
+    """
+
+    def __init__(self, animacoes, source_facing="right"):
+        self.frames = {}
+        for nome, frames in animacoes.items():
+            virados = [pygame.transform.flip(f, True, False) for f in frames]
+            if source_facing == "right":
+                direita, esquerda = list(frames), virados
+            else:
+                direita, esquerda = virados, list(frames)
+            self.frames[(nome, 1)] = direita
+            self.frames[(nome, -1)] = esquerda
+
+    def get(self, nome, direcao):
+        # direcao: 1 = direita, -1 = esquerda
+        return self.frames[(nome, direcao)]
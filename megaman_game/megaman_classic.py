@@ -1,74 +1,40 @@
 import pygame
-import sys
 import os
-import numpy as np
-import wave
-import struct
+import sys
+import argparse
 
-# --- INICIALIZAÇÕES IMPORTANTES ---
-pygame.mixer.pre_init(44100, -16, 2, 512)
-pygame.init()
-pygame.mixer.init()
+from atlas import carregar_atlas
+from frames import FrameStore
+from nivel import Camera, FonteTexto, Mapa, QUEDA_MAX
+from passo_fixo import PassoFixo, interpolar
+from profiler import Profiler
+from projeteis import Projeteis
+from sons import Som
 
 # --- CONFIGURAÇÕES ---
+# (importar este módulo não abre janela nem inicia o mixer; ver Jogo)
 LARGURA, ALTURA = 800, 400
-TELA = pygame.display.set_mode((LARGURA, ALTURA))
-pygame.display.set_caption("Mega Man Clássico - Corrigido")
-FPS = 60
+TITULO = "Mega Man Clássico - Corrigido"
+HZ = 60     # passos de simulação por segundo; velocidades são por passo
+FPS = 60    # limite de quadros desenhados por segundo (0 = sem limite)
 
-# --- CORES E CHÃO ---
+# --- CORES E FASE ---
 AZUL = (50, 100, 255)
-CHAO = ALTURA - 80
-
-# --- GERAR SONS ---
-def gerar_som(nome, frequencia, duracao, tipo="quadrada"):
-    os.makedirs("assets/sounds", exist_ok=True)
-    taxa = 44100
-    t = np.linspace(0, duracao, int(taxa * duracao), False)
-    if tipo == "quadrada":
-        onda = 0.5 * np.sign(np.sin(2 * np.pi * frequencia * t))
-    elif tipo == "senoide":
-        onda = 0.5 * np.sin(2 * np.pi * frequencia * t)
-    onda = np.int16(onda * 32767)
-    caminho = f"assets/sounds/{nome}.wav"
-    with wave.open(caminho, "w") as f:
-        f.setparams((1, 2, taxa, 0, "NONE", "not compressed"))
-        for s in onda:
-            f.writeframes(struct.pack("h", s))
-    return caminho
-
-# Sons simples
-som_tiro = gerar_som("shoot", 880, 0.1)
-som_pulo = gerar_som("jump", 440, 0.25)
-
-# --- FUNÇÃO PARA CARREGAR SPRITES ---
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-
-def carregar_sprites(caminho):
-    sprites = []
-    if not os.path.exists(caminho):
-        print(f"[AVISO] Pasta não encontrada: {caminho}")
-        return sprites
-    for arquivo in sorted(os.listdir(caminho)):
-        if arquivo.lower().endswith(".png"):
-            imagem = pygame.image.load(os.path.join(caminho, arquivo)).convert_alpha()
-            sprites.append(imagem)
-    print(f"✅ {caminho}: {len(sprites)} sprite(s) carregado(s).")
-    return sprites
-
-# --- CLASSE TIRO ---
-class Tiro(pygame.sprite.Sprite):
-    def __init__(self, x, y, direcao):
-        super().__init__()
-        self.image = pygame.Surface((10, 4))
-        self.image.fill((255, 255, 0))
-        self.rect = self.image.get_rect(center=(x, y))
-        self.velocidade = 10 * direcao
-
-    def update(self):
-        self.rect.x += self.velocidade
-        if self.rect.right < 0 or self.rect.left > LARGURA:
-            self.kill()
+CEU = (40, 120, 255)
+NIVEL = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "niveis", "fase1.txt")
+
+# --- SONS ---
+# sintetizados na memória no primeiro play (ver sons.py)
+SOM_TIRO = Som("shoot", 880, 0.1)
+SOM_PULO = Som("jump", 440, 0.25)
+
+# --- TIROS ---
+# cada tipo tem uma Surface só, compartilhada (ver projeteis.py)
+TIPOS_TIRO = {"tiro": ((255, 255, 0), (10, 4))}
+VEL_TIRO = 10
+INTERVALO_TIRO = 18     # passos entre tiros (300 ms a 60 Hz)
+# com a câmera rolando, o tiro some depois de cruzar uma tela
+ALCANCE_TIRO = LARGURA
 
 # -------------------------
 # Classe MegaMan (substituir a sua)
@@ -81,13 +47,15 @@ class MegaMan(pygame.sprite.Sprite):
     SOURCE_FACING = "left"        # experimente "left" ou "right"
     REVERSE_WALK_FRAMES = False   # experimente True se a caminhada ficar estranha
 
-    def __init__(self):
+    def __init__(self, mapa):
         super().__init__()
 
+        # todos os frames vêm de um atlas só (assets/atlas/megaman1.png)
+        sprites = carregar_atlas("megaman1")
         self.animacoes = {
-            "walk": carregar_sprites(os.path.join(BASE_DIR, "assets", "megaman1", "walk")),
-            "jump": carregar_sprites(os.path.join(BASE_DIR, "assets", "megaman1", "jump")),
-            "shoot": carregar_sprites(os.path.join(BASE_DIR, "assets", "megaman1", "shoot")),
+            "walk": sprites.get("walk", []),
+            "jump": sprites.get("jump", []),
+            "shoot": sprites.get("shoot", []),
         }
 
         # se walk estiver vazia, cria placeholder
@@ -101,39 +69,50 @@ class MegaMan(pygame.sprite.Sprite):
 
         # usa walk como idle se não houver idle
         self.animacoes["idle"] = self.animacoes["walk"]
+        # frames para direita/esquerda prontos de uma vez (sem copy/flip por quadro)
+        self.quadros = FrameStore(self.animacoes, MegaMan.SOURCE_FACING)
 
         self.estado = "idle"
         self.frame = 0.0
         self.image = self.animacoes["idle"][0]
-        self.rect = self.image.get_rect(midbottom=(100, CHAO))
+        # posição e colisões vêm da fase (nivel.Mapa)
+        self.mapa = mapa
+        self.rect = self.image.get_rect(midbottom=mapa.inicio_px)
         self.vel_y = 0
         self.no_chao = True
         self.direcao = 1    # 1 = direita, -1 = esquerda
-        self.anim_timer = 0
-        # sons (supondo gerados anteriormente)
-        try:
-            self.som_tiro = pygame.mixer.Sound(som_tiro)
-            self.som_pulo = pygame.mixer.Sound(som_pulo)
-        except Exception:
-            self.som_tiro = None
-            self.som_pulo = None
+        self.anim_timer = 0     # passos simulados (também serve de relógio)
+        self.ultimo_tiro = -INTERVALO_TIRO
+        # posição no passo anterior, para desenhar interpolado
+        self.anterior = self.rect.topleft
+        # sons (sem mixer, play() não faz nada)
+        self.som_tiro = SOM_TIRO
+        self.som_pulo = SOM_PULO
 
     def atualizar(self, teclas, tiros):
         velocidade = 5
         gravidade = 1
         self.anim_timer += 1
+        self.anterior = self.rect.topleft
 
-        # Movimento horizontal
+        # Movimento horizontal (paredes e bordas da fase)
+        dx = 0
         if teclas[pygame.K_LEFT]:
-            self.rect.x -= velocidade
+            dx = -velocidade
             self.direcao = -1
             self.estado = "walk"
         elif teclas[pygame.K_RIGHT]:
-            self.rect.x += velocidade
+            dx = velocidade
             self.direcao = 1
             self.estado = "walk"
         else:
             self.estado = "idle"
+        self.rect.x += dx
+        self.mapa.colidir_x(self.rect, dx)
+        if self.rect.left < 0:
+            self.rect.left = 0
+        if self.rect.right > self.mapa.largura_px:
+            self.rect.right = self.mapa.largura_px
 
         # Pular
         if teclas[pygame.K_SPACE] and self.no_chao:
@@ -143,82 +122,151 @@ class MegaMan(pygame.sprite.Sprite):
             if self.som_pulo:
                 self.som_pulo.play()
 
-        # Gravidade
-        self.vel_y += gravidade
+        # Gravidade e chão: sondas O(1) na grade de tiles
+        self.vel_y = min(self.vel_y + gravidade, QUEDA_MAX)
         self.rect.y += self.vel_y
-        if self.rect.bottom >= CHAO:
-            self.rect.bottom = CHAO
+        self.vel_y, self.no_chao = self.mapa.colidir_y(self.rect, self.vel_y)
+        if self.rect.top > self.mapa.altura_px:
+            # caiu num buraco: volta ao início da fase
+            self.rect.midbottom = self.mapa.inicio_px
+            self.anterior = self.rect.topleft
             self.vel_y = 0
-            self.no_chao = True
 
-        # Atirar (limite de rate)
+        # Atirar (limite de rate, contado em passos)
         if teclas[pygame.K_z]:
             self.estado = "shoot"
-            if not hasattr(self, "ultimo_tiro") or pygame.time.get_ticks() - self.ultimo_tiro > 300:
-                tiro = Tiro(self.rect.centerx + 25 * self.direcao, self.rect.centery, self.direcao)
-                tiros.add(tiro)
+            if self.anim_timer - self.ultimo_tiro > INTERVALO_TIRO:
+                tiros.disparar(self.rect.centerx + 25 * self.direcao, self.rect.centery,
+                               VEL_TIRO * self.direcao, "tiro", ALCANCE_TIRO)
                 if self.som_tiro:
                     self.som_tiro.play()
-                self.ultimo_tiro = pygame.time.get_ticks()
+                self.ultimo_tiro = self.anim_timer
 
         # Animação: atualiza frame index
-        frames = self.animacoes.get(self.estado) or self.animacoes["walk"]
-        if frames:
-            # velocidade de troca dos frames (ajuste 0.2-0.4 para mais/menos rapidez)
-            self.frame += 0.28
-            if self.frame >= len(frames):
-                self.frame = 0.0
-            frame_img = frames[int(self.frame)]
-        else:
-            frame_img = pygame.Surface((40, 40))
-            frame_img.fill(AZUL)
-
-        # NÃO sobrescreve o frame original (importante)
-        display_img = frame_img.copy()
-
-        # Decidir se precisa flipar horizontalmente:
-        # - se as imagens de origem olham para "right": flip quando direcao == -1
-        # - se as imagens de origem olham para "left":  flip quando direcao ==  1
-        if MegaMan.SOURCE_FACING == "right":
-            need_flip = (self.direcao == -1)
-        else:  # SOURCE_FACING == "left"
-            need_flip = (self.direcao == 1)
-
-        if need_flip:
-            display_img = pygame.transform.flip(display_img, True, False)
-
-        self.image = display_img
-
+        # (walk nunca fica vazia, então serve de reserva para estados sem frames)
+        estado = self.estado if self.animacoes.get(self.estado) else "walk"
+        frames = self.quadros.get(estado, self.direcao)
+        # velocidade de troca dos frames (ajuste 0.2-0.4 para mais/menos rapidez)
+        self.frame += 0.28
+        if self.frame >= len(frames):
+            self.frame = 0.0
+        # o FrameStore já entrega o frame virado para o lado certo (SOURCE_FACING)
+        self.image = frames[int(self.frame)]
+
+# --- JOGO ---
+class Jogo:
+    """Janela, fase, jogador e tiros, criados só quando são usados.
+
+    iniciar() liga o pygame e o mixer; a janela abre no primeiro acesso a
+    .tela. Passando uma Surface em tela, passo()/desenhar() rodam sem
+    janela e sem som (útil para testes e ferramentas). nivel é o caminho
+    de uma fase .txt ou uma fonte pronta (ex.: nivel.FonteProcedural).
+
+    passo() avança um passo fixo de 1/HZ; rodar() chama quantos passos o
+    tempo real pedir (passo_fixo.PassoFixo) e desenha interpolando.
+    """
+
+    def __init__(self, tela=None, profiler=None, nivel=NIVEL, fps=FPS):
+        self._tela = tela
+        self._jogador = None
+        self.nivel = nivel
+        self.fps = fps
+        self.mapa = None
+        self.camera = None
+        self.cam_anterior = 0
+        self.tiros = Projeteis(TIPOS_TIRO)
+        self.profiler = profiler if profiler is not None else Profiler()
+
+    def iniciar(self):
+        pygame.mixer.pre_init(44100, -16, 2, 512)
+        pygame.init()
+        pygame.mixer.init()
+
+    @property
+    def tela(self):
+        if self._tela is None:
+            self._tela = pygame.display.set_mode((LARGURA, ALTURA))
+            pygame.display.set_caption(TITULO)
+        return self._tela
+
+    @property
+    def jogador(self):
+        if self._jogador is None:
+            # a tela vem antes, para o atlas e os chunks sairem convertidos
+            self.tela
+            fonte = self.nivel if hasattr(self.nivel, "chunk") else FonteTexto(self.nivel)
+            self.mapa = Mapa(fonte, fundo=CEU)
+            self.camera = Camera(LARGURA, self.mapa.largura_px)
+            self._jogador = MegaMan(self.mapa)
+        return self._jogador
+
+    def passo(self, teclas):
+        self.cam_anterior = self.camera.x if self.camera else 0
+        self.jogador.atualizar(teclas, self.tiros)
+        self.tiros.atualizar(self.mapa)
+        self.camera.seguir(self.jogador.rect.centerx)
+        self.mapa.atualizar(self.camera.x, LARGURA)
+
+    def desenhar(self, alfa=1.0):
+        # alfa: quanto do próximo passo já passou (0 = anterior, 1 = atual)
+        tela = self.tela
+        jogador = self.jogador
+        cx = round(self.cam_anterior + (self.camera.x - self.cam_anterior) * alfa)
+        tela.fill(CEU)
+        # só os chunks visíveis, já pré-renderizados
+        self.mapa.desenhar(tela, cx)
+        x, y = interpolar(jogador.anterior, jogador.rect.topleft, alfa)
+        tela.blit(jogador.image, (x - cx, y))
+        self.tiros.desenhar(tela, cx, alfa)
+
+    def rodar(self):
+        # loop da janela; volta quando ela é fechada
+        clock = pygame.time.Clock()
+        profiler = self.profiler
+        # F3 liga/desliga o profiler e o overlay
+        fonte_prof = pygame.font.SysFont(None, 18)
+        relogio = PassoFixo(HZ)
+        self.jogador
+
+        while True:
+            dt = clock.tick(self.fps) / 1000
+            with profiler.section("input"):
+                for evento in pygame.event.get():
+                    if evento.type == pygame.QUIT:
+                        return
+                    profiler.handle_event(evento)
+
+                teclas = pygame.key.get_pressed()
+
+            # simulação em passo fixo: quantos passos o tempo real pedir
+            with profiler.section("update"):
+                for _ in range(relogio.avancar(dt)):
+                    self.passo(teclas)
+
+            # --- DESENHAR ---
+            with profiler.section("draw"):
+                self.desenhar(relogio.alfa)
+            profiler.draw(self.tela, fonte_prof)
+            with profiler.section("flip"):
+                pygame.display.flip()
 
-        # Espelhar se estiver indo para a esquerda
-        if self.direcao == -1:
-            self.image = pygame.transform.flip(self.image, True, False)
 
 # --- LOOP PRINCIPAL ---
-def main():
-    clock = pygame.time.Clock()
-    jogador = MegaMan()
-    tiros = pygame.sprite.Group()
-
-    rodando = True
-    while rodando:
-        clock.tick(FPS)
-        for evento in pygame.event.get():
-            if evento.type == pygame.QUIT:
-                rodando = False
-                pygame.quit()
-                sys.exit()
-
-        teclas = pygame.key.get_pressed()
-        jogador.atualizar(teclas, tiros)
-        tiros.update()
-
-        # --- DESENHAR ---
-        TELA.fill((40, 120, 255))
-        pygame.draw.rect(TELA, (100, 60, 20), (0, CHAO, LARGURA, 80))
-        TELA.blit(jogador.image, jogador.rect)
-        tiros.draw(TELA)
-        pygame.display.flip()
+def main(profile=False, trace=None, fps=FPS):
+    jogo = Jogo(profiler=Profiler(enabled=profile, trace=trace is not None), fps=fps)
+    jogo.iniciar()
+    jogo.rodar()
+    if trace:
+        jogo.profiler.export(trace)
+    pygame.quit()
+    sys.exit()
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Mega Man Clássico")
+    parser.add_argument("--profile", action="store_true", help="começa com o profiler ligado (F3)")
+    parser.add_argument("--trace", metavar="ARQUIVO",
+                        help="ao sair grava os tempos em ARQUIVO (.json: trace do Chrome, senão CSV)")
+    parser.add_argument("--fps", type=int, default=FPS,
+                        help=f"limite de quadros desenhados (0 = sem limite; a física roda sempre a {HZ} Hz)")
+    args = parser.parse_args()
+    main(profile=args.profile or args.trace is not None, trace=args.trace, fps=args.fps)
@@ -2,159 +2,102 @@
 import pygame
 import os
 import sys
-import numpy as np
-import wave
-import struct
+import argparse
 
-# --------------------
-# Inicialização
-# --------------------
-pygame.mixer.pre_init(44100, -16, 2, 512)
-pygame.init()
-try:
-    pygame.mixer.init()
-except Exception:
-    # Se algo falhar com mixer, seguiremos sem som
-    print("[AVISO] mixer do pygame não pôde ser inicializado. Sem som.")
+from atlas import carregar_atlas
+from frames import FrameStore
+from nivel import Camera, FonteTexto, Mapa, QUEDA_MAX
+from passo_fixo import PassoFixo, interpolar
+from profiler import Profiler
+from projeteis import Projeteis
+from sons import Som
+from text_cache import GlyphAtlas
 
 # --------------------
 # Configurações
+# (importar este módulo não abre janela nem inicia o mixer; ver Jogo)
 # --------------------
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-ASSETS_DIR = os.path.join(BASE_DIR, "assets", "megamanx")
 
 LARGURA, ALTURA = 800, 400
-TELA = pygame.display.set_mode((LARGURA, ALTURA))
-pygame.display.set_caption("Mega Man X - Demo")
-FPS = 60
-CHAO = ALTURA - 80
+TITULO = "Mega Man X - Demo"
+HZ = 60     # passos de simulação por segundo; velocidades são por passo
+FPS = 60    # limite de quadros desenhados por segundo (0 = sem limite)
 GRAVIDADE = 0.9
 WHITE = (255, 255, 255)
 BG = (30, 120, 255)
-FLOOR_COLOR = (100, 60, 20)
+NIVEL = os.path.join(BASE_DIR, "assets", "niveis", "fase1.txt")
 
 # Se seus sprites originais apontam para a direita, mantenha "right".
 # Se apontam para a esquerda, mude para "left".
 SOURCE_FACING = "right"
 
 # --------------------
-# Utilitários: carregar sprites
+# Sons 8-bit: sintetizados na memória no primeiro play (ver sons.py)
 # --------------------
-def carregar_sprites_try(caminho_base):
-    """
-    Tento carregar primeiro a pasta *_cortado se existir, senão a original.
-    Retorna lista de surfaces (pode ser vazia).
-    """
-    opc1 = caminho_base + "_cortado"
-    opc2 = caminho_base
-    for caminho in (opc1, opc2):
-        if os.path.exists(caminho) and os.path.isdir(caminho):
-            frames = []
-            for arq in sorted(os.listdir(caminho)):
-                if arq.lower().endswith(".png"):
-                    try:
-                        img = pygame.image.load(os.path.join(caminho, arq)).convert_alpha()
-                        frames.append(img)
-                    except Exception as e:
-                        print(f"[ERRO] Falha ao carregar {arq}: {e}")
-            if frames:
-                print(f"✅ Carregados {len(frames)} frames de: {os.path.relpath(caminho)}")
-                return frames
-    print(f"[AVISO] Nenhum frame em {os.path.relpath(caminho_base)} (busquei _cortado e original).")
-    return []
+# Para guardar os WAVs entre execuções, aponte para uma pasta, por exemplo
+# os.path.join(BASE_DIR, "assets", "sounds", "cache").
+CACHE_SONS = None
+SOUND_SHOOT = Som("x_shoot", 1100, 0.09, "quadrada", cache_dir=CACHE_SONS)
+SOUND_JUMP = Som("x_jump", 520, 0.18, "senoide", cache_dir=CACHE_SONS)
+SOUND_RUN = Som("x_run", 140, 0.04, "quadrada", cache_dir=CACHE_SONS)
 
 # --------------------
-# Função para gerar sons simples (8-bit-ish) caso faltarem
+# Tiros: cada tipo tem uma Surface só, compartilhada (ver projeteis.py)
 # --------------------
-def gerar_som_local(nome, freq=880, dur=0.12, tipo="quadrada"):
-    os.makedirs(os.path.join(BASE_DIR, "assets", "sounds"), exist_ok=True)
-    caminho = os.path.join(BASE_DIR, "assets", "sounds", f"{nome}.wav")
-    if os.path.exists(caminho):
-        return caminho
-    taxa = 44100
-    t = np.linspace(0, dur, int(taxa * dur), False)
-    if tipo == "quadrada":
-        onda = 0.5 * np.sign(np.sin(2 * np.pi * freq * t))
-    else:
-        onda = 0.5 * np.sin(2 * np.pi * freq * t)
-    onda = np.int16(onda * 32767)
-    with wave.open(caminho, "w") as f:
-        f.setparams((1, 2, taxa, 0, "NONE", "not compressed"))
-        for s in onda:
-            f.writeframes(struct.pack("h", s))
-    print(f"[OK] Som gerado: {caminho}")
-    return caminho
-
-# gerar sons (se já existirem, retornarão o arquivo existente)
-SOM_ATIRAR = gerar_som_local("x_shoot", 1100, 0.09, "quadrada")
-SOM_PULO = gerar_som_local("x_jump", 520, 0.18, "senoide")
-SOM_CORRIDA = gerar_som_local("x_run", 140, 0.04, "quadrada")
-
-# carrega objetos Sound (se mixer disponível)
-def carregar_som_ou_none(caminho):
-    try:
-        return pygame.mixer.Sound(caminho)
-    except Exception:
-        return None
-
-SOUND_SHOOT = carregar_som_ou_none(SOM_ATIRAR)
-SOUND_JUMP = carregar_som_ou_none(SOM_PULO)
-SOUND_RUN = carregar_som_ou_none(SOM_CORRIDA)
+TIPOS_TIRO = {"tiro": ((255, 220, 80), (12, 5))}
+VEL_TIRO = 14
+INTERVALO_TIRO = 13     # passos entre tiros (~220 ms a 60 Hz)
+# com a câmera rolando, o tiro some depois de cruzar uma tela
+ALCANCE_TIRO = LARGURA
 
 # --------------------
 # Classes do jogo
 # --------------------
-class Tiro(pygame.sprite.Sprite):
-    def __init__(self, x, y, direcao):
-        super().__init__()
-        surf = pygame.Surface((12, 5), pygame.SRCALPHA)
-        surf.fill((255, 220, 80))
-        self.image = surf
-        self.rect = self.image.get_rect(center=(x, y))
-        self.vel = 14 * direcao
-
-    def update(self):
-        self.rect.x += self.vel
-        if self.rect.right < 0 or self.rect.left > LARGURA:
-            self.kill()
-
 class MegaManX(pygame.sprite.Sprite):
-    def __init__(self, x=100, y=CHAO):
+    def __init__(self, mapa, x=None, y=None):
         super().__init__()
-        # Tenta carregar em ordem prática: walk/run/jump/shoot/idle
-        self.anim = {
-            "idle": carregar_sprites_try(os.path.join(ASSETS_DIR, "idle")),
-            "walk": carregar_sprites_try(os.path.join(ASSETS_DIR, "walk")),
-            "run":  carregar_sprites_try(os.path.join(ASSETS_DIR, "run")),
-            "jump": carregar_sprites_try(os.path.join(ASSETS_DIR, "jump")),
-            "shoot":carregar_sprites_try(os.path.join(ASSETS_DIR, "shoot")),
-        }
+        # o atlas é lido uma vez por processo; as pastas *_cortado já foram
+        # resolvidas ao empacotar (python atlas.py)
+        sprites = carregar_atlas("megamanx")
+        self.anim = {nome: sprites.get(nome, []) for nome in ("idle", "walk", "run", "jump", "shoot")}
         # fallback se faltar animações: criamos um placeholder simples
         for k, v in list(self.anim.items()):
             if not v:
                 s = pygame.Surface((48, 48), pygame.SRCALPHA)
                 s.fill((0, 120, 255))
                 self.anim[k] = [s]
+        # frames para direita/esquerda prontos de uma vez (sem copy/flip por quadro)
+        self.quadros = FrameStore(self.anim, SOURCE_FACING)
 
         # estado inicial
         self.estado = "idle"
         self.frame = 0.0
         self.image = self.anim["idle"][0]
-        self.rect = self.image.get_rect(midbottom=(x, y))
+        # posição e colisões vêm da fase (nivel.Mapa)
+        self.mapa = mapa
+        inicio_x, inicio_y = mapa.inicio_px
+        self.rect = self.image.get_rect(midbottom=(inicio_x if x is None else x,
+                                                   inicio_y if y is None else y))
         self.vel_y = 0.0
+        self.no_chao = True
         self.direcao = 1
-        self.tiros = pygame.sprite.Group()
-        self.ultimo_tiro = 0
-        self.anim_timer = 0
+        self.tiros = Projeteis(TIPOS_TIRO)
+        self.ultimo_tiro = -INTERVALO_TIRO
+        self.anim_timer = 0     # passos simulados (também serve de relógio)
+        # posição no passo anterior, para desenhar interpolado
+        self.anterior = self.rect.topleft
         self.som_tiro = SOUND_SHOOT
         self.som_pulo = SOUND_JUMP
         self.som_corrida = SOUND_RUN
 
     def update(self, teclas):
         self.anim_timer += 1
+        self.anterior = self.rect.topleft
         velocidade_base = 4
         accel_run = 4  # deslocamento extra ao correr
         moved = False
+        x_antes = self.rect.x
 
         # Movimentação e estados
         correr = teclas[pygame.K_LSHIFT] or teclas[pygame.K_RSHIFT]
@@ -168,9 +111,7 @@ class MegaManX(pygame.sprite.Sprite):
                 self.estado = "run"
                 # som de passos (curto)
                 if self.som_corrida and self.anim_timer % 12 == 0:
-                    try:
-                        self.som_corrida.play()
-                    except: pass
+                    self.som_corrida.play()
         elif teclas[pygame.K_LEFT]:
             self.direcao = -1
             self.rect.x -= velocidade_base
@@ -180,9 +121,7 @@ class MegaManX(pygame.sprite.Sprite):
                 self.rect.x -= accel_run
                 self.estado = "run"
                 if self.som_corrida and self.anim_timer % 12 == 0:
-                    try:
-                        self.som_corrida.play()
-                    except: pass
+                    self.som_corrida.play()
         else:
             if self.estado not in ("jump", "shoot"):
                 self.estado = "idle"
@@ -192,41 +131,43 @@ class MegaManX(pygame.sprite.Sprite):
             self.rect.x += 10 * self.direcao
             self.estado = "run"
 
+        # paredes: desfaz o que entrou em tile sólido neste quadro
+        self.mapa.colidir_x(self.rect, self.rect.x - x_antes)
+
         # Pulo
-        if teclas[pygame.K_SPACE] and self.rect.bottom >= CHAO:
+        if teclas[pygame.K_SPACE] and self.no_chao:
             self.vel_y = -16
             self.estado = "jump"
             if self.som_pulo:
-                try: self.som_pulo.play()
-                except: pass
+                self.som_pulo.play()
 
         # Atirar
         if teclas[pygame.K_z]:
-            # controller: limita taxa de tiro
-            agora = pygame.time.get_ticks()
-            if agora - self.ultimo_tiro > 220:  # ms entre tiros
-                self.ultimo_tiro = agora
+            # controller: limita taxa de tiro (contada em passos)
+            if self.anim_timer - self.ultimo_tiro > INTERVALO_TIRO:
+                self.ultimo_tiro = self.anim_timer
                 self.estado = "shoot"
                 tx = self.rect.centerx + 30 * self.direcao
                 ty = self.rect.centery - 6
-                t = Tiro(tx, ty, self.direcao)
-                self.tiros.add(t)
+                self.tiros.disparar(tx, ty, VEL_TIRO * self.direcao, "tiro", ALCANCE_TIRO)
                 if self.som_tiro:
-                    try: self.som_tiro.play()
-                    except: pass
+                    self.som_tiro.play()
 
-        # Gravidade/queda
-        self.vel_y += GRAVIDADE
+        # Gravidade/queda: chão e teto por sondas O(1) na grade de tiles
+        self.vel_y = min(self.vel_y + GRAVIDADE, QUEDA_MAX)
         self.rect.y += self.vel_y
-        if self.rect.bottom >= CHAO:
-            self.rect.bottom = CHAO
+        self.vel_y, self.no_chao = self.mapa.colidir_y(self.rect, self.vel_y)
+        if self.rect.top > self.mapa.altura_px:
+            # caiu num buraco: volta ao início da fase
+            self.rect.midbottom = self.mapa.inicio_px
+            self.anterior = self.rect.topleft
             self.vel_y = 0.0
 
-        # Limites de tela
+        # Limites da fase
         if self.rect.left < 0:
             self.rect.left = 0
-        if self.rect.right > LARGURA:
-            self.rect.right = LARGURA
+        if self.rect.right > self.mapa.largura_px:
+            self.rect.right = self.mapa.largura_px
 
         # ANIMAÇÃO (controla frame index)
         frames = self.anim.get(self.estado) or self.anim["idle"]
@@ -235,60 +176,149 @@ class MegaManX(pygame.sprite.Sprite):
         if len(frames) == 1:
             speed = 999999
 
-        if self.anim_timer % (FPS // (FPS // (speed if speed>0 else 1) )) == 0:
+        if self.anim_timer % (HZ // (HZ // (speed if speed>0 else 1) )) == 0:
             self.frame = (self.frame + 1) % len(frames)
 
-        # Seleciona frame e cria imagem de exibição
-        frame_img = frames[int(self.frame)]
-        display_img = frame_img.copy()
+        # Seleciona o frame já virado para a direção atual (sem cópia)
+        estado = self.estado if self.estado in self.anim else "idle"
+        quadros = self.quadros.get(estado, self.direcao)
+        # o índice pode vir de uma animação mais longa (ex.: walk -> shoot)
+        self.image = quadros[int(self.frame) % len(quadros)]
+        # atualiza tiros (todos de uma vez; somem ao bater em tile sólido)
+        self.tiros.atualizar(self.mapa)
+
+    def draw(self, surface, cam_x=0, alfa=1.0):
+        # posições estão em coordenadas da fase; cam_x rola para a tela e
+        # alfa interpola entre o passo anterior e o atual
+        x, y = interpolar(self.anterior, self.rect.topleft, alfa)
+        surface.blit(self.image, (x - cam_x, y))
+        self.tiros.desenhar(surface, cam_x, alfa)
 
-        # Determina necessidade de flip com base em SOURCE_FACING
-        if SOURCE_FACING == "right":
-            need_flip = (self.direcao == -1)
-        else:
-            need_flip = (self.direcao == 1)
+# --------------------
+# Jogo
+# --------------------
+class Jogo:
+    """Janela, fase e jogador criados só quando são usados.
 
-        if need_flip:
-            display_img = pygame.transform.flip(display_img, True, False)
+    iniciar() liga o pygame e o mixer; a janela abre no primeiro acesso a
+    .tela. Passando uma Surface em tela, passo()/desenhar() rodam sem
+    janela e sem som (útil para testes e ferramentas). nivel é o caminho
+    de uma fase .txt ou uma fonte pronta (ex.: nivel.FonteProcedural).
 
-        self.image = display_img
-        # atualiza tiros
-        self.tiros.update()
+    passo() avança um passo fixo de 1/HZ; rodar() chama quantos passos o
+    tempo real pedir (passo_fixo.PassoFixo) e desenha interpolando.
+    """
 
-    def draw(self, surface):
-        surface.blit(self.image, self.rect)
-        self.tiros.draw(surface)
+    def __init__(self, tela=None, profiler=None, nivel=NIVEL, fps=FPS):
+        self._tela = tela
+        self._player = None
+        self.nivel = nivel
+        self.fps = fps
+        self.mapa = None
+        self.camera = None
+        self.cam_anterior = 0
+        self.profiler = profiler if profiler is not None else Profiler()
+
+    def iniciar(self):
+        pygame.mixer.pre_init(44100, -16, 2, 512)
+        pygame.init()
+        try:
+            pygame.mixer.init()
+        except pygame.error:
+            # Se algo falhar com mixer, seguiremos sem som
+            print("[AVISO] mixer do pygame não pôde ser inicializado. Sem som.")
+
+    @property
+    def tela(self):
+        if self._tela is None:
+            self._tela = pygame.display.set_mode((LARGURA, ALTURA))
+            pygame.display.set_caption(TITULO)
+        return self._tela
+
+    @property
+    def player(self):
+        if self._player is None:
+            # a tela vem antes, para o atlas e os chunks sairem convertidos
+            self.tela
+            fonte = self.nivel if hasattr(self.nivel, "chunk") else FonteTexto(self.nivel)
+            self.mapa = Mapa(fonte, fundo=BG)
+            self.camera = Camera(LARGURA, self.mapa.largura_px)
+            self._player = MegaManX(self.mapa)
+        return self._player
+
+    def passo(self, teclas):
+        self.cam_anterior = self.camera.x if self.camera else 0
+        self.player.update(teclas)
+        self.camera.seguir(self.player.rect.centerx)
+        self.mapa.atualizar(self.camera.x, LARGURA)
+
+    def desenhar(self, alfa=1.0):
+        # alfa: quanto do próximo passo já passou (0 = anterior, 1 = atual)
+        tela = self.tela
+        player = self.player
+        cx = round(self.cam_anterior + (self.camera.x - self.cam_anterior) * alfa)
+        tela.fill(BG)
+        # só os chunks visíveis, já pré-renderizados
+        self.mapa.desenhar(tela, cx)
+        player.draw(tela, cx, alfa)
+
+    def rodar(self):
+        # loop da janela; volta quando ela é fechada
+        clock = pygame.time.Clock()
+        profiler = self.profiler
+        # F3 liga/desliga o profiler e o overlay
+        # fonte criada uma vez só; o FPS é montado com glifos já renderizados
+        fonte_hud = pygame.font.SysFont(None, 18)
+        hud = GlyphAtlas(fonte_hud, WHITE)
+        relogio = PassoFixo(HZ)
+        self.player
+        rodando = True
+
+        while rodando:
+            dt = clock.tick(self.fps) / 1000
+            with profiler.section("input"):
+                for e in pygame.event.get():
+                    if e.type == pygame.QUIT:
+                        rodando = False
+                    profiler.handle_event(e)
+
+                teclas = pygame.key.get_pressed()
+
+            # simulação em passo fixo: quantos passos o tempo real pedir
+            with profiler.section("update"):
+                for _ in range(relogio.avancar(dt)):
+                    self.passo(teclas)
+
+            # Desenho
+            with profiler.section("draw"):
+                self.desenhar(relogio.alfa)
+
+            # HUD simples (fps)
+            with profiler.section("hud"):
+                hud.draw(self.tela, f"FPS: {int(clock.get_fps())}", 8, 8)
+
+            profiler.draw(self.tela, fonte_hud, y=28)
+            with profiler.section("flip"):
+                pygame.display.flip()
 
 # --------------------
 # Loop principal
 # --------------------
-def main():
-    clock = pygame.time.Clock()
-    player = MegaManX()
-    rodando = True
-
-    while rodando:
-        dt = clock.tick(FPS)
-        for e in pygame.event.get():
-            if e.type == pygame.QUIT:
-                rodando = False
-
-        teclas = pygame.key.get_pressed()
-        player.update(teclas)
-
-        # Desenho
-        TELA.fill(BG)
-        pygame.draw.rect(TELA, FLOOR_COLOR, (0, CHAO, LARGURA, 80))
-        player.draw(TELA)
-
-        # HUD simples (fps)
-        fps_text = pygame.font.SysFont(None, 18).render(f"FPS: {int(clock.get_fps())}", True, WHITE)
-        TELA.blit(fps_text, (8, 8))
-
-        pygame.display.flip()
-
+def main(profile=False, trace=None, fps=FPS):
+    jogo = Jogo(profiler=Profiler(enabled=profile, trace=trace is not None), fps=fps)
+    jogo.iniciar()
+    jogo.rodar()
+    if trace:
+        jogo.profiler.export(trace)
     pygame.quit()
     sys.exit()
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Mega Man X - Demo")
+    parser.add_argument("--profile", action="store_true", help="começa com o profiler ligado (F3)")
+    parser.add_argument("--trace", metavar="ARQUIVO",
+                        help="ao sair grava os tempos em ARQUIVO (.json: trace do Chrome, senão CSV)")
+    parser.add_argument("--fps", type=int, default=FPS,
+                        help=f"limite de quadros desenhados (0 = sem limite; a física roda sempre a {HZ} Hz)")
+    args = parser.parse_args()
+    main(profile=args.profile or args.trace is not None, trace=args.trace, fps=args.fps)
@@ -0,0 +1,232 @@
+# nivel.py
+# Fases em tiles: formato de texto, câmera com rolagem horizontal e pedaços
+# (chunks) de CHUNK colunas carregados/descarregados conforme a câmera anda.
+#
+# Formato de fase (.txt), uma linha de texto por linha de tiles:
+#     .  vazio        #  chão        B  bloco        P  início do jogador
+# Linhas curtas são completadas com vazio.
+import random
+
+import numpy as np
+import pygame
+
+TILE = 40               # pixels por tile
+CHUNK = 16              # colunas por chunk
+CHUNK_PX = TILE * CHUNK
+MARGEM_CHUNKS = 1       # chunks mantidos além dos visíveis, de cada lado
+VAZIO = ord(".")
+SOLIDOS = frozenset(b"#B")
+QUEDA_MAX = TILE - 1    # velocidade vertical máxima: nunca atravessa um tile
+_E_SOLIDO = np.zeros(256, bool)
+_E_SOLIDO[list(SOLIDOS)] = True
+CORES = {ord("#"): (100, 60, 20), ord("B"): (150, 100, 50)}
+
+
+class FonteTexto:
+    """Fase lida de um arquivo de texto (formato no topo do módulo)."""
+
+    def __init__(self, caminho):
+        with open(caminho) as f:
+            linhas = [l.rstrip("\n") for l in f if l.strip()]
+        self.linhas = len(linhas)
+        self.colunas = max(len(l) for l in linhas)
+        self.inicio = (1, self.linhas - 3)
+        for lin, texto in enumerate(linhas):
+            col = texto.find("P")
+            if col >= 0:
+                self.inicio = (col, lin)
+        self._texto = [l.replace("P", ".").ljust(self.colunas, ".").encode() for l in linhas]
+
+    def chunk(self, ci):
+        c0 = ci * CHUNK
+        return b"".join(l[c0:c0 + CHUNK].ljust(CHUNK, b".") for l in self._texto)
+
+
+class FonteProcedural:
+    """Fase gerada pedaço a pedaço; cada chunk só depende de (semente, índice).
+
+    Serve para fases de qualquer largura sem guardar a fase inteira.
+    """
+
+    def __init__(self, colunas, semente=0, linhas=10):
+        self.colunas = colunas
+        self.linhas = linhas
+        self.semente = semente
+        self.inicio = (2, linhas - 3)
+
+    def chunk(self, ci):
+        rng = random.Random(self.semente * 1000003 + ci)
+        chao = self.linhas - 2
+        grade = [bytearray(b"." * CHUNK) for _ in range(self.linhas)]
+        for lin in range(chao, self.linhas):
+            grade[lin][:] = b"#" * CHUNK
+        if ci > 0:
+            # buracos de 2-3 tiles (dá para pular) e plataformas de blocos
+            col = rng.randrange(2, CHUNK - 4)
+            for c in range(col, col + rng.randint(2, 3)):
+                for lin in range(chao, self.linhas):
+                    grade[lin][c] = VAZIO
+            col = rng.randrange(0, CHUNK - 4)
+            lin = chao - rng.randint(2, 3)
+            n = rng.randint(2, 4)
+            grade[lin][col:col + n] = b"B" * n
+        return b"".join(bytes(l) for l in grade)
+
+
+class Camera:
+    def __init__(self, largura_tela, largura_mundo):
+        self.largura_tela = largura_tela
+        self.largura_mundo = largura_mundo
+        self.x = 0
+
+    def seguir(self, alvo_x):
+        # centraliza o alvo sem mostrar nada fora da fase
+        limite = max(0, self.largura_mundo - self.largura_tela)
+        self.x = int(min(max(alvo_x - self.largura_tela // 2, 0), limite))
+
+
+class Mapa:
+    """Grade de tiles dividida em chunks, com imagem pré-renderizada por chunk.
+
+    Só ficam na memória os chunks perto da câmera (atualizar()); desenhar()
+    faz um blit por chunk visível e solido() é uma consulta O(1).
+    """
+
+    def __init__(self, fonte, fundo=(0, 0, 0), cores=CORES):
+        self.fonte = fonte
+        self.fundo = fundo
+        self.cores = cores
+        self.linhas = fonte.linhas
+        self.colunas = fonte.colunas
+        self.largura_px = self.colunas * TILE
+        self.altura_px = self.linhas * TILE
+        self.num_chunks = (self.colunas + CHUNK - 1) // CHUNK
+        self.dados = {}     # índice do chunk -> bytes (linha a linha)
+        self.imagens = {}   # índice do chunk -> Surface
+        self.carregados = 0
+
+    @property
+    def inicio_px(self):
+        # ponto (midbottom) onde o jogador começa
+        col, lin = self.fonte.inicio
+        return col * TILE + TILE // 2, (lin + 1) * TILE
+
+    def _dados(self, ci):
+        d = self.dados.get(ci)
+        if d is None:
+            d = self.dados[ci] = self.fonte.chunk(ci)
+            self.carregados += 1
+        return d
+
+    def tile(self, col, lin):
+        if not (0 <= col < self.colunas and 0 <= lin < self.linhas):
+            return VAZIO
+        ci = col // CHUNK
+        return self._dados(ci)[lin * CHUNK + col - ci * CHUNK]
+
+    def solido(self, x, y):
+        return self.tile(int(x) // TILE, int(y) // TILE) in SOLIDOS
+
+    def solidos(self, xs, ys):
+        """solido() para arrays de pontos, agrupando as consultas por chunk."""
+        cols = (xs // TILE).astype(np.int64)
+        lins = (ys // TILE).astype(np.int64)
+        dentro = (cols >= 0) & (cols < self.colunas) & (lins >= 0) & (lins < self.linhas)
+        res = np.zeros(len(cols), bool)
+        chunks = cols // CHUNK
+        for ci in np.unique(chunks[dentro]).tolist():
+            sel = dentro & (chunks == ci)
+            grade = np.frombuffer(self._dados(ci), np.uint8).reshape(self.linhas, CHUNK)
+            res[sel] = _E_SOLIDO[grade[lins[sel], cols[sel] - ci * CHUNK]]
+        return res
+
+    def chao_sob(self, rect):
+        """Topo do tile sólido sob os pés de rect, ou None se não houver."""
+        pe = rect.bottom - 1
+        if self.solido(rect.left + 2, pe) or self.solido(rect.right - 3, pe):
+            return pe // TILE * TILE
+        return None
+
+    def teto_sobre(self, rect):
+        """Base do tile sólido na altura da cabeça de rect, ou None."""
+        if self.solido(rect.left + 2, rect.top) or self.solido(rect.right - 3, rect.top):
+            return (rect.top // TILE + 1) * TILE
+        return None
+
+    def parede(self, rect, direcao):
+        # três sondas na frente do corpo (cabeça, meio, perto dos pés)
+        x = rect.right - 1 if direcao > 0 else rect.left
+        return (self.solido(x, rect.top + 1) or self.solido(x, rect.centery)
+                or self.solido(x, rect.bottom - 2))
+
+    def colidir_x(self, rect, dx):
+        """Desfaz a parte do passo horizontal dx que entrou numa parede."""
+        if not dx or not self.parede(rect, dx):
+            return False
+        if dx > 0:
+            rect.right = (rect.right - 1) // TILE * TILE
+        else:
+            rect.left = (rect.left // TILE + 1) * TILE
+        return True
+
+    def colidir_y(self, rect, vel_y):
+        """Encosta rect no chão (caindo) ou no teto (subindo).
+
+        Devolve (vel_y, no_chao) para depois do passo vertical.
+        """
+        if vel_y >= 0:
+            topo = self.chao_sob(rect)
+            if topo is not None:
+                rect.bottom = topo
+                return 0, True
+        else:
+            base = self.teto_sobre(rect)
+            if base is not None:
+                rect.top = base
+                return 0, False
+        return vel_y, False
+
+    def _imagem(self, ci):
+        img = self.imagens.get(ci)
+        if img is not None:
+            return img
+        dados = self._dados(ci)
+        img = pygame.Surface((CHUNK_PX, self.altura_px))
+        if pygame.display.get_surface() is not None:
+            img = img.convert()
+        img.fill(self.fundo)
+        for i, t in enumerate(dados):
+            cor = self.cores.get(t)
+            if cor is not None:
+                lin, col = divmod(i, CHUNK)
+                r = pygame.Rect(col * TILE, lin * TILE, TILE, TILE)
+                img.fill(cor, r)
+                pygame.draw.rect(img, [c // 2 for c in cor], r, 1)
+        self.imagens[ci] = img
+        return img
+
+    def visiveis(self, cam_x, largura):
+        c0 = max(0, cam_x // CHUNK_PX)
+        c1 = min(self.num_chunks - 1, (cam_x + largura - 1) // CHUNK_PX)
+        return range(c0, c1 + 1)
+
+    def atualizar(self, cam_x, largura):
+        # descarrega os chunks que saíram da janela da câmera (+ margem)
+        vis = self.visiveis(cam_x, largura)
+        manter = range(vis.start - MARGEM_CHUNKS, vis.stop + MARGEM_CHUNKS)
+        for cache in (self.dados, self.imagens):
+            for ci in [ci for ci in cache if ci not in manter]:
+                del cache[ci]
+
+    def desenhar(self, tela, cam_x):
+        tela.blits([(self._imagem(ci), (ci * CHUNK_PX - cam_x, 0))
+                    for ci in self.visiveis(cam_x, tela.get_width())], doreturn=False)
+
+    def stats(self):
+        return {
+            "chunks_dados": len(self.dados),
+            "chunks_imagem": len(self.imagens),
+            "bytes_imagem": sum(i.get_width() * i.get_height() * i.get_bytesize()
+                                for i in self.imagens.values()),
+            "carregados": self.carregados,
+        }
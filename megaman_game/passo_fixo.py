@@ -0,0 +1,45 @@
+# passo_fixo.py
+# Simulação em passo fixo, independente da taxa de quadros.
+#
+#     passos = relogio.avancar(clock.tick(FPS) / 1000)
+#     for _ in range(passos):
+#         jogo.passo(teclas)
+#     jogo.desenhar(relogio.alfa)
+
+
+class PassoFixo:
+    """Acumulador: converte o tempo real de cada quadro em passos de 1/hz.
+
+    Se um quadro demorar demais, no máximo max_passos são simulados e o
+    resto é descartado (o jogo fica mais lento em vez de travar tentando
+    alcançar). alfa é a fração do próximo passo já decorrida, usada para
+    interpolar o desenho entre o passo anterior e o atual.
+    """
+
+    def __init__(self, hz=60, max_passos=5):
+        self.hz = hz
+        self.dt = 1.0 / hz
+        self.max_passos = max_passos
+        self.acumulado = 0.0
+        self.descartado = 0.0
+
+    def avancar(self, dt_real):
+        self.acumulado += dt_real
+        # (o epsilon evita perder um passo por arredondamento, ex.: 1/60 * 60)
+        passos = int(self.acumulado * self.hz + 1e-9)
+        if passos > self.max_passos:
+            self.descartado += self.acumulado - self.max_passos * self.dt
+            self.acumulado = 0.0
+            return self.max_passos
+        self.acumulado -= passos * self.dt
+        return passos
+
+    @property
+    def alfa(self):
+        return max(0.0, min(1.0, self.acumulado * self.hz))
+
+
+def interpolar(anterior, atual, alfa):
+    # posição de desenho entre dois passos (tuplas ou Rects: usa x, y)
+    return (round(anterior[0] + (atual[0] - anterior[0]) * alfa),
+            round(anterior[1] + (atual[1] - anterior[1]) * alfa))
@@ -0,0 +1,10 @@
+# O profiler é compartilhado com o asteroids_game e fica em gamekit/, na
+# raiz do repositório; este módulo põe a raiz no path e o reexporta.
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+
+from gamekit.profiler import NULL_SECTION, Profiler  # noqa: E402,F401
@@ -0,0 +1,101 @@
+# projeteis.py
+# Tiros guardados em arrays NumPy planos: um passo vetorizado move e
+# descarta todos, e um único Surface.blits desenha todos.
+import numpy as np
+import pygame
+
+
+class Projeteis:
+    """Todos os tiros de um dono (jogador, inimigos...) em arrays planos.
+
+    tipos mapeia nome -> (cor, (largura, altura)); cada tipo tem uma única
+    Surface, criada no primeiro desenho (quando a janela já existe). A
+    capacidade dobra quando enche, então disparar não aloca nada por tiro.
+    """
+
+    CAMPOS = ("x", "y", "vx", "alcance")
+
+    def __init__(self, tipos, capacidade=64):
+        self.nomes = {nome: i for i, nome in enumerate(tipos)}
+        self.specs = list(tipos.values())
+        self.meio = np.array([(w // 2, h // 2) for _, (w, h) in self.specs])
+        self.superficies = None
+        self.count = 0
+        self.x = np.zeros(capacidade, np.float32)       # centro
+        self.y = np.zeros(capacidade, np.float32)
+        self.vx = np.zeros(capacidade, np.float32)      # pixels por quadro
+        self.alcance = np.zeros(capacidade, np.float32)  # pixels até sumir
+        self.tipo = np.zeros(capacidade, np.int8)
+
+    def __len__(self):
+        return self.count
+
+    def _crescer(self):
+        novo = len(self.x) * 2
+        for nome in self.CAMPOS + ("tipo",):
+            antigo = getattr(self, nome)
+            arr = np.zeros(novo, antigo.dtype)
+            arr[:self.count] = antigo[:self.count]
+            setattr(self, nome, arr)
+
+    def disparar(self, x, y, vx, tipo, alcance):
+        if self.count == len(self.x):
+            self._crescer()
+        i = self.count
+        self.x[i] = x
+        self.y[i] = y
+        self.vx[i] = vx
+        self.alcance[i] = alcance
+        self.tipo[i] = self.nomes[tipo]
+        self.count = i + 1
+
+    def atualizar(self, mapa=None):
+        # move todos, descarta os que esgotaram o alcance ou bateram num
+        # tile sólido e compacta os vivos no começo dos arrays
+        n = self.count
+        if n == 0:
+            return
+        x, vx, alcance = self.x[:n], self.vx[:n], self.alcance[:n]
+        x += vx
+        alcance -= np.abs(vx)
+        vivos = alcance >= 0
+        if mapa is not None:
+            vivos &= ~mapa.solidos(x, self.y[:n])
+        if vivos.all():
+            return
+        m = int(vivos.sum())
+        for nome in self.CAMPOS + ("tipo",):
+            arr = getattr(self, nome)
+            arr[:m] = arr[:n][vivos]
+        self.count = m
+
+    def limpar(self):
+        self.count = 0
+
+    def _criar_superficies(self):
+        self.superficies = []
+        for cor, tamanho in self.specs:
+            surf = pygame.Surface(tamanho)
+            if pygame.display.get_surface() is not None:
+                surf = surf.convert()
+            surf.fill(cor)
+            self.superficies.append(surf)
+
+    def desenhar(self, tela, cam_x=0, alfa=1.0):
+        # alfa < 1 desenha entre o passo anterior e o atual (passo_fixo)
+        n = self.count
+        if n == 0:
+            return
+        if self.superficies is None:
+            self._criar_superficies()
+        meio = self.meio[self.tipo[:n]]
+        x = self.x[:n] if alfa >= 1.0 else self.x[:n] - self.vx[:n] * (1.0 - alfa)
+        esq = x.astype(int) - meio[:, 0] - cam_x
+        topo = self.y[:n].astype(int) - meio[:, 1]
+        # só o que cai dentro da tela vai para o blits
+        visiveis = np.flatnonzero((esq + 2 * meio[:, 0] > 0) & (esq < tela.get_width()))
+        surfs = self.superficies
+        tela.blits([(surfs[t], (l, y)) for t, l, y in zip(self.tipo[visiveis].tolist(),
+                                                         esq[visiveis].tolist(),
+                                                         topo[visiveis].tolist())],
+                   doreturn=False)
@@ -0,0 +1,117 @@
+# sons.py
+# Efeitos 8-bit sintetizados com NumPy direto na memória.
+#
+# Cada Som só gera a onda no primeiro play(); o buffer vai para
+# pygame.mixer.Sound(buffer=...) sem passar pelo disco. Com cache_dir, o WAV
+# é gravado com um hash do conteúdo no nome e reaproveitado nas próximas
+# execuções.
+import hashlib
+import os
+import wave
+
+import numpy as np
+import pygame
+
+VERSAO = 1
+TIPOS = ("quadrada", "senoide", "ruido")
+
+# formato do mixer (get_init()[1]) -> dtype das amostras
+_DTYPES = {-8: np.int8, 8: np.uint8, -16: np.int16, 16: np.uint16, 32: np.float32}
+
+
+def sintetizar(freq, dur, tipo="quadrada", taxa=44100, volume=0.5, semente=0):
+    """Onda mono em float32 (-1..1), calculada de uma vez com NumPy."""
+    if tipo not in TIPOS:
+        raise ValueError(f"tipo de onda desconhecido: {tipo}")
+    n = int(taxa * dur)
+    if tipo == "ruido":
+        # ruído de 8 bits: um valor aleatório novo a cada período de freq
+        passo = max(1, int(taxa / freq))
+        niveis = np.random.default_rng(semente).uniform(-1, 1, n // passo + 1)
+        onda = np.repeat(niveis, passo)[:n]
+    else:
+        fase = (2 * np.pi * freq / taxa) * np.arange(n)
+        onda = np.sin(fase)
+        if tipo == "quadrada":
+            onda = np.sign(onda)
+    return (volume * onda).astype(np.float32)
+
+
+def para_mixer(onda, tamanho=-16, canais=1):
+    """Converte a onda float para o formato do mixer (intercalando os canais)."""
+    dtype = _DTYPES[tamanho]
+    if dtype is np.float32:
+        amostras = onda
+    else:
+        bits = abs(tamanho)
+        pico = 2 ** (bits - 1) - 1
+        amostras = onda * pico
+        if tamanho > 0:
+            amostras = amostras + pico + 1
+        amostras = amostras.astype(dtype)
+    if canais > 1:
+        amostras = np.repeat(amostras[:, None], canais, axis=1)
+    return np.ascontiguousarray(amostras)
+
+
+def gravar_wav(caminho, amostras, taxa=44100):
+    """Grava amostras int16 mono num WAV com uma única escrita."""
+    with wave.open(caminho, "wb") as f:
+        f.setparams((1, 2, taxa, 0, "NONE", "not compressed"))
+        f.writeframes(amostras.astype("<i2").tobytes())
+
+
+class Som:
+    """Efeito sonoro gerado na primeira vez que toca.
+
+    Sem mixer (init falhou ou não foi feito) play() simplesmente não toca.
+    No máximo max_vozes cópias tocam ao mesmo tempo; os pedidos além disso
+    são descartados (e contados em descartados) em vez de ocupar canais.
+    Com cache_dir, o WAV fica em <cache_dir>/<nome>-<hash>.wav; mudar
+    qualquer parâmetro muda o hash, então o arquivo antigo nunca é reusado.
+    """
+
+    def __init__(self, nome, freq, dur, tipo="quadrada", volume=0.5, cache_dir=None, max_vozes=2):
+        self.nome = nome
+        self.params = (tipo, float(freq), float(dur), float(volume))
+        self.cache_dir = cache_dir
+        self.max_vozes = max_vozes
+        self.descartados = 0
+        self._som = None
+
+    def chave(self, taxa):
+        texto = repr((VERSAO, taxa) + self.params).encode()
+        return hashlib.sha1(texto).hexdigest()[:12]
+
+    def carregar(self):
+        # devolve o pygame.mixer.Sound (ou None sem mixer), gerando se preciso
+        if self._som is not None:
+            return self._som
+        formato = pygame.mixer.get_init()
+        if formato is None:
+            return None
+        taxa, tamanho, canais = formato
+        tipo, freq, dur, volume = self.params
+        if self.cache_dir is None:
+            onda = sintetizar(freq, dur, tipo, taxa, volume)
+            self._som = pygame.mixer.Sound(buffer=para_mixer(onda, tamanho, canais).tobytes())
+            return self._som
+        caminho = os.path.join(self.cache_dir, f"{self.nome}-{self.chave(taxa)}.wav")
+        if not os.path.exists(caminho):
+            os.makedirs(self.cache_dir, exist_ok=True)
+            gravar_wav(caminho, para_mixer(sintetizar(freq, dur, tipo, taxa, volume)), taxa)
+        self._som = pygame.mixer.Sound(caminho)
+        return self._som
+
+    def play(self):
+        som = self.carregar()
+        if som is None:
+            return
+        if som.get_num_channels() >= self.max_vozes:
+            self.descartados += 1
+            return
+        try:
+            som.play()
+        except pygame.error:
+            # mixer fechado no meio do jogo: segue sem som
+            self._som = None
@@ -0,0 +1,11 @@
+# TextCache e GlyphAtlas são compartilhados com o asteroids_game e ficam em
+# gamekit/, na raiz do repositório; este módulo põe a raiz no path e os
+# reexporta.
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+
+from gamekit.text import GlyphAtlas, TextCache  # noqa: E402,F401